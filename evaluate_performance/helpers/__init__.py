@@ -2,6 +2,10 @@
 Evaluate Performance Helpers Package
 =====================================
 Bu paket, performans değerlendirme işlemleri için yardımcı modülleri içerir.
+
+batch_scorer bir komut satırı modülü olduğundan (python -m helpers.batch_scorer)
+paket seviyesinde içe aktarılmaz; `from helpers.batch_scorer import score_file`
+ile kullanılır.
 """
 
 from .data_loader import (
@@ -9,24 +13,81 @@ from .data_loader import (
     load_dataset,
     split_train_test,
     get_all_datasets,
-    split_features_target
+    split_features_target,
+    load_selection_manifest,
+    resolve_selection_manifest,
+    get_file_columns,
+    normalize_column_names,
+    resolve_feature_columns
 )
 
 from .model_trainer import (
     create_logistic_regression_model,
+    create_cv_context,
     cross_validate_model,
     detect_overfitting,
     apply_regularization,
     train_final_model,
-    find_best_regularization
+    find_best_regularization,
+    compute_regularization_path,
+    compute_cv_grid,
+    fit_logistic_newton
+)
+
+from .parallel_executor import run_cv_tasks
+
+from .sufficient_stats import (
+    compute_sufficient_stats,
+    merge_sufficient_stats,
+    subtract_sufficient_stats,
+    compute_sufficient_stats_chunked,
+    get_scale_from_stats,
+    create_scaler_from_stats,
+    get_standardized_gram
+)
+
+from .cv_cache import (
+    configure_cv_cache,
+    clear_cv_cache,
+    get_cv_cache_info
+)
+
+from .rfe_path import (
+    get_rfe_ranking,
+    compute_rfe_path
 )
 
 from .evaluation_metrics import (
+    compute_confusion_counts,
+    calculate_metrics_from_counts,
     calculate_accuracy,
     calculate_f1_score,
     calculate_metrics,
+    compute_threshold_curves,
+    calculate_threshold_metrics,
+    calculate_roc_auc,
+    calculate_pr_auc,
+    calculate_bootstrap_metrics,
+    compare_bootstrap_metrics,
+    add_bootstrap_intervals,
+    create_metrics_accumulator,
+    update_metrics_accumulator,
+    merge_metrics_accumulators,
+    get_accumulated_metrics,
+    get_accumulated_confusion_matrix,
+    calculate_accumulated_auc,
     create_confusion_matrix,
-    get_classification_report
+    get_classification_report,
+    calculate_permutation_importance
+)
+
+from .inference_artifact import (
+    fold_scaler_into_weights,
+    export_inference_artifact,
+    load_inference_artifact,
+    compute_artifact_logits,
+    predict_proba_with_artifact,
+    predict_with_artifact
 )
 
 from .report_generator import (
@@ -45,21 +106,75 @@ __all__ = [
     'split_train_test',
     'get_all_datasets',
     'split_features_target',
+    'load_selection_manifest',
+    'resolve_selection_manifest',
+    'get_file_columns',
+    'normalize_column_names',
+    'resolve_feature_columns',
     
     # model_trainer
     'create_logistic_regression_model',
+    'create_cv_context',
     'cross_validate_model',
     'detect_overfitting',
     'apply_regularization',
     'train_final_model',
     'find_best_regularization',
+    'compute_regularization_path',
+    'compute_cv_grid',
+    'fit_logistic_newton',
+    
+    # parallel_executor
+    'run_cv_tasks',
+    
+    # sufficient_stats
+    'compute_sufficient_stats',
+    'merge_sufficient_stats',
+    'subtract_sufficient_stats',
+    'compute_sufficient_stats_chunked',
+    'get_scale_from_stats',
+    'create_scaler_from_stats',
+    'get_standardized_gram',
+    
+    # cv_cache
+    'configure_cv_cache',
+    'clear_cv_cache',
+    'get_cv_cache_info',
+    
+    # rfe_path
+    'get_rfe_ranking',
+    'compute_rfe_path',
     
     # evaluation_metrics
+    'compute_confusion_counts',
+    'calculate_metrics_from_counts',
     'calculate_accuracy',
     'calculate_f1_score',
     'calculate_metrics',
+    'compute_threshold_curves',
+    'calculate_threshold_metrics',
+    'calculate_roc_auc',
+    'calculate_pr_auc',
+    'calculate_bootstrap_metrics',
+    'compare_bootstrap_metrics',
+    'add_bootstrap_intervals',
+    'create_metrics_accumulator',
+    'update_metrics_accumulator',
+    'merge_metrics_accumulators',
+    'get_accumulated_metrics',
+    'get_accumulated_confusion_matrix',
+    'calculate_accumulated_auc',
     'create_confusion_matrix',
     'get_classification_report',
+    'calculate_permutation_importance',
+    
+    # inference_artifact
+    'fold_scaler_into_weights',
+    'export_inference_artifact',
+    'load_inference_artifact',
+    'compute_artifact_logits',
+    'predict_proba_with_artifact',
+    'predict_with_artifact',
     
     # report_generator
     'generate_results_table',
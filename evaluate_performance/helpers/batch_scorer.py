@@ -0,0 +1,307 @@
+"""
+Batch Scorer Module
+===================
+Bu modül, çıkarım dosyası (bkz. inference_artifact) olarak kaydedilmiş bir
+modeli büyük CSV / Parquet dosyalarına parça parça uygulayan toplu skorlama
+fonksiyonlarını ve komut satırı arayüzünü içerir.
+
+Girdi sabit boyutlu satır parçaları halinde okunur ve sadece modelin
+özellik sütunları (isimle, data_loader sütun eşlemesiyle) ayrıştırılır;
+ham 61 sütunlu veri kümesi (boşluklu isimler, url / timedelta / shares)
+doğrudan skorlanabilir. Parçalar bir thread havuzunda skorlanır (NumPy
+işlemleri GIL'i bırakır) ve sonuçlar girdi sırasıyla artımlı olarak
+yazılır; bellekte aynı anda en fazla 2 x n_jobs parça bulunur.
+
+Kullanım (evaluate_performance klasöründen):
+    python -m helpers.batch_scorer --model results/best_model.lrmodel \\
+        --input ../dataset_files/dataset.csv --output results/scores.csv
+"""
+
+import os
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from scipy.special import expit
+
+from .data_loader import get_file_columns, normalize_column_names, resolve_feature_columns
+from .inference_artifact import load_inference_artifact, compute_artifact_logits
+from .evaluation_metrics import (
+    create_metrics_accumulator,
+    update_metrics_accumulator,
+    merge_metrics_accumulators,
+    get_accumulated_metrics,
+    calculate_accumulated_auc
+)
+
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+DEFAULT_CHUNKSIZE = 100_000
+SCORE_HISTOGRAM_BINS = 1000
+
+
+def get_file_format(filepath: str) -> str:
+    """
+    Dosya biçimini uzantısından belirle.
+    
+    Args:
+        filepath: Dosya yolu
+    
+    Returns:
+        str: 'parquet' (.parquet / .pq) veya 'csv'
+    """
+    return 'parquet' if filepath.lower().endswith(PARQUET_EXTENSIONS) else 'csv'
+
+
+def _import_parquet():
+    """
+    Parquet okuma / yazma için pyarrow modüllerini yükle.
+    
+    Returns:
+        Tuple: (pyarrow, pyarrow.parquet)
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet dosyaları için pyarrow gerekli: pip install pyarrow") from e
+    
+    return pyarrow, pyarrow.parquet
+
+
+def get_input_columns(filepath: str) -> List[str]:
+    """
+    Girdi dosyasının sütun isimlerini veriyi okumadan döndür.
+    
+    Args:
+        filepath: CSV veya Parquet dosyasının yolu
+    
+    Returns:
+        List[str]: Sütun isimleri (dosyadaki haliyle)
+    """
+    if get_file_format(filepath) == 'parquet':
+        _, parquet = _import_parquet()
+        return list(parquet.ParquetFile(filepath).schema_arrow.names)
+    
+    return get_file_columns(filepath)
+
+
+def iter_input_chunks(
+    filepath: str,
+    columns: List[str],
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    float_columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Girdi dosyasının seçilen sütunlarını sabit boyutlu parçalar halinde oku.
+    
+    Args:
+        filepath: CSV veya Parquet dosyasının yolu
+        columns: Okunacak sütunlar (dosyadaki isimleriyle)
+        chunksize: Parça başına satır sayısı
+        float_columns: CSV'de doğrudan float32 olarak ayrıştırılacak sütunlar
+    
+    Yields:
+        pd.DataFrame: Sütun isimleri temizlenmiş parça
+    """
+    if get_file_format(filepath) == 'parquet':
+        _, parquet = _import_parquet()
+        batches = parquet.ParquetFile(filepath).iter_batches(batch_size=chunksize, columns=columns)
+        chunks = (batch.to_pandas() for batch in batches)
+    else:
+        dtypes = {c: np.float32 for c in float_columns or []}
+        chunks = pd.read_csv(filepath, usecols=columns, dtype=dtypes, chunksize=chunksize)
+    
+    for chunk in chunks:
+        chunk.columns = normalize_column_names(chunk.columns)
+        yield chunk
+
+
+def _score_chunk(
+    artifact: Dict,
+    chunk: pd.DataFrame,
+    id_column: Optional[str] = None,
+    target_column: Optional[str] = None
+) -> Tuple[pd.DataFrame, Optional[Dict]]:
+    """
+    Bir parçayı skorla (thread havuzunda çalışır).
+    
+    Returns:
+        Tuple: (Skorlar DataFrame'i, Hedef sütun verildiyse metrik biriktiricisi)
+    """
+    logits = compute_artifact_logits(artifact, chunk)
+    probabilities = expit(logits)
+    predictions = artifact['classes'][(logits > artifact['logit_threshold']).astype(np.intp)]
+    
+    scores = pd.DataFrame({'probability': probabilities, 'prediction': predictions})
+    if id_column is not None:
+        scores.insert(0, id_column, chunk[id_column].to_numpy())
+    
+    accumulator = None
+    if target_column is not None:
+        accumulator = create_metrics_accumulator(tuple(artifact['classes'].tolist()), n_bins=SCORE_HISTOGRAM_BINS)
+        update_metrics_accumulator(accumulator, chunk[target_column].to_numpy(), predictions, probabilities)
+    
+    return scores, accumulator
+
+
+def _iter_scored_chunks(
+    artifact: Dict,
+    chunks: Iterator[pd.DataFrame],
+    n_jobs: int,
+    id_column: Optional[str] = None,
+    target_column: Optional[str] = None
+) -> Iterator[Tuple[pd.DataFrame, Optional[Dict]]]:
+    """
+    Parçaları thread havuzunda skorla ve sonuçları girdi sırasıyla döndür.
+    
+    Okuma ana thread'de devam ederken en fazla 2 x n_jobs parça skorlanmayı
+    bekler; sıradaki en eski parça bitmeden yeni parça okunmaz.
+    """
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        pending = deque()
+        
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, artifact, chunk, id_column, target_column))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+
+
+def score_file(
+    model_path: str,
+    input_path: str,
+    output_path: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    n_jobs: Optional[int] = None,
+    id_column: Optional[str] = None,
+    target_column: Optional[str] = None
+) -> Dict:
+    """
+    Bir CSV / Parquet dosyasını çıkarım dosyasındaki modelle parça parça skorla.
+    
+    Çıktı dosyası (CSV veya uzantısı .parquet ise Parquet) her parça
+    skorlandıkça yazılır ve girdi ile aynı satır sırasındadır: isteğe bağlı
+    kimlik sütunu, 'probability' (pozitif sınıf olasılığı) ve 'prediction'.
+    Hedef sütun verilirse metrikler akış biriktiricisiyle hesaplanır;
+    y_true / y_pred bellekte tutulmaz.
+    
+    Args:
+        model_path: export_inference_artifact ile kaydedilmiş çıkarım dosyası
+        input_path: Skorlanacak CSV veya Parquet dosyası
+        output_path: Skorların yazılacağı dosya
+        chunksize: Parça başına satır sayısı
+        n_jobs: Skorlama thread sayısı (None ise CPU sayısı)
+        id_column: Çıktıya aynen kopyalanacak kimlik sütunu (örn. 'url')
+        target_column: Girdide hedef sütun varsa adı (örn. 'is_popular')
+    
+    Returns:
+        Dict: Skorlama özeti
+            - 'output_path': Çıktı dosyası
+            - 'n_rows', 'n_chunks': Skorlanan satır ve parça sayısı
+            - 'elapsed': Toplam süre (saniye, okuma ve yazma dahil)
+            - 'rows_per_second': Saniyedeki satır sayısı
+            - 'metrics', 'auc': target_column verildiyse calculate_metrics
+              formatında metrikler ve yaklaşık ROC-AUC / PR-AUC
+    """
+    start_time = time.perf_counter()
+    n_jobs = n_jobs or os.cpu_count() or 1
+    
+    artifact = load_inference_artifact(model_path)
+    feature_names = artifact['feature_names']
+    
+    # Model sütunları isimle eşlenir; ham dosyadaki fazla sütunlar okunmaz
+    extra_columns = [c for c in (id_column, target_column) if c is not None]
+    file_columns = resolve_feature_columns(get_input_columns(input_path), feature_names + extra_columns)
+    chunks = iter_input_chunks(input_path, file_columns, chunksize, float_columns=file_columns[:len(feature_names)])
+    
+    output_format = get_file_format(output_path)
+    if output_format == 'parquet':
+        arrow, parquet = _import_parquet()
+    
+    n_rows = 0
+    n_chunks = 0
+    accumulator = None
+    csv_file = None
+    parquet_writer = None
+    
+    try:
+        if output_format == 'csv':
+            csv_file = open(output_path, 'w', encoding='utf-8', newline='')
+        
+        for scores, chunk_accumulator in _iter_scored_chunks(artifact, chunks, n_jobs, id_column, target_column):
+            if output_format == 'csv':
+                scores.to_csv(csv_file, header=(n_chunks == 0), index=False)
+            else:
+                table = arrow.Table.from_pandas(scores, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = parquet.ParquetWriter(output_path, table.schema)
+                parquet_writer.write_table(table)
+            
+            if chunk_accumulator is not None:
+                accumulator = chunk_accumulator if accumulator is None else merge_metrics_accumulators(accumulator, chunk_accumulator)
+            
+            n_rows += len(scores)
+            n_chunks += 1
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+        if parquet_writer is not None:
+            parquet_writer.close()
+    
+    elapsed = time.perf_counter() - start_time
+    rows_per_second = n_rows / elapsed if elapsed > 0 else float('inf')
+    
+    print(f"✓ {n_rows} satır skorlandı ({n_chunks} parça, {n_jobs} thread): "
+          f"{elapsed:.2f} s, {rows_per_second:,.0f} satır/s")
+    print(f"✓ Skorlar kaydedildi: {output_path}")
+    
+    summary = {
+        'output_path': output_path,
+        'n_rows': n_rows,
+        'n_chunks': n_chunks,
+        'elapsed': elapsed,
+        'rows_per_second': rows_per_second
+    }
+    
+    if accumulator is not None:
+        summary['metrics'] = get_accumulated_metrics(accumulator)
+        summary['auc'] = calculate_accumulated_auc(accumulator)
+        print(f"  Accuracy: {summary['metrics']['accuracy']:.4f} | F1: {summary['metrics']['f1_score']:.4f} | "
+              f"ROC-AUC (yaklaşık): {summary['auc']['roc_auc']:.4f}")
+    
+    return summary
+
+
+def main() -> None:
+    """
+    Komut satırından toplu skorlamayı çalıştır.
+    """
+    parser = argparse.ArgumentParser(description="Çıkarım dosyası ile CSV / Parquet toplu skorlama")
+    parser.add_argument('--model', required=True, help="export_inference_artifact ile kaydedilmiş çıkarım dosyası")
+    parser.add_argument('--input', required=True, help="Skorlanacak CSV / Parquet dosyası (ham 61 sütunlu şema desteklenir)")
+    parser.add_argument('--output', required=True, help="Çıktı dosyası (.csv veya .parquet)")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Parça başına satır sayısı")
+    parser.add_argument('--n-jobs', type=int, default=None, help="Skorlama thread sayısı (default: CPU sayısı)")
+    parser.add_argument('--id-column', default=None, help="Çıktıya kopyalanacak kimlik sütunu (örn. url)")
+    parser.add_argument('--target-column', default=None, help="Girdide varsa hedef sütun (metrikler için, örn. is_popular)")
+    args = parser.parse_args()
+    
+    score_file(
+        model_path=args.model,
+        input_path=args.input,
+        output_path=args.output,
+        chunksize=args.chunksize,
+        n_jobs=args.n_jobs,
+        id_column=args.id_column,
+        target_column=args.target_column
+    )
+
+
+if __name__ == "__main__":
+    main()
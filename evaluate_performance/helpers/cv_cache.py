@@ -0,0 +1,283 @@
+"""
+CV Cache Module
+===============
+Bu modül, cross-validation sonuçlarının önbellek (memoization) işlemlerini içerir.
+
+Sonuçlar veri parmak izi (ölçeklenmiş X ve y'nin özeti), C, solver,
+max_iter, fold sayısı ve seed değerinden oluşan bir anahtarla saklanır.
+Bellek içi katman en son kullanılan sonuçları (LRU) tutar; isteğe bağlı disk
+katmanı ise notebook yeniden başlatıldığında ızgara sonuçlarının kaybolmasını
+önler.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+CV_CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 1024
+
+_CACHE_LOCK = threading.Lock()
+_MEMORY_CACHE = OrderedDict()
+_CACHE_CONFIG = {
+    'enabled': True,
+    'max_entries': DEFAULT_MAX_ENTRIES,
+    'disk_dir': None
+}
+_CACHE_STATS = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+
+def configure_cv_cache(
+    enabled: Optional[bool] = None,
+    max_entries: Optional[int] = None,
+    disk_dir: Optional[str] = None
+) -> Dict:
+    """
+    CV önbelleğinin ayarlarını değiştir.
+    
+    Args:
+        enabled: False ise önbellek tamamen devre dışı bırakılır
+        max_entries: Bellek içi LRU katmanındaki en fazla sonuç sayısı
+        disk_dir: Disk katmanı klasörü ('' ise disk katmanı kapatılır)
+    
+    Returns:
+        Dict: Güncel ayarlar
+    """
+    with _CACHE_LOCK:
+        if enabled is not None:
+            _CACHE_CONFIG['enabled'] = enabled
+        
+        if max_entries is not None:
+            _CACHE_CONFIG['max_entries'] = max_entries
+            while len(_MEMORY_CACHE) > max_entries:
+                _MEMORY_CACHE.popitem(last=False)
+        
+        if disk_dir is not None:
+            if disk_dir:
+                os.makedirs(disk_dir, exist_ok=True)
+            _CACHE_CONFIG['disk_dir'] = disk_dir or None
+        
+        return dict(_CACHE_CONFIG)
+
+
+def clear_cv_cache(disk: bool = False) -> None:
+    """
+    Bellek içi önbelleği (ve istenirse disk katmanını) temizle.
+    
+    Args:
+        disk: True ise disk katmanındaki dosyalar da silinir
+    """
+    with _CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+        for name in _CACHE_STATS:
+            _CACHE_STATS[name] = 0
+        
+        disk_dir = _CACHE_CONFIG['disk_dir']
+    
+    if disk and disk_dir and os.path.isdir(disk_dir):
+        for filename in os.listdir(disk_dir):
+            if filename.endswith('.json'):
+                os.remove(os.path.join(disk_dir, filename))
+
+
+def get_cv_cache_info() -> Dict:
+    """
+    Önbellek istatistiklerini döndür.
+    
+    Returns:
+        Dict: 'hits', 'disk_hits', 'misses', 'memory_entries' ve ayarlar
+    """
+    with _CACHE_LOCK:
+        info = dict(_CACHE_STATS)
+        info['memory_entries'] = len(_MEMORY_CACHE)
+        info.update(_CACHE_CONFIG)
+    
+    return info
+
+
+def get_data_fingerprint(X: np.ndarray, y: np.ndarray) -> str:
+    """
+    Ölçeklenmiş özellik matrisi ve hedef değişkenden veri parmak izi oluştur.
+    
+    Args:
+        X: Özellik matrisi
+        y: Hedef değişken
+    
+    Returns:
+        str: Hex formatında özet
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for array in (X, y):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    
+    return digest.hexdigest()
+
+
+def make_cv_cache_key(
+    cv_context: Dict,
+    C: float,
+    max_iter: int,
+    solver: str
+) -> Optional[Tuple]:
+    """
+    CV bağlamı ve model parametrelerinden önbellek anahtarını oluştur.
+    
+    Args:
+        cv_context: create_cv_context ile hazırlanmış bağlam
+        C: Regularization parametresi
+        max_iter: Maksimum iterasyon sayısı
+        solver: Optimizasyon algoritması
+    
+    Returns:
+        Optional[Tuple]: Önbellek anahtarı; önbellek kapalıysa veya bağlamın
+            parmak izi yoksa None
+    """
+    if not _CACHE_CONFIG['enabled'] or 'fingerprint' not in cv_context:
+        return None
+    
+    return (
+        cv_context['fingerprint'],
+        float(C),
+        str(solver),
+        int(max_iter),
+        int(cv_context['cv']),
+        cv_context['random_state']
+    )
+
+
+def _get_disk_path(key: Tuple, disk_dir: str) -> str:
+    """
+    Önbellek anahtarına karşılık gelen disk dosyasının yolunu döndür.
+    """
+    name = hashlib.sha1(json.dumps(key).encode()).hexdigest()
+    return os.path.join(disk_dir, name + '.json')
+
+
+def _read_disk_entry(key: Tuple, disk_dir: str) -> Optional[Tuple[List[float], List[float]]]:
+    """
+    Disk katmanından fold skorlarını oku.
+    """
+    path = _get_disk_path(key, disk_dir)
+    
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get('version') != CV_CACHE_VERSION or entry.get('key') != list(key):
+        return None
+    
+    return entry['train_scores'], entry['val_scores']
+
+
+def _write_disk_entry(key: Tuple, disk_dir: str, train_scores: List[float], val_scores: List[float]) -> None:
+    """
+    Fold skorlarını disk katmanına atomik olarak yaz.
+    """
+    entry = {
+        'version': CV_CACHE_VERSION,
+        'key': list(key),
+        'train_scores': train_scores,
+        'val_scores': val_scores
+    }
+    
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=disk_dir, suffix=".tmp")
+    except OSError as e:
+        print(f"  ⚠️ CV önbelleği yazılamadı ({disk_dir}): {e}")
+        return
+    
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _get_disk_path(key, disk_dir))
+    except OSError as e:
+        print(f"  ⚠️ CV önbelleği yazılamadı ({disk_dir}): {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_cached_cv_scores(key: Optional[Tuple]) -> Optional[Tuple[List[float], List[float]]]:
+    """
+    Önbellekteki fold skorlarını döndür.
+    
+    Önce bellek içi katmana, sonra (ayarlıysa) disk katmanına bakılır.
+    Diskten okunan sonuç bellek katmanına da eklenir.
+    
+    Args:
+        key: make_cv_cache_key ile oluşturulan anahtar
+    
+    Returns:
+        Optional[Tuple]: (Eğitim skorları, Validasyon skorları), yoksa None
+    """
+    if key is None:
+        return None
+    
+    with _CACHE_LOCK:
+        if key in _MEMORY_CACHE:
+            _MEMORY_CACHE.move_to_end(key)
+            _CACHE_STATS['hits'] += 1
+            train_scores, val_scores = _MEMORY_CACHE[key]
+            return list(train_scores), list(val_scores)
+        
+        disk_dir = _CACHE_CONFIG['disk_dir']
+    
+    scores = _read_disk_entry(key, disk_dir) if disk_dir else None
+    
+    if scores is None:
+        with _CACHE_LOCK:
+            _CACHE_STATS['misses'] += 1
+        return None
+    
+    with _CACHE_LOCK:
+        _CACHE_STATS['disk_hits'] += 1
+    _store_memory_entry(key, scores[0], scores[1])
+    
+    return scores
+
+
+def _store_memory_entry(key: Tuple, train_scores: List[float], val_scores: List[float]) -> None:
+    """
+    Fold skorlarını bellek içi LRU katmanına ekle.
+    """
+    with _CACHE_LOCK:
+        _MEMORY_CACHE[key] = (tuple(train_scores), tuple(val_scores))
+        _MEMORY_CACHE.move_to_end(key)
+        
+        while len(_MEMORY_CACHE) > _CACHE_CONFIG['max_entries']:
+            _MEMORY_CACHE.popitem(last=False)
+
+
+def store_cv_scores(key: Optional[Tuple], train_scores: List[float], val_scores: List[float]) -> None:
+    """
+    Fold skorlarını önbelleğe (bellek ve ayarlıysa disk) kaydet.
+    
+    Args:
+        key: make_cv_cache_key ile oluşturulan anahtar (None ise kaydedilmez)
+        train_scores: Fold başına eğitim skorları
+        val_scores: Fold başına validasyon skorları
+    """
+    if key is None:
+        return
+    
+    train_scores = [float(s) for s in train_scores]
+    val_scores = [float(s) for s in val_scores]
+    
+    _store_memory_entry(key, train_scores, val_scores)
+    
+    disk_dir = _CACHE_CONFIG['disk_dir']
+    if disk_dir:
+        _write_disk_entry(key, disk_dir, train_scores, val_scores)
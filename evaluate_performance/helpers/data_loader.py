@@ -7,9 +7,15 @@ Bu modül, veri kümesi yükleme ve bölme işlemlerini içerir.
 import pandas as pd
 import numpy as np
 import os
-from typing import Tuple, Dict, List
+import json
+from typing import Tuple, Dict, List, Optional
 from sklearn.model_selection import train_test_split
 
+from .dataset_cache import read_csv_cached
+
+
+MANIFEST_VERSION = 1
+
 
 def get_dataset_dir() -> str:
     """
@@ -44,18 +50,139 @@ def get_dataset_path(filename: str) -> str:
     return filepath
 
 
-def load_dataset(filename: str) -> pd.DataFrame:
+def get_manifest_filename(filename: str) -> str:
+    """
+    Seçilmiş veri kümesi dosya adına karşılık gelen manifesto dosya adını döndür.
+    
+    Args:
+        filename: Veri kümesi dosya adı (örn: filter_method_selected_dataset.csv)
+    
+    Returns:
+        str: Manifesto dosya adı (örn: filter_method_selected_dataset.json)
+    """
+    return os.path.splitext(filename)[0] + ".json"
+
+
+def find_selection_manifest(filename: str) -> Optional[str]:
+    """
+    Veri kümesi için bir seçim manifestosu varsa dosya adını döndür.
+    
+    Args:
+        filename: Veri kümesi veya manifesto dosya adı
+    
+    Returns:
+        Optional[str]: Manifesto dosya adı, yoksa None
+    """
+    manifest_filename = get_manifest_filename(filename)
+    
+    if os.path.exists(os.path.join(get_dataset_dir(), manifest_filename)):
+        return manifest_filename
+    
+    return None
+
+
+def get_dataset_fingerprint(filename: str) -> Dict:
+    """
+    Veri kümesi dosyasının parmak izini (dosya adı, boyut, değiştirilme zamanı) oluştur.
+    
+    Args:
+        filename: dataset_files klasöründeki dosya adı
+    
+    Returns:
+        Dict: 'filename', 'size', 'mtime_ns' anahtarlarını içeren dict
+    """
+    stat = os.stat(get_dataset_path(filename))
+    
+    return {
+        'filename': filename,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+
+def load_selection_manifest(filename: str) -> Dict:
+    """
+    Seçim manifestosunu oku ve kaynak veri kümesinin parmak izini kontrol et.
+    
+    Args:
+        filename: Manifesto dosya adı
+    
+    Returns:
+        Dict: Manifesto içeriği
+            - 'source': Kaynak veri kümesi parmak izi
+            - 'target_column': Hedef değişken sütunu adı
+            - 'features': Seçilen özellik isimleri (sıralı)
+    
+    Raises:
+        ValueError: Manifesto sürümü desteklenmiyorsa
+    """
+    filepath = get_dataset_path(filename)
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Desteklenmeyen manifesto sürümü: {manifest.get('version')} ({filename})")
+    
+    source = manifest['source']
+    if get_dataset_fingerprint(source['filename']) != source:
+        print(f"  ⚠️ {source['filename']} manifesto oluşturulduktan sonra değişmiş: {filename}")
+    
+    return manifest
+
+
+def resolve_selection_manifest(filename: str, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Seçim manifestosunu kaynak veri kümesi üzerinden çözümleyerek veri kümesini oluştur.
+    
+    Args:
+        filename: Manifesto dosya adı
+        use_cache: İkili önbellek kullanılsın mı (default: True)
+    
+    Returns:
+        pd.DataFrame: Seçilen özellikler + hedef sütun
+    """
+    manifest = load_selection_manifest(filename)
+    source_df = read_csv_cached(
+        get_dataset_path(manifest['source']['filename']),
+        use_cache=use_cache
+    )
+    
+    columns = manifest['features'] + [manifest['target_column']]
+    missing = [c for c in columns if c not in source_df.columns]
+    if missing:
+        raise ValueError(f"Manifestodaki sütunlar kaynak veri kümesinde bulunamadı: {missing}")
+    
+    return project_columns(source_df, source_df.columns.get_indexer(columns))
+
+
+def load_dataset(filename: str, use_cache: bool = True) -> pd.DataFrame:
     """
     Veri kümesini yükle.
     
+    Tekrarlanan yüklemelerde CSV yerine yanındaki ikili önbellek okunur
+    (bkz. dataset_cache). Dosya için bir seçim manifestosu varsa veri
+    kümesi kaynak veri üzerinden çözümlenir.
+    
     Args:
         filename: Yüklenecek dosyanın adı
+        use_cache: İkili önbellek kullanılsın mı (default: True)
     
     Returns:
         pd.DataFrame: Yüklenen veri kümesi
     """
+    manifest_filename = find_selection_manifest(filename)
+    
+    if manifest_filename is not None:
+        df = resolve_selection_manifest(manifest_filename, use_cache=use_cache)
+        
+        print(f"✓ Seçim manifestosu çözümlendi: {manifest_filename}")
+        print(f"  Boyut: {df.shape}")
+        
+        return df
+    
     filepath = get_dataset_path(filename)
-    df = pd.read_csv(filepath)
+    df = read_csv_cached(filepath, use_cache=use_cache)
     
     print(f"✓ Veri kümesi yüklendi: {filename}")
     print(f"  Boyut: {df.shape}")
@@ -86,6 +213,98 @@ def split_features_target(
     return X, y
 
 
+def get_dataset_columns(filename: str) -> List[str]:
+    """
+    Veri kümesinin sadece başlık satırını okuyarak sütun isimlerini döndür.
+    
+    Args:
+        filename: Dosya adı
+    
+    Returns:
+        List[str]: Sütun isimleri
+    """
+    return get_file_columns(get_dataset_path(filename))
+
+
+def get_file_columns(filepath: str) -> List[str]:
+    """
+    Herhangi bir CSV dosyasının sadece başlık satırını okuyarak sütun isimlerini döndür.
+    
+    Args:
+        filepath: CSV dosyasının yolu
+    
+    Returns:
+        List[str]: Sütun isimleri (dosyadaki haliyle)
+    """
+    return list(pd.read_csv(filepath, nrows=0).columns)
+
+
+def normalize_column_names(columns: List[str]) -> List[str]:
+    """
+    Sütun isimlerindeki baştaki ve sondaki boşlukları temizle.
+    
+    Ham veri kümesinde (dataset.csv, 61 sütun) isimler ' n_tokens_title'
+    biçimindedir; ön işleme adımı da aynı temizliği uygular.
+    
+    Args:
+        columns: Sütun isimleri
+    
+    Returns:
+        List[str]: Temizlenmiş sütun isimleri
+    """
+    return [str(c).strip() for c in columns]
+
+
+def resolve_feature_columns(available_columns: List[str], feature_names: List[str]) -> List[str]:
+    """
+    Özellik isimlerini bir dosyadaki (temizlenmemiş) sütun isimlerine eşle.
+    
+    Böylece işlenmiş veri kümesi (59 sütun) ve ham veri kümesi (61 sütun,
+    boşluklu isimler, url / timedelta / shares dahil) aynı şekilde okunur;
+    fazla sütunlar yok sayılır.
+    
+    Args:
+        available_columns: Dosyadaki sütun isimleri
+        feature_names: İstenen özellik isimleri (sıralı)
+    
+    Returns:
+        List[str]: feature_names sırasıyla dosyadaki sütun isimleri
+    
+    Raises:
+        ValueError: Bir özellik dosyada bulunamazsa
+    """
+    lookup = dict(zip(normalize_column_names(available_columns), available_columns))
+    missing = [name for name in feature_names if name not in lookup]
+    
+    if missing:
+        raise ValueError(f"Özellikler dosyada bulunamadı: {missing}")
+    
+    return [lookup[name] for name in feature_names]
+
+
+def project_columns(df: pd.DataFrame, column_indices: np.ndarray) -> pd.DataFrame:
+    """
+    DataFrame'in seçilen sütunlarından kopya oluşturmadan yeni bir DataFrame oluştur.
+    
+    Her sütun, temel DataFrame'deki sütun dizisinin bir görünümüdür (view);
+    bu nedenle bellek kullanımı artmaz.
+    
+    Args:
+        df: Temel DataFrame
+        column_indices: Seçilecek sütunların indeksleri (sıralı)
+    
+    Returns:
+        pd.DataFrame: Seçilen sütunlardan oluşan görünüm
+    """
+    columns = df.columns[np.asarray(column_indices, dtype=np.intp)]
+    
+    return pd.DataFrame(
+        {name: df[name].to_numpy() for name in columns},
+        index=df.index,
+        copy=False
+    )
+
+
 def split_train_test(
     X: pd.DataFrame, 
     y: pd.Series, 
@@ -117,10 +336,19 @@ def split_train_test(
     return X_train, X_test, y_train, y_test
 
 
-def get_all_datasets() -> Dict[str, Dict]:
+def get_all_datasets(target_column: str = "is_popular") -> Dict[str, Dict]:
     """
     Tüm veri kümelerini yükle ve dict olarak döndür.
     
+    Sadece temel veri kümesi (processed_dataset.csv) tam olarak yüklenir.
+    Seçilmiş veri kümelerinin sütunları seçim manifestosundan (yoksa CSV'nin
+    başlık satırından) okunur ve bu veri kümeleri temel verinin sütun
+    görünümleri (view) olarak oluşturulur. Sütunlar temel veri kümesinde
+    bulunmazsa dosya tam olarak yüklenir.
+    
+    Args:
+        target_column: Hedef değişken sütunu adı
+    
     Returns:
         Dict: Her veri kümesi için ayrı dict
             - 'name': Yöntem adı
@@ -129,6 +357,9 @@ def get_all_datasets() -> Dict[str, Dict]:
             - 'X': Özellikler
             - 'y': Hedef
             - 'feature_count': Özellik sayısı
+            - 'feature_names': Özellik isimleri
+            - 'feature_indices': Temel veri kümesindeki özellik indeksleri
+              (görünüm oluşturulamadıysa None)
     """
     datasets_config = {
         'all_features': {
@@ -155,11 +386,54 @@ def get_all_datasets() -> Dict[str, Dict]:
     print("VERİ KÜMELERİ YÜKLENİYOR")
     print("=" * 60)
     
+    # Temel veri kümesi sadece bir kez yüklenir
+    base_filename = datasets_config['all_features']['filename']
+    base_df = load_dataset(base_filename)
+    base_columns = list(base_df.columns)
+    
+    if target_column not in base_columns:
+        raise ValueError(f"Hedef sütun '{target_column}' veri kümesinde bulunamadı.")
+    
+    base_X = project_columns(
+        base_df,
+        [i for i, c in enumerate(base_columns) if c != target_column]
+    )
+    base_y = base_df[target_column]
+    
     for key, config in datasets_config.items():
         print(f"\n📂 {config['name']}")
         
-        df = load_dataset(config['filename'])
-        X, y = split_features_target(df)
+        if key == 'all_features':
+            df, X, y = base_df, base_X, base_y
+            feature_indices = np.arange(base_X.shape[1])
+        else:
+            manifest_filename = find_selection_manifest(config['filename'])
+            
+            if manifest_filename is not None:
+                manifest = load_selection_manifest(manifest_filename)
+                columns = manifest['features'] + [manifest['target_column']]
+                same_source = manifest['source']['filename'] == base_filename
+            else:
+                columns = get_dataset_columns(config['filename'])
+                same_source = True
+            
+            feature_names = [c for c in columns if c != target_column]
+            
+            if same_source and target_column in columns and set(feature_names).issubset(base_X.columns):
+                # Temel verinin görünümü: kopya yok
+                feature_indices = base_X.columns.get_indexer(feature_names)
+                X = project_columns(base_X, feature_indices)
+                y = base_y
+                df = project_columns(
+                    base_df,
+                    [base_columns.index(c) for c in feature_names + [target_column]]
+                )
+                print(f"✓ Sütun seçimi uygulandı: {config['filename']}")
+                print(f"  Boyut: {df.shape}")
+            else:
+                df = load_dataset(config['filename'])
+                X, y = split_features_target(df, target_column)
+                feature_indices = None
         
         datasets[key] = {
             'name': config['name'],
@@ -168,7 +442,8 @@ def get_all_datasets() -> Dict[str, Dict]:
             'X': X,
             'y': y,
             'feature_count': X.shape[1],
-            'feature_names': list(X.columns)
+            'feature_names': list(X.columns),
+            'feature_indices': feature_indices
         }
         
         print(f"  Özellik sayısı: {X.shape[1]}")
@@ -6,15 +6,173 @@ Bu modül, performans metrikleri hesaplama fonksiyonlarını içerir.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
-from sklearn.metrics import (
-    accuracy_score,
-    f1_score,
-    precision_score,
-    recall_score,
-    confusion_matrix,
-    classification_report
-)
+from typing import Dict, List, Optional, Tuple, Union
+from sklearn.metrics import classification_report
+
+
+AVERAGES = ('binary', 'micro', 'macro', 'weighted')
+BOOTSTRAP_METRICS = ('accuracy', 'f1_score', 'precision', 'recall')
+
+# Bootstrap ağırlık / indis matrislerinin parça başına eleman sınırı (~32 MB int64)
+BOOTSTRAP_CHUNK_ELEMENTS = 2 ** 22
+# Desen sayısı n / 8'i aşarsa multinom çekilişi yerine satır indisleri örneklenir
+BOOTSTRAP_PATTERN_RATIO = 8
+
+
+def _encode_binary_labels(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    labels: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gerçek ve tahmin değerlerini 0/1 sınıf kodlarına çevir.
+    
+    Sınıflar sklearn confusion_matrix gibi sıralı etiketlerdir; ikinci
+    etiket pozitif sınıftır. Etiketler y_true'dan alınır (y_pred toplu
+    olabileceği için tamamı sıralanmaz); y_true tek sınıf içeriyorsa
+    y_pred'in sınıfları eklenir. Tek etiket kalırsa sklearn'deki
+    pos_label=1 varsayılanı uygulanır: etiket 1 ise pozitif, değilse
+    negatif sınıftır (örn. hepsi 0 olan veri TN hücresine düşer).
+    Etiketler dışındaki gerçek veya tahmin değerleri ValueError verir.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Gerçek kodlar, Tahmin kodları) intp
+    """
+    if labels is None:
+        labels = np.unique(y_true)
+        if len(labels) < 2:
+            labels = np.union1d(labels, np.unique(y_pred))
+    labels = np.asarray(labels)
+    
+    if len(labels) > 2:
+        raise ValueError(f"Sadece ikili sınıflandırma destekleniyor, etiketler: {labels.tolist()}")
+    if len(labels) == 2:
+        negative, positive = labels
+    elif labels[0] == 1:
+        negative, positive = None, labels[0]
+    else:
+        negative, positive = labels[0], None
+    
+    true_codes = (y_true == positive).astype(np.intp)
+    pred_codes = (y_pred == positive).astype(np.intp)
+    
+    # Pozitif etikete eşit olmayan her değer negatif etiket olmalı; aksi halde sessizce negatif sayılırdı
+    if not np.all((y_true == negative) | true_codes.astype(bool)):
+        raise ValueError(f"Gerçek değerler bilinmeyen etiketler içeriyor (etiketler: {labels.tolist()})")
+    if not np.all((y_pred == negative) | pred_codes.astype(bool)):
+        raise ValueError(f"Tahminler bilinmeyen etiketler içeriyor (etiketler: {labels.tolist()})")
+    
+    return true_codes, pred_codes
+
+
+def compute_confusion_counts(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    labels: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    İkili karışıklık matrisini (veya toplu tahminler için matrislerini) tek bincount ile oluştur.
+    
+    y_pred 2-D (veya daha yüksek boyutlu) olabilir: son eksen örneklerdir,
+    önceki eksenler ayrı tahmin kümeleridir (örn. fold x C x yöntem). Her
+    tahmin kümesinin (gerçek, tahmin) hücreleri ayrı bir 4'lük ofset
+    bloğuna düşer ve tüm matrisler tek np.bincount çağrısıyla sayılır.
+    
+    Args:
+        y_true: Gerçek değerler (n,) veya y_pred ile aynı şekilde
+        y_pred: Tahmin değerleri (n,) veya (..., n)
+        labels: Sıralı sınıf etiketleri [negatif, pozitif] (None ise y_true'dan)
+    
+    Returns:
+        np.ndarray: Karışıklık matrisleri (..., 2, 2), her biri
+            [[TN, FP],
+             [FN, TP]]
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    true_codes, pred_codes = _encode_binary_labels(y_true, y_pred, labels)
+    
+    batch_shape = y_pred.shape[:-1]
+    n_batches = int(np.prod(batch_shape))
+    
+    cell_index = 2 * true_codes + pred_codes
+    cell_index = np.broadcast_to(cell_index, y_pred.shape).reshape(n_batches, -1)
+    cell_index = cell_index + 4 * np.arange(n_batches, dtype=np.intp)[:, None]
+    
+    counts = np.bincount(cell_index.ravel(), minlength=4 * n_batches)
+    
+    return counts.reshape(batch_shape + (2, 2))
+
+
+def calculate_metrics_from_counts(
+    counts: np.ndarray,
+    average: str = 'weighted'
+) -> Dict[str, np.ndarray]:
+    """
+    Karışıklık matris(ler)inden tüm metrikleri vektörel olarak hesapla.
+    
+    Sınıf başına precision / recall / F1 hesaplanır ve sklearn ile aynı
+    şekilde ortalanır (payda 0 ise skor 0 kabul edilir). 'macro' ortalama
+    sklearn gibi sadece gerçek veya tahmin değerlerinde görülen sınıflar
+    üzerinden alınır.
+    
+    Args:
+        counts: compute_confusion_counts çıktısı (..., 2, 2)
+        average: Ortalama türü ('binary', 'micro', 'macro', 'weighted')
+    
+    Returns:
+        Dict[str, np.ndarray]: counts'un toplu (batch) şeklinde diziler
+            - accuracy, f1_score, precision, recall: Seçilen ortalama ile
+            - tn, fp, fn, tp: Karışıklık matrisi hücreleri
+    """
+    if average not in AVERAGES:
+        raise ValueError(f"Bilinmeyen ortalama türü: '{average}'. Seçenekler: {AVERAGES}")
+    
+    counts = np.asarray(counts, dtype=np.float64)
+    tn, fp = counts[..., 0, 0], counts[..., 0, 1]
+    fn, tp = counts[..., 1, 0], counts[..., 1, 1]
+    n = tn + fp + fn + tp
+    
+    accuracy = (tp + tn) / n
+    
+    # Sınıf başına skorlar: son eksen [negatif, pozitif]
+    correct = np.stack([tn, tp], axis=-1)
+    predicted = np.stack([tn + fn, tp + fp], axis=-1)
+    support = np.stack([tn + fp, tp + fn], axis=-1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(predicted > 0, correct / predicted, 0.0)
+        recall = np.where(support > 0, correct / support, 0.0)
+        f1 = np.where(predicted + support > 0, 2 * correct / (predicted + support), 0.0)
+    
+    if average == 'binary':
+        scores = [score[..., 1] for score in (f1, precision, recall)]
+    elif average == 'micro':
+        scores = [accuracy, accuracy, accuracy]
+    elif average == 'macro':
+        present = (predicted + support) > 0
+        scores = [(score * present).sum(axis=-1) / present.sum(axis=-1) for score in (f1, precision, recall)]
+    else:
+        weights = support / n[..., None]
+        scores = [(score * weights).sum(axis=-1) for score in (f1, precision, recall)]
+    
+    return {
+        'accuracy': accuracy,
+        'f1_score': scores[0],
+        'precision': scores[1],
+        'recall': scores[2],
+        'tn': tn,
+        'fp': fp,
+        'fn': fn,
+        'tp': tp
+    }
+
+
+def _as_metric_value(value: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    0-boyutlu sonuçları float'a çevir (tekil çağrılarda eski dönüş türü korunur).
+    """
+    return float(value) if np.ndim(value) == 0 else value
 
 
 def calculate_accuracy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
@@ -23,12 +181,13 @@ def calculate_accuracy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     
     Args:
         y_true: Gerçek değerler
-        y_pred: Tahmin değerleri
+        y_pred: Tahmin değerleri (toplu tahminler için (..., n))
     
     Returns:
         float: Accuracy skoru (0-1 arası)
     """
-    return accuracy_score(y_true, y_pred)
+    counts = compute_confusion_counts(y_true, y_pred)
+    return _as_metric_value(calculate_metrics_from_counts(counts)['accuracy'])
 
 
 def calculate_f1_score(
@@ -47,7 +206,8 @@ def calculate_f1_score(
     Returns:
         float: F1 skoru (0-1 arası)
     """
-    return f1_score(y_true, y_pred, average=average)
+    counts = compute_confusion_counts(y_true, y_pred)
+    return _as_metric_value(calculate_metrics_from_counts(counts, average)['f1_score'])
 
 
 def calculate_precision(
@@ -66,7 +226,8 @@ def calculate_precision(
     Returns:
         float: Precision skoru
     """
-    return precision_score(y_true, y_pred, average=average)
+    counts = compute_confusion_counts(y_true, y_pred)
+    return _as_metric_value(calculate_metrics_from_counts(counts, average)['precision'])
 
 
 def calculate_recall(
@@ -85,29 +246,42 @@ def calculate_recall(
     Returns:
         float: Recall skoru
     """
-    return recall_score(y_true, y_pred, average=average)
+    counts = compute_confusion_counts(y_true, y_pred)
+    return _as_metric_value(calculate_metrics_from_counts(counts, average)['recall'])
 
 
-def calculate_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+def calculate_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    average: str = 'weighted'
+) -> Dict[str, float]:
     """
-    Tüm performans metriklerini hesapla.
+    Tüm performans metriklerini tek karışıklık matrisinden hesapla.
+    
+    y_pred 2-D ise (örn. her satır bir fold / C / yöntem tahmini) tüm
+    tahmin kümelerinin metrikleri tek vektörel çağrıyla hesaplanır ve
+    değerler dizi olarak döner.
     
     Args:
-        y_true: Gerçek değerler
-        y_pred: Tahmin değerleri
+        y_true: Gerçek değerler (n,) veya y_pred ile aynı şekilde
+        y_pred: Tahmin değerleri (n,) veya (..., n)
+        average: Ortalama türü ('binary', 'micro', 'macro', 'weighted')
     
     Returns:
-        Dict: Tüm metrikler
+        Dict: Tüm metrikler (tekil tahminde float, toplu tahminde dizi)
             - accuracy: Doğruluk
             - f1_score: F1-Skoru
             - precision: Kesinlik
             - recall: Duyarlılık
     """
+    counts = compute_confusion_counts(y_true, y_pred)
+    scores = calculate_metrics_from_counts(counts, average)
+    
     metrics = {
-        'accuracy': calculate_accuracy(y_true, y_pred),
-        'f1_score': calculate_f1_score(y_true, y_pred),
-        'precision': calculate_precision(y_true, y_pred),
-        'recall': calculate_recall(y_true, y_pred)
+        'accuracy': _as_metric_value(scores['accuracy']),
+        'f1_score': _as_metric_value(scores['f1_score']),
+        'precision': _as_metric_value(scores['precision']),
+        'recall': _as_metric_value(scores['recall'])
     }
     
     return metrics
@@ -119,14 +293,585 @@ def create_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarra
     
     Args:
         y_true: Gerçek değerler
-        y_pred: Tahmin değerleri
+        y_pred: Tahmin değerleri (toplu tahminler için (..., n))
     
     Returns:
-        np.ndarray: 2x2 karışıklık matrisi
+        np.ndarray: 2x2 karışıklık matrisi (toplu tahminlerde (..., 2, 2))
             [[TN, FP],
              [FN, TP]]
     """
-    return confusion_matrix(y_true, y_pred)
+    return compute_confusion_counts(y_true, y_pred)
+
+
+def compute_threshold_curves(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    labels: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Tüm farklı eşik değerlerindeki karışıklık matrislerini tek sıralamayla hesapla.
+    
+    Skorlar bir kez büyükten küçüğe sıralanır; i. sıradaki skor eşik
+    alındığında (skor >= eşik pozitif) TP ve FP sayıları pozitif / negatif
+    göstergelerinin kümülatif toplamlarıdır. Eşit skorlar tek eşik
+    oluşturduğundan, bir eşitlik grubunun içindeki konumlar grubun son
+    konumunun sayılarıyla doldurulur; böylece ROC / PR eğrilerinde bu
+    konumlar alan katkısı olmayan tekrar noktaları olur. y_score (..., n)
+    şeklinde olabilir (örn. fold x yöntem); tüm işlemler son eksende
+    vektörel yapılır, Python döngüsü yoktur.
+    
+    Args:
+        y_true: Gerçek değerler (n,) veya y_score ile aynı şekilde
+        y_score: Pozitif sınıf skorları (örn. predict_proba[:, 1]), (n,) veya (..., n)
+        labels: Sıralı sınıf etiketleri [negatif, pozitif] (None ise y_true'dan)
+    
+    Returns:
+        Dict[str, np.ndarray]: Son ekseni sıralı konumlar olan diziler
+            - 'thresholds': Eşik değerleri (büyükten küçüğe)
+            - 'distinct': Farklı eşiklere karşılık gelen konumlar (grup sonları)
+            - 'tp', 'fp': Eşik başına TP ve FP sayıları
+            - 'tpr', 'fpr': Gerçek / yanlış pozitif oranları (ROC eğrisi)
+            - 'precision', 'recall': PR eğrisi
+            - 'positives', 'negatives': Pozitif ve negatif örnek sayıları (...,)
+    """
+    y_score = np.asarray(y_score, dtype=np.float64)
+    true_codes, _ = _encode_binary_labels(np.asarray(y_true), np.asarray(y_true), labels)
+    true_codes = np.broadcast_to(true_codes, y_score.shape)
+    
+    # Tek sıralama: büyükten küçüğe (kararlı)
+    order = np.argsort(-y_score, axis=-1, kind='stable')
+    thresholds = np.take_along_axis(y_score, order, axis=-1)
+    is_positive = np.take_along_axis(true_codes, order, axis=-1)
+    
+    tp = np.cumsum(is_positive, axis=-1, dtype=np.float64)
+    fp = np.arange(1, y_score.shape[-1] + 1) - tp
+    
+    # Eşitlik gruplarının son konumları; grup içi konumlar grup sonuna eşitlenir
+    distinct = np.ones(y_score.shape, dtype=bool)
+    distinct[..., :-1] = thresholds[..., 1:] != thresholds[..., :-1]
+    
+    n_samples = y_score.shape[-1]
+    group_end = np.where(distinct, np.arange(n_samples), n_samples - 1)
+    group_end = np.flip(np.minimum.accumulate(np.flip(group_end, axis=-1), axis=-1), axis=-1)
+    tp = np.take_along_axis(tp, group_end, axis=-1)
+    fp = np.take_along_axis(fp, group_end, axis=-1)
+    
+    positives = tp[..., -1]
+    negatives = fp[..., -1]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tpr = tp / positives[..., None]
+        fpr = fp / negatives[..., None]
+        precision = tp / (tp + fp)
+    
+    return {
+        'thresholds': thresholds,
+        'distinct': distinct,
+        'tp': tp,
+        'fp': fp,
+        'tpr': tpr,
+        'fpr': fpr,
+        'precision': precision,
+        'recall': tpr,
+        'positives': positives,
+        'negatives': negatives
+    }
+
+
+def _calculate_curve_areas(
+    tp: np.ndarray,
+    fp: np.ndarray,
+    positives: np.ndarray,
+    negatives: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Eşikler büyükten küçüğe sıralı kümülatif TP / FP sayılarından ROC-AUC ve PR-AUC hesapla.
+    
+    Başlangıç noktası (0, 0) eklenerek ROC için yamuk, PR için basamak
+    (ortalama kesinlik) alanları toplanır; TP ve FP'nin değişmediği
+    konumların alan katkısı yoktur.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (ROC-AUC, PR-AUC), son eksen hariç şekilde
+    """
+    tp_previous = np.concatenate([np.zeros_like(tp[..., :1]), tp[..., :-1]], axis=-1)
+    fp_previous = np.concatenate([np.zeros_like(fp[..., :1]), fp[..., :-1]], axis=-1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.nan_to_num(tp / (tp + fp))
+        roc_auc = ((fp - fp_previous) * (tp + tp_previous)).sum(axis=-1) / (2 * positives * negatives)
+        pr_auc = ((tp - tp_previous) * precision).sum(axis=-1) / positives
+    
+    return roc_auc, pr_auc
+
+
+def calculate_threshold_metrics(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    labels: Optional[np.ndarray] = None
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    ROC-AUC, PR-AUC ve F1 / accuracy açısından en iyi eşiği tek taramada hesapla.
+    
+    ROC-AUC yamuk kuralıyla (sklearn roc_auc_score), PR-AUC basamak
+    toplamıyla (sklearn average_precision_score) hesaplanır. En iyi eşikler
+    tüm farklı eşiklerdeki karışıklık matrisleri calculate_metrics_from_counts
+    ile skorlanarak bulunur; eşit skorlu eşiklerde en yüksek eşik seçilir.
+    
+    Args:
+        y_true: Gerçek değerler (n,) veya y_score ile aynı şekilde
+        y_score: Pozitif sınıf skorları, (n,) veya (..., n)
+        labels: Sıralı sınıf etiketleri [negatif, pozitif] (None ise y_true'dan)
+    
+    Returns:
+        Dict: Tekil skor vektöründe float, toplu skorlarda (...,) diziler
+            - 'roc_auc': ROC eğrisi altındaki alan
+            - 'pr_auc': Ortalama kesinlik (PR eğrisi altındaki alan)
+            - 'best_f1_threshold', 'best_f1': Pozitif sınıf F1'ini en büyükleyen eşik ve F1
+            - 'best_accuracy_threshold', 'best_accuracy': Doğruluğu en büyükleyen eşik ve doğruluk
+    """
+    curves = compute_threshold_curves(y_true, y_score, labels)
+    tp, fp = curves['tp'], curves['fp']
+    positives, negatives = curves['positives'], curves['negatives']
+    
+    roc_auc, pr_auc = _calculate_curve_areas(tp, fp, positives, negatives)
+    
+    counts = np.stack([
+        np.stack([negatives[..., None] - fp, fp], axis=-1),
+        np.stack([positives[..., None] - tp, tp], axis=-1)
+    ], axis=-2)
+    scores = calculate_metrics_from_counts(counts, average='binary')
+    
+    # Sadece farklı eşikler aday; argmax en yüksek eşiği seçer
+    f1 = np.where(curves['distinct'], scores['f1_score'], -np.inf)
+    accuracy = np.where(curves['distinct'], scores['accuracy'], -np.inf)
+    best_f1_index = np.argmax(f1, axis=-1)[..., None]
+    best_accuracy_index = np.argmax(accuracy, axis=-1)[..., None]
+    
+    results = {
+        'roc_auc': roc_auc,
+        'pr_auc': pr_auc,
+        'best_f1_threshold': np.take_along_axis(curves['thresholds'], best_f1_index, axis=-1)[..., 0],
+        'best_f1': np.take_along_axis(f1, best_f1_index, axis=-1)[..., 0],
+        'best_accuracy_threshold': np.take_along_axis(curves['thresholds'], best_accuracy_index, axis=-1)[..., 0],
+        'best_accuracy': np.take_along_axis(accuracy, best_accuracy_index, axis=-1)[..., 0]
+    }
+    
+    return {key: _as_metric_value(value) for key, value in results.items()}
+
+
+def calculate_roc_auc(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """
+    ROC eğrisi altındaki alanı hesapla.
+    
+    Args:
+        y_true: Gerçek değerler
+        y_score: Pozitif sınıf skorları (toplu skorlar için (..., n))
+    
+    Returns:
+        float: ROC-AUC (0-1 arası)
+    """
+    return calculate_threshold_metrics(y_true, y_score)['roc_auc']
+
+
+def calculate_pr_auc(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """
+    Precision-Recall eğrisi altındaki alanı (ortalama kesinlik) hesapla.
+    
+    Args:
+        y_true: Gerçek değerler
+        y_score: Pozitif sınıf skorları (toplu skorlar için (..., n))
+    
+    Returns:
+        float: PR-AUC (0-1 arası)
+    """
+    return calculate_threshold_metrics(y_true, y_score)['pr_auc']
+
+
+def calculate_bootstrap_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    n_resamples: int = 10000,
+    confidence: float = 0.95,
+    average: str = 'weighted',
+    random_state: int = 42
+) -> Dict:
+    """
+    Metriklerin bootstrap güven aralıklarını tüm yöntemler için birlikte hesapla.
+    
+    Test seti B kez iadeli yeniden örneklenir ve tüm yöntemler aynı
+    örneklerle değerlendirilir (eşli bootstrap); örnekler
+    compare_bootstrap_metrics ile yöntem farklarının anlamlılığında
+    doğrudan kullanılır. Metrikler sadece karışıklık matrisine bağlı
+    olduğundan her satır (gerçek, tahmin_1, ..., tahmin_M) desenine
+    indirgenir. n satırın iadeli seçimi, desen sayılarıyla orantılı tek
+    bir multinom çekilişine denktir: B x n indis matrisi yerine B x desen
+    ağırlık matrisi çekilir ve tüm yöntemlerin tüm örneklerdeki karışıklık
+    matrisleri tek ağırlıklı sayımla (ağırlıklar @ hücre göstergeleri)
+    bulunur. Örnek başına Python döngüsü yoktur.
+    
+    Desen sayısı U en fazla min(n, 2^(M+1)) olduğundan çok sayıda yöntemde
+    n'e yaklaşabilir; bu durumda multinom çekilişi (örnek başına O(U))
+    satır indislerinin iadeli örneklenmesinden (O(n)) yavaşlar. U > n / 8
+    ise her örnek n satır indisiyle çekilir ve desen sayıları bincount ile
+    bulunur (aynı dağılım). Her iki yolda B örnekleri parçalar halinde
+    işlenir; parça başına ağırlık / indis matrisi BOOTSTRAP_CHUNK_ELEMENTS
+    (~32 MB) ile sınırlıdır, bellek B ile değil sadece B x 4M sayım
+    matrisiyle büyür.
+    
+    Args:
+        y_true: Gerçek değerler (n,)
+        y_pred: Tahmin değerleri (n,) veya (M, n); her satır bir yöntem
+        n_resamples: Bootstrap örnek sayısı (B)
+        confidence: Güven düzeyi (örn. 0.95)
+        average: Ortalama türü ('binary', 'micro', 'macro', 'weighted')
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        Dict: Bootstrap sonuçları
+            - 'accuracy', 'f1_score', 'precision', 'recall': Her biri
+              {'estimate', 'lower', 'upper', 'std'}; tekil tahminde float,
+              (M, n) tahminde (M,) dizi
+            - 'samples': Metrik başına bootstrap değerleri (B, M)
+            - 'n_resamples', 'confidence': Kullanılan ayarlar
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence 0 ile 1 arasında olmalı: {confidence}")
+    
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    single = y_pred.ndim == 1
+    y_pred = np.atleast_2d(y_pred)
+    
+    if y_pred.ndim != 2 or y_true.shape != y_pred.shape[1:]:
+        raise ValueError(f"y_pred (n,) veya (M, n) şeklinde olmalı: y_true {y_true.shape}, y_pred {y_pred.shape}")
+    
+    true_codes, pred_codes = _encode_binary_labels(y_true, y_pred)
+    n_methods, n_samples = pred_codes.shape
+    
+    # Ortak desenler ve sayıları; desen başına yöntemlerin hücre kodları (2 * gerçek + tahmin)
+    patterns, pattern_index, pattern_counts = np.unique(
+        np.vstack([true_codes, pred_codes]), axis=1, return_inverse=True, return_counts=True
+    )
+    pattern_index = pattern_index.reshape(-1)
+    n_patterns = patterns.shape[1]
+    
+    cells = 2 * patterns[0] + patterns[1:]
+    indicators = np.zeros((n_patterns, n_methods, 4))
+    indicators[np.arange(n_patterns)[None, :], np.arange(n_methods)[:, None], cells] = 1.0
+    indicators = indicators.reshape(n_patterns, n_methods * 4)
+    
+    rng = np.random.default_rng(random_state)
+    use_patterns = n_patterns * BOOTSTRAP_PATTERN_RATIO <= n_samples
+    chunk_size = max(1, BOOTSTRAP_CHUNK_ELEMENTS // (n_patterns if use_patterns else n_samples))
+    counts = np.empty((n_resamples, n_methods * 4))
+    
+    for start in range(0, n_resamples, chunk_size):
+        size = min(chunk_size, n_resamples - start)
+        
+        if use_patterns:
+            weights = rng.multinomial(n_samples, pattern_counts / n_samples, size=size)
+        else:
+            # İadeli satır indisleri; her örneğin desenleri ayrı ofset bloğunda sayılır
+            sampled = pattern_index[rng.integers(0, n_samples, size=(size, n_samples))]
+            sampled += n_patterns * np.arange(size)[:, None]
+            weights = np.bincount(sampled.ravel(), minlength=size * n_patterns).reshape(size, n_patterns)
+        
+        counts[start:start + size] = weights @ indicators
+    
+    counts = counts.reshape(n_resamples, n_methods, 2, 2)
+    observed_counts = (pattern_counts @ indicators).reshape(n_methods, 2, 2)
+    
+    samples = calculate_metrics_from_counts(counts, average)
+    observed = calculate_metrics_from_counts(observed_counts, average)
+    
+    alpha = 1 - confidence
+    results = {'samples': {}, 'n_resamples': n_resamples, 'confidence': confidence}
+    
+    for metric in BOOTSTRAP_METRICS:
+        lower, upper = np.quantile(samples[metric], [alpha / 2, 1 - alpha / 2], axis=0)
+        summary = {
+            'estimate': observed[metric],
+            'lower': lower,
+            'upper': upper,
+            'std': samples[metric].std(axis=0, ddof=1)
+        }
+        
+        if single:
+            summary = {key: float(value[0]) for key, value in summary.items()}
+        
+        results[metric] = summary
+        results['samples'][metric] = samples[metric]
+    
+    return results
+
+
+def compare_bootstrap_metrics(
+    bootstrap: Dict,
+    method_names: Optional[List[str]] = None,
+    metrics: Tuple[str, ...] = BOOTSTRAP_METRICS
+) -> pd.DataFrame:
+    """
+    Eşli bootstrap örneklerinden yöntem çiftleri arasındaki farkların anlamlılığını hesapla.
+    
+    Her çift için fark dağılımı aynı bootstrap örneklerindeki metrik
+    farklarıdır. Güven aralığı yüzdelik yöntemle, iki yönlü p-değeri
+    2 * min(P(fark <= 0), P(fark >= 0)) olarak hesaplanır; aralık 0'ı
+    içermiyorsa fark anlamlıdır.
+    
+    Args:
+        bootstrap: calculate_bootstrap_metrics çıktısı ((M, n) tahminlerle)
+        method_names: Yöntem isimleri (None ise indisler)
+        metrics: Karşılaştırılacak metrikler
+    
+    Returns:
+        pd.DataFrame: Çift ve metrik başına bir satır
+            (Yöntem A, Yöntem B, Metrik, Fark (A - B), Alt Sınır, Üst Sınır, p-değeri, Anlamlı)
+    """
+    alpha = 1 - bootstrap['confidence']
+    n_methods = bootstrap['samples'][metrics[0]].shape[1]
+    
+    if method_names is None:
+        method_names = list(range(n_methods))
+    
+    first, second = np.triu_indices(n_methods, k=1)
+    frames = []
+    
+    for metric in metrics:
+        samples = bootstrap['samples'][metric]
+        estimate = np.atleast_1d(bootstrap[metric]['estimate'])
+        differences = samples[:, first] - samples[:, second]
+        
+        lower, upper = np.quantile(differences, [alpha / 2, 1 - alpha / 2], axis=0)
+        tail = np.minimum((differences <= 0).mean(axis=0), (differences >= 0).mean(axis=0))
+        p_values = np.minimum(2 * tail, 1.0)
+        
+        frames.append(pd.DataFrame({
+            'Yöntem A': [method_names[i] for i in first],
+            'Yöntem B': [method_names[j] for j in second],
+            'Metrik': metric,
+            'Fark (A - B)': estimate[first] - estimate[second],
+            'Alt Sınır': lower,
+            'Üst Sınır': upper,
+            'p-değeri': p_values,
+            'Anlamlı': p_values < alpha
+        }))
+    
+    return pd.concat(frames, ignore_index=True)
+
+
+def add_bootstrap_intervals(
+    results_dict: Dict,
+    n_resamples: int = 10000,
+    confidence: float = 0.95,
+    average: str = 'weighted',
+    random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Sonuçlar dict'indeki tüm yöntemlere bootstrap güven aralıklarını ekle.
+    
+    Tüm yöntemler aynı test setiyle (y_test) değerlendirilmiş olmalıdır;
+    tahminler (M, n) matrisine dizilip calculate_bootstrap_metrics ile
+    birlikte yeniden örneklenir. Her sonuca 'confidence_intervals'
+    ({'confidence', 'accuracy': (alt, üst), ...}) eklenir; bu alan
+    generate_results_table ve generate_markdown_report tarafından kullanılır.
+    
+    Args:
+        results_dict: Her yöntem için 'name', 'y_test' ve 'y_pred' içeren sonuçlar
+        n_resamples: Bootstrap örnek sayısı
+        confidence: Güven düzeyi
+        average: Ortalama türü (calculate_metrics ile aynı olmalı)
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        pd.DataFrame: compare_bootstrap_metrics çıktısı (yöntem isimleriyle)
+    """
+    keys = list(results_dict.keys())
+    y_true = results_dict[keys[0]]['y_test']
+    
+    for key in keys[1:]:
+        y_other = results_dict[key]['y_test']
+        same_index = not hasattr(y_true, 'index') or not hasattr(y_other, 'index') or y_true.index.equals(y_other.index)
+        if not same_index or not np.array_equal(np.asarray(y_other), np.asarray(y_true)):
+            raise ValueError(f"Eşli bootstrap için tüm yöntemler aynı test setini kullanmalı: {results_dict[key]['name']}")
+    
+    y_pred = np.stack([np.asarray(results_dict[key]['y_pred']) for key in keys])
+    bootstrap = calculate_bootstrap_metrics(
+        y_true, y_pred,
+        n_resamples=n_resamples,
+        confidence=confidence,
+        average=average,
+        random_state=random_state
+    )
+    
+    for index, key in enumerate(keys):
+        intervals = {'confidence': confidence}
+        for metric in BOOTSTRAP_METRICS:
+            intervals[metric] = (float(bootstrap[metric]['lower'][index]), float(bootstrap[metric]['upper'][index]))
+        results_dict[key]['confidence_intervals'] = intervals
+    
+    return compare_bootstrap_metrics(bootstrap, [results_dict[key]['name'] for key in keys])
+
+
+def create_metrics_accumulator(
+    labels: Tuple = (0, 1),
+    n_bins: Optional[int] = None
+) -> Dict:
+    """
+    Blok blok skorlama için boş bir metrik biriktiricisi oluştur.
+    
+    Biriktirici sadece 2x2 karışıklık matrisi sayılarını ve istenirse
+    sınıf başına skor histogramlarını tutar; y_true / y_pred dizileri
+    bellekte saklanmaz. Bir blok tek sınıf içerebileceğinden etiketler
+    baştan sabitlenir. Biriktiriciler numpy dizilerinden oluşan dict'ler
+    olduğundan işçi süreçlerden döndürülüp merge_metrics_accumulators
+    ile birleştirilebilir.
+    
+    Args:
+        labels: Sıralı sınıf etiketleri [negatif, pozitif]
+        n_bins: [0, 1] aralığında eşit genişlikli skor kutusu sayısı
+            (None ise histogram tutulmaz; yaklaşık AUC için örn. 1000)
+    
+    Returns:
+        Dict: Biriktirici
+            - 'labels': Sınıf etiketleri
+            - 'counts': Karışıklık matrisi sayıları (2, 2) [[TN, FP], [FN, TP]]
+            - 'n_bins': Skor kutusu sayısı (veya None)
+            - 'score_histograms': Sınıf başına skor histogramları (2, n_bins) veya None
+    """
+    if len(labels) != 2:
+        raise ValueError(f"Sadece ikili sınıflandırma destekleniyor, etiketler: {list(labels)}")
+    if n_bins is not None and n_bins < 2:
+        raise ValueError(f"n_bins en az 2 olmalı: {n_bins}")
+    
+    return {
+        'labels': np.asarray(labels),
+        'counts': np.zeros((2, 2), dtype=np.int64),
+        'n_bins': n_bins,
+        'score_histograms': None if n_bins is None else np.zeros((2, n_bins), dtype=np.int64)
+    }
+
+
+def update_metrics_accumulator(
+    accumulator: Dict,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_score: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    Biriktiriciye bir bloğun tahminlerini ekle (yerinde günceller).
+    
+    Karışıklık sayıları compute_confusion_counts ile, skor histogramları
+    (gerçek sınıf, skor kutusu) hücrelerinin tek bincount'u ile eklenir.
+    
+    Args:
+        accumulator: create_metrics_accumulator çıktısı
+        y_true: Bloğun gerçek değerleri
+        y_pred: Bloğun tahmin değerleri
+        y_score: Bloğun pozitif sınıf olasılıkları (histogram tutuluyorsa zorunlu)
+    
+    Returns:
+        Dict: Güncellenmiş biriktirici (aynı nesne)
+    """
+    y_true = np.asarray(y_true)
+    labels = accumulator['labels']
+    
+    accumulator['counts'] += compute_confusion_counts(y_true, np.asarray(y_pred), labels)
+    
+    if accumulator['score_histograms'] is not None:
+        if y_score is None:
+            raise ValueError("Skor histogramı tutan biriktirici için y_score gerekli.")
+        
+        n_bins = accumulator['n_bins']
+        true_codes, _ = _encode_binary_labels(y_true, y_true, labels)
+        score_bins = np.clip((np.asarray(y_score, dtype=np.float64) * n_bins).astype(np.intp), 0, n_bins - 1)
+        histograms = np.bincount(true_codes * n_bins + score_bins, minlength=2 * n_bins)
+        accumulator['score_histograms'] += histograms.reshape(2, n_bins)
+    elif y_score is not None:
+        raise ValueError("Biriktirici skor histogramı tutmuyor; create_metrics_accumulator(n_bins=...) kullanın.")
+    
+    return accumulator
+
+
+def merge_metrics_accumulators(a: Dict, b: Dict) -> Dict:
+    """
+    İki biriktiriciyi (örn. farklı işçi süreçlerin blokları) birleştir.
+    
+    Args:
+        a: Biriktirici
+        b: Biriktirici (aynı etiketler ve n_bins ile)
+    
+    Returns:
+        Dict: Yeni birleşik biriktirici
+    """
+    if not np.array_equal(a['labels'], b['labels']) or a['n_bins'] != b['n_bins']:
+        raise ValueError("Birleştirilen biriktiricilerin etiketleri ve n_bins değerleri aynı olmalı.")
+    
+    merged = create_metrics_accumulator(tuple(a['labels']), a['n_bins'])
+    merged['counts'] = a['counts'] + b['counts']
+    if a['score_histograms'] is not None:
+        merged['score_histograms'] = a['score_histograms'] + b['score_histograms']
+    
+    return merged
+
+
+def get_accumulated_metrics(accumulator: Dict, average: str = 'weighted') -> Dict[str, float]:
+    """
+    Biriktiriciden calculate_metrics ile aynı metrikleri hesapla.
+    
+    Args:
+        accumulator: Biriktirici
+        average: Ortalama türü ('binary', 'micro', 'macro', 'weighted')
+    
+    Returns:
+        Dict: accuracy, f1_score, precision, recall
+    """
+    scores = calculate_metrics_from_counts(accumulator['counts'], average)
+    
+    return {
+        'accuracy': float(scores['accuracy']),
+        'f1_score': float(scores['f1_score']),
+        'precision': float(scores['precision']),
+        'recall': float(scores['recall'])
+    }
+
+
+def get_accumulated_confusion_matrix(accumulator: Dict) -> np.ndarray:
+    """
+    Biriktiricinin karışıklık matrisini create_confusion_matrix formatında döndür.
+    
+    Returns:
+        np.ndarray: 2x2 karışıklık matrisi [[TN, FP], [FN, TP]]
+    """
+    return accumulator['counts'].copy()
+
+
+def calculate_accumulated_auc(accumulator: Dict) -> Dict[str, float]:
+    """
+    Skor histogramlarından yaklaşık ROC-AUC ve PR-AUC hesapla.
+    
+    Her kutu bir eşitlik grubu gibi ele alınır: kutular yüksek skordan
+    düşüğe kümülatif toplanır ve alanlar calculate_threshold_metrics ile
+    aynı formüllerle hesaplanır. Hata, aynı kutuya düşen pozitif ve negatif
+    örneklerin sıralamasının bilinmemesinden gelir ve kutu sayısı arttıkça
+    azalır.
+    
+    Args:
+        accumulator: n_bins ile oluşturulmuş biriktirici
+    
+    Returns:
+        Dict: 'roc_auc', 'pr_auc'
+    """
+    if accumulator['score_histograms'] is None:
+        raise ValueError("Biriktirici skor histogramı tutmuyor; create_metrics_accumulator(n_bins=...) kullanın.")
+    
+    negative_counts, positive_counts = accumulator['score_histograms'][:, ::-1].astype(np.float64)
+    tp = np.cumsum(positive_counts)
+    fp = np.cumsum(negative_counts)
+    
+    roc_auc, pr_auc = _calculate_curve_areas(tp, fp, tp[-1], fp[-1])
+    
+    return {'roc_auc': float(roc_auc), 'pr_auc': float(pr_auc)}
 
 
 def get_confusion_matrix_values(cm: np.ndarray) -> Dict[str, int]:
@@ -190,3 +935,113 @@ def print_metrics_summary(metrics: Dict[str, float], method_name: str = "") -> N
     print(f"  Precision: {metrics['precision']:.4f}")
     print(f"  Recall:    {metrics['recall']:.4f}")
     print('=' * 50)
+
+
+def _calculate_binary_scores(y_true: np.ndarray, predictions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tahmin matrisinin her sütunu için accuracy ve weighted F1 hesapla.
+    
+    TP sayıları tek matris-vektör çarpımıyla bulunur; metrikler
+    calculate_metrics_from_counts ile aynı çekirdekten türetilir.
+    
+    Args:
+        y_true: Gerçek değerler (0/1), uzunluk n
+        predictions: Boolean tahmin matrisi (n, k); her sütun ayrı bir tahmin kümesi
+    
+    Returns:
+        Tuple: (Accuracy dizisi (k,), Weighted F1 dizisi (k,))
+    """
+    n = len(y_true)
+    positives = y_true.sum()
+    negatives = n - positives
+    
+    tp = y_true.astype(np.float64) @ predictions
+    predicted_positives = predictions.sum(axis=0)
+    fp = predicted_positives - tp
+    fn = positives - tp
+    tn = negatives - fp
+    
+    counts = np.stack([np.stack([tn, fp], axis=-1), np.stack([fn, tp], axis=-1)], axis=-2)
+    scores = calculate_metrics_from_counts(counts, average='weighted')
+    
+    return scores['accuracy'], scores['f1_score']
+
+
+def calculate_permutation_importance(
+    model,
+    X: np.ndarray,
+    y: np.ndarray,
+    scaler=None,
+    feature_names: List[str] = None,
+    n_repeats: int = 50,
+    random_state: int = 42
+) -> Dict:
+    """
+    Doğrusal (ikili) Lojistik Regresyon modeli için permütasyon önemini kapalı formda hesapla.
+    
+    Genel permütasyon önemi her özellik ve her tekrar için tüm matrisi
+    yeniden tahmin eder. Doğrusal modelde j. sütunun karıştırılması logiti
+    sadece w_j * (x_perm - x) kadar değiştirir; bu nedenle her tekrar için
+    tüm özelliklerin logit farkları tek bir (n, p) matrisle hesaplanır ve
+    temel logitlere eklenir. Tahminler model.predict ile aynıdır
+    (karar fonksiyonu > 0).
+    
+    Args:
+        model: Eğitilmiş ikili LogisticRegression (coef_ ve intercept_ içeren doğrusal model)
+        X: Test özellikleri (ölçeklenmemiş; scaler verilirse dönüştürülür)
+        y: Gerçek değerler
+        scaler: train_final_model'den dönen StandardScaler (None ise X ölçeklenmiş kabul edilir)
+        feature_names: Özellik isimleri (None ise DataFrame sütunları veya indisler)
+        n_repeats: Her özellik için permütasyon tekrar sayısı
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        Dict: Permütasyon önemi sonuçları
+            - 'baseline': Karıştırılmamış veride {'accuracy', 'f1_score'}
+            - 'accuracy_drops': Accuracy düşüşleri (p, n_repeats)
+            - 'f1_drops': F1 düşüşleri (p, n_repeats)
+            - 'importances': Ortalama/standart sapmaya göre sıralı DataFrame
+    """
+    coef = np.asarray(model.coef_)
+    if coef.shape[0] != 1:
+        raise ValueError("Kapalı form permütasyon önemi sadece ikili doğrusal modeller için geçerlidir.")
+    
+    if feature_names is None:
+        feature_names = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(coef.shape[1]))
+    
+    X_values = scaler.transform(X) if scaler is not None else np.asarray(X, dtype=np.float64)
+    weights = coef[0]
+    y_true = (np.asarray(y) == model.classes_[1]).astype(np.int64)
+    
+    base_logits = X_values @ weights + model.intercept_[0]
+    base_accuracy, base_f1 = _calculate_binary_scores(y_true, (base_logits > 0)[:, None])
+    
+    rng = np.random.default_rng(random_state)
+    n_features = X_values.shape[1]
+    accuracy_drops = np.empty((n_features, n_repeats))
+    f1_drops = np.empty((n_features, n_repeats))
+    
+    for repeat in range(n_repeats):
+        # Her tekrarda bir satır permütasyonu; her özellik ayrı ayrı karıştırılmış sayılır
+        permutation = rng.permutation(len(X_values))
+        logit_deltas = (X_values[permutation] - X_values) * weights
+        predictions = (base_logits[:, None] + logit_deltas) > 0
+        
+        accuracy, f1 = _calculate_binary_scores(y_true, predictions)
+        accuracy_drops[:, repeat] = base_accuracy - accuracy
+        f1_drops[:, repeat] = base_f1 - f1
+    
+    importances = pd.DataFrame({
+        'Özellik': feature_names,
+        'Accuracy Düşüşü': accuracy_drops.mean(axis=1),
+        'Accuracy Std': accuracy_drops.std(axis=1),
+        'F1 Düşüşü': f1_drops.mean(axis=1),
+        'F1 Std': f1_drops.std(axis=1)
+    }).sort_values('Accuracy Düşüşü', ascending=False).reset_index(drop=True)
+    
+    return {
+        'baseline': {'accuracy': float(base_accuracy[0]), 'f1_score': float(base_f1[0])},
+        'accuracy_drops': accuracy_drops,
+        'f1_drops': f1_drops,
+        'importances': importances
+    }
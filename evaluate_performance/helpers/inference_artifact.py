@@ -0,0 +1,261 @@
+"""
+Inference Artifact Module
+=========================
+Bu modül, eğitilmiş Lojistik Regresyon modelini skorlama için küçük bir
+çıkarım (inference) dosyasına dönüştüren fonksiyonları içerir.
+
+train_final_model bir (model, scaler, süre) üçlüsü döndürür; skorlama
+scaler.transform ve model.predict ile iki tam geçiş ve tam boyutlu float64
+ara kopya gerektirir. StandardScaler doğrusal olduğundan ölçekleme
+katsayılara katlanabilir:
+
+    w' = w / scale,  b' = b - Σ w * mean / scale  →  logit = X @ w' + b'
+
+Dosya formatı (little-endian):
+    8 bayt sihirli dize | uint32 sürüm | uint32 başlık uzunluğu |
+    JSON başlık (64 bayta hizalı) | float32 [w'_1, ..., w'_p, b']
+
+Başlık özellik isimlerini (sıralı), sınıfları ve karar eşiğini içerir.
+Katsayılar np.memmap ile okunur; yükleme sklearn veya pickle gerektirmez.
+"""
+
+import os
+import json
+import struct
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from scipy.special import expit
+
+
+ARTIFACT_MAGIC = b"LRINFER\x00"
+ARTIFACT_VERSION = 1
+ARTIFACT_ALIGNMENT = 64
+ARTIFACT_DTYPE = np.dtype('<f4')
+
+
+def fold_scaler_into_weights(model, scaler=None) -> Tuple[np.ndarray, float]:
+    """
+    StandardScaler ortalama ve ölçeğini doğrusal modelin katsayılarına katla.
+    
+    Args:
+        model: Eğitilmiş ikili doğrusal model (coef_ ve intercept_ içeren)
+        scaler: Modelin eğitiminde kullanılan StandardScaler (None ise ölçekleme yok)
+    
+    Returns:
+        Tuple[np.ndarray, float]: (Ham özellikler üzerindeki katsayılar (p,), Sabit terim)
+    """
+    coef = np.asarray(model.coef_, dtype=np.float64)
+    if coef.shape[0] != 1:
+        raise ValueError("Çıkarım dosyası sadece ikili doğrusal modeller için oluşturulabilir.")
+    
+    weights = coef[0].copy()
+    intercept = float(np.asarray(model.intercept_, dtype=np.float64)[0])
+    
+    if scaler is not None:
+        if getattr(scaler, 'scale_', None) is not None:
+            weights = weights / scaler.scale_
+        if getattr(scaler, 'mean_', None) is not None:
+            intercept -= float(weights @ scaler.mean_)
+    
+    return weights, intercept
+
+
+def export_inference_artifact(
+    model,
+    scaler,
+    filepath: str,
+    feature_names: Optional[List[str]] = None,
+    threshold: float = 0.5,
+    metadata: Optional[Dict] = None
+) -> str:
+    """
+    Modeli ve scaler'ı tek katsayı vektörüne katlayarak çıkarım dosyası olarak kaydet.
+    
+    Dosya önce geçici bir dosyaya yazılır ve sonra yerine taşınır; yarım
+    yazılmış bir dosya okunmaz.
+    
+    Args:
+        model: Eğitilmiş ikili LogisticRegression
+        scaler: train_final_model'den dönen StandardScaler (None olabilir)
+        filepath: Çıkarım dosyasının yolu
+        feature_names: Sıralı özellik isimleri (None ise scaler / model feature_names_in_)
+        threshold: Pozitif sınıf olasılık eşiği (predict için)
+        metadata: Başlığa eklenecek ek bilgiler (örn. yöntem adı, C)
+    
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    if not 0 < threshold < 1:
+        raise ValueError(f"threshold 0 ile 1 arasında olmalı: {threshold}")
+    
+    weights, intercept = fold_scaler_into_weights(model, scaler)
+    
+    if feature_names is None:
+        source = scaler if getattr(scaler, 'feature_names_in_', None) is not None else model
+        if getattr(source, 'feature_names_in_', None) is None:
+            raise ValueError("Özellik isimleri bulunamadı; feature_names parametresini verin.")
+        feature_names = source.feature_names_in_
+    feature_names = [str(name) for name in feature_names]
+    
+    if len(feature_names) != len(weights):
+        raise ValueError(f"Özellik sayısı ({len(feature_names)}) katsayı sayısıyla ({len(weights)}) uyuşmuyor.")
+    
+    header = {
+        'feature_names': feature_names,
+        'classes': np.asarray(model.classes_).tolist(),
+        'threshold': threshold,
+        'dtype': ARTIFACT_DTYPE.str,
+        'metadata': metadata or {}
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    
+    # Katsayılar hizalı bir konumdan başlasın diye başlık boşlukla doldurulur
+    prefix_size = len(ARTIFACT_MAGIC) + 8
+    padded_size = -(-(prefix_size + len(header_bytes)) // ARTIFACT_ALIGNMENT) * ARTIFACT_ALIGNMENT
+    header_bytes += b" " * (padded_size - prefix_size - len(header_bytes))
+    
+    values = np.append(weights, intercept).astype(ARTIFACT_DTYPE)
+    
+    artifact_dir = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(artifact_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=artifact_dir, suffix=".tmp")
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(ARTIFACT_MAGIC)
+            f.write(struct.pack('<II', ARTIFACT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(values.tobytes())
+        os.replace(tmp_path, filepath)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    print(f"✓ Çıkarım dosyası kaydedildi: {filepath} ({os.path.getsize(filepath)} bayt, {len(feature_names)} özellik)")
+    
+    return filepath
+
+
+def load_inference_artifact(filepath: str, mmap: bool = True) -> Dict:
+    """
+    Çıkarım dosyasını yükle.
+    
+    Args:
+        filepath: Çıkarım dosyasının yolu
+        mmap: Katsayılar np.memmap ile okunsun mu (False ise belleğe kopyalanır)
+    
+    Returns:
+        Dict: Çıkarım modeli
+            - 'weights': Ham özellikler üzerindeki katsayılar (p,) float32
+            - 'intercept': Sabit terim
+            - 'feature_names': Sıralı özellik isimleri
+            - 'classes': Sınıf etiketleri [negatif, pozitif]
+            - 'threshold': Olasılık eşiği
+            - 'logit_threshold': Eşiğin logit karşılığı (predict exp hesaplamaz)
+            - 'metadata': Ek bilgiler
+            - 'version': Dosya sürümü
+    
+    Raises:
+        ValueError: Dosya bir çıkarım dosyası değilse veya sürümü desteklenmiyorsa
+    """
+    with open(filepath, 'rb') as f:
+        magic = f.read(len(ARTIFACT_MAGIC))
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"Geçersiz çıkarım dosyası: {filepath}")
+        
+        version, header_length = struct.unpack('<II', f.read(8))
+        if version != ARTIFACT_VERSION:
+            raise ValueError(f"Desteklenmeyen çıkarım dosyası sürümü: {version} ({filepath})")
+        
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    
+    n_values = len(header['feature_names']) + 1
+    offset = len(ARTIFACT_MAGIC) + 8 + header_length
+    
+    if mmap:
+        values = np.memmap(filepath, dtype=np.dtype(header['dtype']), mode='r', offset=offset, shape=(n_values,))
+    else:
+        values = np.fromfile(filepath, dtype=np.dtype(header['dtype']), count=n_values, offset=offset)
+    
+    threshold = header['threshold']
+    
+    return {
+        'weights': values[:-1],
+        'intercept': values[-1],
+        'feature_names': header['feature_names'],
+        'classes': np.asarray(header['classes']),
+        'threshold': threshold,
+        'logit_threshold': float(np.log(threshold / (1 - threshold))),
+        'metadata': header['metadata'],
+        'version': version
+    }
+
+
+def compute_artifact_logits(artifact: Dict, X) -> np.ndarray:
+    """
+    Ham özelliklerden logitleri tek birleşik çarpımla hesapla.
+    
+    DataFrame girdilerinde sütunlar isimle ve dosyadaki sırayla seçilip
+    doğrudan float32 diziye okunur. Kayan noktalı dizilerde katsayılar
+    girdinin tipine çevrilir; girdinin kopyası oluşturulmaz. Ölçekleme
+    katsayılara katlandığından ayrı bir transform geçişi yoktur.
+    
+    Args:
+        artifact: load_inference_artifact çıktısı
+        X: Ham özellikler; DataFrame (sütun isimleriyle) veya (n, p) / (p,) dizi
+    
+    Returns:
+        np.ndarray: Logitler (n,) (tek satırda skaler dizi)
+    """
+    if isinstance(X, pd.DataFrame):
+        missing = [name for name in artifact['feature_names'] if name not in X.columns]
+        if missing:
+            raise ValueError(f"Çıkarım dosyasındaki özellikler girdide bulunamadı: {missing}")
+        values = X[artifact['feature_names']].to_numpy(dtype=np.float32)
+    else:
+        values = np.asarray(X)
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float32)
+    
+    if values.shape[-1] != len(artifact['weights']):
+        raise ValueError(f"Girdi {values.shape[-1]} özellik içeriyor, model {len(artifact['weights'])} özellik bekliyor.")
+    
+    weights = np.asarray(artifact['weights'], dtype=values.dtype)
+    
+    return values @ weights + values.dtype.type(artifact['intercept'])
+
+
+def predict_proba_with_artifact(artifact: Dict, X) -> np.ndarray:
+    """
+    Pozitif sınıf olasılıklarını hesapla.
+    
+    Args:
+        artifact: load_inference_artifact çıktısı
+        X: Ham özellikler
+    
+    Returns:
+        np.ndarray: Pozitif sınıf olasılıkları (n,) (predict_proba[:, 1] ile aynı)
+    """
+    logits = compute_artifact_logits(artifact, X)
+    
+    # expit büyük negatif logitlerde exp taşması (RuntimeWarning) olmadan 0'a gider
+    return expit(logits)
+
+
+def predict_with_artifact(artifact: Dict, X) -> np.ndarray:
+    """
+    Sınıf tahminlerini logit eşiğiyle hesapla (olasılık hesaplanmaz).
+    
+    Args:
+        artifact: load_inference_artifact çıktısı
+        X: Ham özellikler
+    
+    Returns:
+        np.ndarray: Sınıf etiketleri (n,) (eşik 0.5 iken model.predict ile aynı)
+    """
+    logits = compute_artifact_logits(artifact, X)
+    
+    return artifact['classes'][(logits > artifact['logit_threshold']).astype(np.intp)]
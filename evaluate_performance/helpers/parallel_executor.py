@@ -0,0 +1,143 @@
+"""
+Parallel Executor Module
+========================
+Bu modül, cross-validation görevlerini (her C değeri ve fold için bir model
+eğitimi) seri, thread havuzu veya process havuzu ile çalıştıran fonksiyonları
+içerir.
+
+Process havuzunda fold dizileri shared_arrays ile tek bir paylaşımlı bellek
+(shared memory) bloğuna bir kez kopyalanır. İşçilere sadece küçük bir yerleşim (layout)
+bilgisi gönderilir; böylece veri matrisi her görev için pickle edilmez.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .shared_arrays import share_arrays, attach_arrays
+
+
+EXECUTORS = ('serial', 'thread', 'process')
+FOLD_ARRAY_KEYS = ('X_train', 'X_val', 'y_train', 'y_val')
+
+# Process işçilerinde paylaşımlı bellekten oluşturulan CV bağlamı
+_WORKER_SHARED_MEMORY = None
+_WORKER_CV_CONTEXT = None
+
+
+def share_cv_context(cv_context: Dict) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    CV bağlamındaki fold dizilerini tek bir paylaşımlı bellek bloğuna kopyala.
+    
+    Args:
+        cv_context: create_cv_context ile hazırlanmış bağlam
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, İşçilere gönderilecek yerleşim bilgisi)
+    """
+    shm, layout = share_arrays({
+        (i, key): fold[key]
+        for i, fold in enumerate(cv_context['folds'])
+        for key in FOLD_ARRAY_KEYS
+    })
+    
+    layout.update({
+        'cv': cv_context['cv'],
+        'random_state': cv_context['random_state'],
+        'n_samples': cv_context['n_samples'],
+        'n_features': cv_context['n_features']
+    })
+    
+    return shm, layout
+
+
+def attach_cv_context(layout: Dict) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    Paylaşımlı bellekteki fold dizilerinden kopyasız bir CV bağlamı oluştur.
+    
+    Args:
+        layout: share_cv_context ile oluşturulan yerleşim bilgisi
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, CV bağlamı)
+    """
+    shm, arrays = attach_arrays(layout)
+    
+    folds = [{} for _ in range(layout['cv'])]
+    for (i, key), array in arrays.items():
+        folds[i][key] = array
+    
+    cv_context = {
+        'cv': layout['cv'],
+        'random_state': layout['random_state'],
+        'n_samples': layout['n_samples'],
+        'n_features': layout['n_features'],
+        'folds': folds
+    }
+    
+    return shm, cv_context
+
+
+def _init_cv_worker(layout: Dict) -> None:
+    """
+    Process işçisini başlat: paylaşımlı belleğe bağlan.
+    """
+    global _WORKER_SHARED_MEMORY, _WORKER_CV_CONTEXT
+    _WORKER_SHARED_MEMORY, _WORKER_CV_CONTEXT = attach_cv_context(layout)
+
+
+def _run_cv_task(func: Callable, args: tuple):
+    """
+    Process işçisinde görevi paylaşımlı CV bağlamı ile çalıştır.
+    """
+    return func(_WORKER_CV_CONTEXT, *args)
+
+
+def run_cv_tasks(
+    cv_context: Dict,
+    func: Callable,
+    task_args: List[tuple],
+    executor: str = 'serial',
+    n_jobs: Optional[int] = None
+) -> List:
+    """
+    CV görevlerini seçilen yürütücü ile çalıştır.
+    
+    Her görev func(cv_context, *args) olarak çağrılır. Sonuçlar, yürütücüden
+    bağımsız olarak task_args ile aynı sırada döner.
+    
+    Args:
+        cv_context: create_cv_context ile hazırlanmış bağlam
+        func: Modül seviyesinde tanımlı görev fonksiyonu (process için pickle edilebilir)
+        task_args: Her görevin argümanları
+        executor: 'serial' (hata ayıklama), 'thread' veya 'process'
+        n_jobs: İşçi sayısı (None ise CPU sayısı)
+    
+    Returns:
+        List: Görev sonuçları (task_args sırasıyla)
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Bilinmeyen yürütücü: '{executor}'. Seçenekler: {EXECUTORS}")
+    
+    if executor == 'serial' or len(task_args) <= 1:
+        return [func(cv_context, *args) for args in task_args]
+    
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(task_args))
+    
+    if executor == 'thread':
+        # NumPy/BLAS işlemleri GIL'i bıraktığı için thread'ler veriyi kopyasız paylaşır
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            return list(pool.map(lambda args: func(cv_context, *args), task_args))
+    
+    shm, layout = share_cv_context(cv_context)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_cv_worker,
+            initargs=(layout,)
+        ) as pool:
+            return list(pool.map(_run_cv_task, [func] * len(task_args), task_args))
+    finally:
+        shm.close()
+        shm.unlink()
@@ -30,6 +30,13 @@ def get_results_dir() -> str:
     return results_dir
 
 
+def _format_interval(interval: tuple) -> str:
+    """
+    Güven aralığını [alt, üst] metni olarak biçimlendir.
+    """
+    return f"[{interval[0]:.4f}, {interval[1]:.4f}]"
+
+
 def generate_results_table(results_dict: Dict) -> pd.DataFrame:
     """
     Sonuç tablosu oluştur.
@@ -43,7 +50,14 @@ def generate_results_table(results_dict: Dict) -> pd.DataFrame:
                     'accuracy': 0.65,
                     'f1_score': 0.64,
                     'training_time': 0.5,
-                    'C': 1.0  # optional
+                    'C': 1.0,  # optional
+                    'roc_auc': 0.70,  # optional
+                    'pr_auc': 0.68,  # optional
+                    'confidence_intervals': {  # optional (add_bootstrap_intervals)
+                        'confidence': 0.95,
+                        'accuracy': (0.64, 0.66),
+                        'f1_score': (0.63, 0.65)
+                    }
                 }
             }
     
@@ -61,6 +75,18 @@ def generate_results_table(results_dict: Dict) -> pd.DataFrame:
             'Eğitim Süresi (s)': f"{result['training_time']:.4f}",
         }
         
+        # Skor tabanlı metrikler varsa ekle (calculate_threshold_metrics)
+        if 'roc_auc' in result:
+            row['ROC-AUC'] = f"{result['roc_auc']:.4f}"
+            row['PR-AUC'] = f"{result['pr_auc']:.4f}"
+        
+        # Bootstrap güven aralıkları varsa ekle (add_bootstrap_intervals)
+        if 'confidence_intervals' in result:
+            intervals = result['confidence_intervals']
+            level = f"%{intervals['confidence'] * 100:g} GA"
+            row[f'Accuracy {level}'] = _format_interval(intervals['accuracy'])
+            row[f'F1 {level}'] = _format_interval(intervals['f1_score'])
+        
         # Regularization bilgisi varsa ekle
         if 'C' in result:
             row['C (Regularization)'] = result['C']
@@ -94,22 +120,67 @@ def save_results_to_csv(results_dict: Dict, filename: str = "results.csv") -> st
     return filepath
 
 
+def _get_best_method_comparisons(significance: pd.DataFrame, method_name: str) -> pd.DataFrame:
+    """
+    Eşli karşılaştırmalardan bir yöntemin diğerleriyle farklarını (yöntem - diğer) seç.
+    
+    Args:
+        significance: compare_bootstrap_metrics / add_bootstrap_intervals çıktısı
+        method_name: Yöntem adı
+    
+    Returns:
+        pd.DataFrame: Karşılaştırılan, Metrik, Fark, Alt Sınır, Üst Sınır, p-değeri, Anlamlı
+    """
+    as_first = significance[significance['Yöntem A'] == method_name]
+    as_second = significance[significance['Yöntem B'] == method_name]
+    
+    comparisons = pd.concat([
+        pd.DataFrame({
+            'Karşılaştırılan': as_first['Yöntem B'],
+            'Metrik': as_first['Metrik'],
+            'Fark': as_first['Fark (A - B)'],
+            'Alt Sınır': as_first['Alt Sınır'],
+            'Üst Sınır': as_first['Üst Sınır'],
+            'p-değeri': as_first['p-değeri'],
+            'Anlamlı': as_first['Anlamlı']
+        }),
+        pd.DataFrame({
+            'Karşılaştırılan': as_second['Yöntem A'],
+            'Metrik': as_second['Metrik'],
+            'Fark': -as_second['Fark (A - B)'],
+            'Alt Sınır': -as_second['Üst Sınır'],
+            'Üst Sınır': -as_second['Alt Sınır'],
+            'p-değeri': as_second['p-değeri'],
+            'Anlamlı': as_second['Anlamlı']
+        })
+    ])
+    
+    return comparisons.sort_index().reset_index(drop=True)
+
+
 def generate_markdown_report(
     results_dict: Dict,
     best_method: str,
     confusion_matrix_data: Optional[np.ndarray] = None,
     overfitting_info: Optional[Dict] = None,
-    feature_comparison: Optional[Dict] = None
+    feature_comparison: Optional[Dict] = None,
+    significance: Optional[pd.DataFrame] = None
 ) -> str:
     """
     Detaylı Markdown raporu oluştur.
     
+    Sonuçlarda 'confidence_intervals' varsa bootstrap güven aralıkları
+    tablosu eklenir. significance verilirse en başarılı yöntem diğerleriyle
+    eşli olarak karşılaştırılır; accuracy farkı anlamlı olmayan yöntemler
+    ⭐ notunun altında uyarı olarak belirtilir.
+    
     Args:
         results_dict: Sonuçlar dict'i
         best_method: En başarılı yöntemin anahtarı
         confusion_matrix_data: Karışıklık matrisi (optional)
         overfitting_info: Aşırı öğrenme bilgileri (optional)
         feature_comparison: Özellik karşılaştırma tablosu (optional)
+        significance: add_bootstrap_intervals çıktısı eşli karşılaştırmalar (optional)
     
     Returns:
         str: Markdown formatında rapor
@@ -140,7 +211,20 @@ def generate_markdown_report(
     report += f"""
 > [!NOTE]
 > En başarılı yöntem: **{best_result['name']}** (Accuracy: {best_result['accuracy']:.4f}, F1: {best_result['f1_score']:.4f})
-
+"""
+    
+    # Eşli bootstrap: en iyi yöntemin farkı gürültü sınırları içinde mi?
+    if significance is not None:
+        best_comparisons = _get_best_method_comparisons(significance, best_result['name'])
+        rivals = best_comparisons[(best_comparisons['Metrik'] == 'accuracy') & ~best_comparisons['Anlamlı']]
+        if len(rivals):
+            names = ", ".join(f"**{name}**" for name in rivals['Karşılaştırılan'])
+            report += f"""
+> [!WARNING]
+> Accuracy farkı şu yöntemlere göre istatistiksel olarak anlamlı değil (eşli bootstrap): {names}
+"""
+    
+    report += f"""
 ---
 
 ## 🎯 En Başarılı Yöntem Detayları
@@ -151,6 +235,40 @@ def generate_markdown_report(
 **F1-Skoru:** {best_result['f1_score']:.4f}
 """
     
+    # Bootstrap güven aralıkları
+    interval_results = [r for r in results_dict.values() if 'confidence_intervals' in r]
+    if interval_results:
+        confidence = interval_results[0]['confidence_intervals']['confidence']
+        report += f"""
+---
+
+## 📏 Bootstrap Güven Aralıkları (%{confidence * 100:g})
+
+| Yöntem | Doğruluk (Accuracy) | F1-Skoru | Precision | Recall |
+|--------|---------------------|----------|-----------|--------|
+"""
+        for result in interval_results:
+            intervals = result['confidence_intervals']
+            report += f"| {result['name']} | "
+            report += " | ".join(
+                f"{result[metric]:.4f} {_format_interval(intervals[metric])}"
+                for metric in ('accuracy', 'f1_score', 'precision', 'recall')
+            )
+            report += " |\n"
+    
+    # En başarılı yöntemin diğerleriyle eşli karşılaştırması
+    if significance is not None:
+        report += f"""
+### 🔬 Eşli Anlamlılık Testi ({best_result['name']} - Diğer Yöntemler)
+
+| Karşılaştırılan | Metrik | Fark | Güven Aralığı | p-değeri | Anlamlı |
+|-----------------|--------|------|---------------|----------|---------|
+"""
+        for _, row in best_comparisons[best_comparisons['Metrik'].isin(['accuracy', 'f1_score'])].iterrows():
+            status = "✅" if row['Anlamlı'] else "❌"
+            report += f"| {row['Karşılaştırılan']} | {row['Metrik']} | {row['Fark']:+.4f} | "
+            report += f"{_format_interval((row['Alt Sınır'], row['Üst Sınır']))} | {row['p-değeri']:.4f} | {status} |\n"
+    
     # Aşırı öğrenme bilgisi
     if overfitting_info:
         report += f"""
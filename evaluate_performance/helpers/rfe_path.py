@@ -0,0 +1,123 @@
+"""
+RFE Path Module
+===============
+Bu modül, RFE (Recursive Feature Elimination) eleme yolunun tek seferde
+hesaplanması ve her özellik sayısı için performans taraması işlemlerini içerir.
+
+RFE(step=1) özellikleri her zaman aynı sırayla eler; n özellik için yapılan
+eleme, 1 özelliğe kadar yapılan elemenin ilk adımlarıyla aynıdır. Bu nedenle
+tek bir RFE çalıştırmasının ranking_ çıktısı tüm alt kümeleri verir:
+n özellikli alt küme, ranking_ <= n olan özelliklerdir.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from sklearn.feature_selection import RFE
+from sklearn.model_selection import cross_val_score
+
+from .model_trainer import create_logistic_regression_model
+
+
+def get_rfe_ranking(
+    X: np.ndarray,
+    y: np.ndarray,
+    C: float = 1.0
+) -> np.ndarray:
+    """
+    RFE'yi 1 özelliğe kadar bir kez çalıştırarak tam sıralamayı hesapla.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi
+        y: Hedef değişken
+        C: Lojistik Regresyon regularization parametresi
+    
+    Returns:
+        np.ndarray: Her özelliğin sırası (1 = en son elenen, en önemli)
+    """
+    base_model = create_logistic_regression_model(C=C)
+    rfe = RFE(estimator=base_model, n_features_to_select=1, step=1)
+    rfe.fit(X, y)
+    
+    return rfe.ranking_
+
+
+def compute_rfe_path(
+    X_train: np.ndarray,
+    y_train: pd.Series,
+    X_test: np.ndarray,
+    y_test: pd.Series,
+    feature_names: List[str],
+    max_features: int = 30,
+    cv: int = 5,
+    C: float = 1.0,
+    ranking: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    Tek RFE eleme yolundan 1..max_features özellik sayıları için CV ve test skorlarını hesapla.
+    
+    Her n için ayrı RFE çalıştırmak (58 özellikten n'e kadar tekrar tekrar
+    eleme) yerine eleme bir kez yapılır; her n için sadece CV ve test
+    modelleri eğitilir. Seçilen alt kümeler RFE(n_features_to_select=n)
+    ile birebir aynıdır.
+    
+    Args:
+        X_train: Ölçeklenmiş eğitim özellikleri
+        y_train: Eğitim hedef değişkeni
+        X_test: Ölçeklenmiş test özellikleri
+        y_test: Test hedef değişkeni
+        feature_names: Özellik isimleri (X sütun sırasıyla)
+        max_features: Denenecek en büyük özellik sayısı
+        cv: Fold sayısı
+        C: Lojistik Regresyon regularization parametresi
+        ranking: Önceden hesaplanmış RFE sıralaması (None ise hesaplanır)
+    
+    Returns:
+        Dict: RFE yolu
+            - 'ranking': Her özelliğin RFE sırası
+            - 'feature_order': Önemden önemsize sıralı özellik isimleri
+            - 'results': Her n için dict listesi
+              ('n_features', 'cv_accuracy', 'test_accuracy', 'selected_features', 'support')
+    """
+    if ranking is None:
+        ranking = get_rfe_ranking(X_train, y_train, C=C)
+    
+    feature_names = list(feature_names)
+    max_features = min(max_features, len(feature_names))
+    
+    results = []
+    
+    print("\n📊 Farklı özellik sayıları test ediliyor...")
+    print("-" * 70)
+    print(f"{'Özellik Sayısı':>15} | {'Cross-Val Accuracy':>18} | {'Test Accuracy':>15}")
+    print("-" * 70)
+    
+    for n_features in range(1, max_features + 1):
+        support = ranking <= n_features
+        
+        X_train_selected = X_train[:, support]
+        X_test_selected = X_test[:, support]
+        
+        model = create_logistic_regression_model(C=C)
+        cv_scores = cross_val_score(model, X_train_selected, y_train, cv=cv, scoring='accuracy')
+        cv_mean = cv_scores.mean()
+        
+        model_test = create_logistic_regression_model(C=C)
+        model_test.fit(X_train_selected, y_train)
+        test_accuracy = model_test.score(X_test_selected, y_test)
+        
+        results.append({
+            'n_features': n_features,
+            'cv_accuracy': cv_mean,
+            'test_accuracy': test_accuracy,
+            'selected_features': [name for name, keep in zip(feature_names, support) if keep],
+            'support': support
+        })
+        
+        print(f"{n_features:>15} | {cv_mean:>18.4f} | {test_accuracy:>15.4f}")
+    
+    return {
+        'ranking': ranking,
+        'feature_order': [feature_names[i] for i in np.argsort(ranking, kind='stable')],
+        'results': results
+    }
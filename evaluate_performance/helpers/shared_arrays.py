@@ -0,0 +1,76 @@
+"""
+Shared Arrays Module
+====================
+Bu modül, isimlendirilmiş NumPy dizilerini process havuzu işçileriyle
+kopyasız paylaşmak için tek bir paylaşımlı bellek (shared memory) bloğuna
+yerleştiren ve bu bloğa bağlanan fonksiyonları içerir.
+
+Diziler 64 byte hizalı olarak bir kez kopyalanır; işçilere sadece blok adı
+ve dizilerin yerleşim bilgisi (anahtar, ofset, boyut, veri tipi) gönderilir.
+
+Klasörler ayrı çalışma dizinlerinden çalıştığı için modülün aynı kopyası
+`feature_selection/shared_arrays.py`'dedir; kopyaların eşitliği
+`tests/test_module_copies.py` ile denetlenir.
+"""
+
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, Tuple
+
+
+ALIGNMENT = 64
+
+
+def share_arrays(arrays: Dict[Hashable, np.ndarray]) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    Dizileri tek bir paylaşımlı bellek bloğuna kopyala.
+    
+    Args:
+        arrays: {anahtar: dizi} (anahtarlar pickle edilebilir olmalı)
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, {'name': blok adı, 'arrays': yerleşim listesi})
+    """
+    arrays = [(key, np.ascontiguousarray(array)) for key, array in arrays.items()]
+    
+    # Her dizi 64 byte hizalı olarak yerleştirilir
+    offsets = []
+    total_size = 0
+    for _, array in arrays:
+        offsets.append(total_size)
+        total_size += (array.nbytes + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(total_size, 1))
+    
+    layout = {'name': shm.name, 'arrays': []}
+    for (key, array), offset in zip(arrays, offsets):
+        np.copyto(np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=offset), array)
+        layout['arrays'].append((key, offset, array.shape, array.dtype.str))
+    
+    return shm, layout
+
+
+def attach_arrays(layout: Dict) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    Paylaşımlı bellek bloğuna bağlan ve dizileri kopyasız görünümler olarak oluştur.
+    
+    Args:
+        layout: share_arrays ile oluşturulan yerleşim bilgisi ('name', 'arrays')
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, {anahtar: dizi})
+    """
+    try:
+        # Python 3.13+: bloğun sahibi ana process olduğu için izlenmez
+        shm = shared_memory.SharedMemory(name=layout['name'], track=False)
+    except TypeError:
+        # Eski sürümler: işçiler ana process'in resource tracker'ını paylaşır,
+        # tekrar kayıt etkisizdir ve blok ana process'te unlink ile silinir
+        shm = shared_memory.SharedMemory(name=layout['name'])
+    
+    arrays = {
+        key: np.ndarray(shape, np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for key, offset, shape, dtype in layout['arrays']
+    }
+    
+    return shm, arrays
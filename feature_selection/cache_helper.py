@@ -0,0 +1,215 @@
+"""
+Cache Helper Module
+===================
+Bu modül, CSV veri kümeleri için ikili (binary) sütun önbelleği işlemlerini içerir.
+
+Her CSV dosyasının yanına `<dosya>.csv.cache.npz` adında sıkıştırılmamış bir
+NumPy arşivi yazılır. Arşiv her sütunu ayrı bir dizi olarak ve kaynak CSV'nin
+yol, boyut ve değiştirilme zamanı bilgilerini metadata olarak saklar. CSV
+değiştiğinde önbellek otomatik olarak yeniden oluşturulur.
+
+CSV'nin yanında ön işleme adımının yazdığı `<dosya>.csv.dtypes.json` veri
+tipi şeması varsa sütunlar bu tiplerle (örn. uint8, float32) okunur.
+
+Önbellek formatı ve kodu `evaluate_performance/helpers/dataset_cache.py` ile ortaktır;
+kopyaların eşitliği `tests/test_module_copies.py` ile denetlenir.
+"""
+
+import os
+import json
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+
+CACHE_SUFFIX = ".cache.npz"
+CACHE_VERSION = 1
+DTYPES_SUFFIX = ".dtypes.json"
+
+
+def get_cache_path(csv_path: str) -> str:
+    """
+    CSV dosyasına karşılık gelen önbellek dosyasının yolunu döndür.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+    
+    Returns:
+        str: Önbellek dosyasının yolu
+    """
+    return csv_path + CACHE_SUFFIX
+
+
+def get_source_fingerprint(csv_path: str) -> Dict:
+    """
+    CSV dosyasının önbellek anahtarını (yol, boyut, değiştirilme zamanı) oluştur.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+    
+    Returns:
+        Dict: 'path', 'size', 'mtime_ns' anahtarlarını içeren dict
+    """
+    stat = os.stat(csv_path)
+    
+    return {
+        'path': os.path.abspath(csv_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+
+def read_dtype_schema(csv_path: str) -> Optional[Dict[str, str]]:
+    """
+    CSV dosyasının yanındaki veri tipi şemasını oku.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+    
+    Returns:
+        Optional[Dict[str, str]]: {sütun adı: veri tipi}, şema yoksa None
+    """
+    dtypes_path = csv_path + DTYPES_SUFFIX
+    
+    if not os.path.exists(dtypes_path):
+        return None
+    
+    with open(dtypes_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_csv_with_schema(csv_path: str) -> pd.DataFrame:
+    """
+    CSV dosyasını varsa veri tipi şemasıyla oku.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+    
+    Returns:
+        pd.DataFrame: Yüklenen veri kümesi
+    """
+    dtypes = read_dtype_schema(csv_path)
+    
+    if dtypes is None:
+        return pd.read_csv(csv_path)
+    
+    # İkili sütunlar CSV'de "1.0" biçiminde olabilir: okunduktan sonra dönüştür
+    float_dtypes = {c: t for c, t in dtypes.items() if t.startswith('float')}
+    df = pd.read_csv(csv_path, dtype=float_dtypes)
+    
+    return df.astype({c: t for c, t in dtypes.items() if c in df.columns})
+
+
+def read_cache(csv_path: str) -> Optional[pd.DataFrame]:
+    """
+    Güncel bir önbellek varsa veri kümesini önbellekten oku.
+    
+    Args:
+        csv_path: Kaynak CSV dosyasının yolu
+    
+    Returns:
+        Optional[pd.DataFrame]: Önbellek geçerliyse DataFrame, değilse None
+    """
+    cache_path = get_cache_path(csv_path)
+    
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        with np.load(cache_path, allow_pickle=False) as bundle:
+            meta = json.loads(str(bundle['__meta__']))
+            
+            # Sürüm veya kaynak dosya değiştiyse önbellek geçersiz
+            if meta.get('version') != CACHE_VERSION:
+                return None
+            if meta.get('source') != get_source_fingerprint(csv_path):
+                return None
+            if meta.get('dtypes') != read_dtype_schema(csv_path):
+                return None
+            
+            columns = [str(c) for c in bundle['__columns__']]
+            data = {name: bundle[f"c{i}"] for i, name in enumerate(columns)}
+    except (OSError, ValueError, KeyError):
+        # Bozuk veya yarım kalmış önbellek: yeniden oluşturulacak
+        return None
+    
+    return pd.DataFrame(data, columns=columns)
+
+
+def write_cache(df: pd.DataFrame, csv_path: str) -> Optional[str]:
+    """
+    DataFrame'i CSV dosyasının yanına ikili önbellek olarak yaz.
+    
+    Sadece sayısal ve boolean sütunlar desteklenir; diğer sütun türleri
+    içeren veri kümeleri için önbellek yazılmaz.
+    
+    Args:
+        df: Önbelleğe alınacak DataFrame
+        csv_path: Kaynak CSV dosyasının yolu
+    
+    Returns:
+        Optional[str]: Yazılan önbellek dosyasının yolu, yazılamadıysa None
+    """
+    for dtype in df.dtypes:
+        if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)):
+            return None
+    
+    meta = {
+        'version': CACHE_VERSION,
+        'source': get_source_fingerprint(csv_path),
+        'dtypes': read_dtype_schema(csv_path)
+    }
+    
+    arrays = {f"c{i}": df.iloc[:, i].to_numpy() for i in range(df.shape[1])}
+    arrays['__columns__'] = np.array([str(c) for c in df.columns])
+    arrays['__meta__'] = np.array(json.dumps(meta))
+    
+    cache_path = get_cache_path(csv_path)
+    cache_dir = os.path.dirname(os.path.abspath(cache_path))
+    
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError as e:
+        print(f"  ⚠️ Önbellek yazılamadı ({cache_path}): {e}")
+        return None
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  ⚠️ Önbellek yazılamadı ({cache_path}): {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    
+    return cache_path
+
+
+def read_csv_cached(csv_path: str, use_cache: bool = True) -> pd.DataFrame:
+    """
+    CSV dosyasını ikili önbellek üzerinden oku.
+    
+    Önbellek güncelse CSV ayrıştırılmadan doğrudan sütunlar okunur; değilse
+    CSV okunur ve önbellek yeniden oluşturulur.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+        use_cache: False ise önbellek kullanılmaz (doğrudan CSV okunur)
+    
+    Returns:
+        pd.DataFrame: Yüklenen veri kümesi
+    """
+    if not use_cache:
+        return read_csv_with_schema(csv_path)
+    
+    df = read_cache(csv_path)
+    if df is not None:
+        return df
+    
+    df = read_csv_with_schema(csv_path)
+    write_cache(df, csv_path)
+    
+    return df
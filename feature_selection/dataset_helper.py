@@ -7,7 +7,19 @@ Bu modül, veri kümesi yükleme, kaydetme ve işleme fonksiyonlarını içerir.
 import pandas as pd
 import numpy as np
 import os
-from typing import Tuple, List, Optional
+import json
+from scipy import stats
+from typing import Tuple, List, Optional, Dict
+
+from cache_helper import read_csv_cached
+from sufficient_stats import (
+    compute_sufficient_stats_chunked,
+    compute_sufficient_stats_from_csv,
+    get_correlations_from_stats
+)
+
+
+MANIFEST_VERSION = 1
 
 
 def get_dataset_dir() -> str:
@@ -21,12 +33,19 @@ def get_dataset_dir() -> str:
     return os.path.join(current_dir, "..", "dataset_files")
 
 
-def load_processed_dataset(filename: str = "processed_dataset.csv") -> pd.DataFrame:
+def load_processed_dataset(
+    filename: str = "processed_dataset.csv",
+    use_cache: bool = True
+) -> pd.DataFrame:
     """
     İşlenmiş veri kümesini yükle.
     
+    Tekrarlanan yüklemelerde CSV yerine yanındaki ikili önbellek okunur
+    (bkz. cache_helper).
+    
     Args:
         filename: Yüklenecek dosyanın adı (default: processed_dataset.csv)
+        use_cache: İkili önbellek kullanılsın mı (default: True)
     
     Returns:
         pd.DataFrame: Yüklenen veri kümesi
@@ -40,7 +59,7 @@ def load_processed_dataset(filename: str = "processed_dataset.csv") -> pd.DataFr
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Veri kümesi bulunamadı: {filepath}")
     
-    df = pd.read_csv(filepath)
+    df = read_csv_cached(filepath, use_cache=use_cache)
     print(f"Veri kümesi yüklendi: {filepath}")
     print(f"Boyut: {df.shape}")
     
@@ -71,14 +90,100 @@ def split_features_target(df: pd.DataFrame, target_column: str = "is_popular") -
     return X, y
 
 
+def get_manifest_filename(filename: str) -> str:
+    """
+    Seçilmiş veri kümesi dosya adına karşılık gelen manifesto dosya adını döndür.
+    
+    Args:
+        filename: Veri kümesi dosya adı (örn: filter_method_selected_dataset.csv)
+    
+    Returns:
+        str: Manifesto dosya adı (örn: filter_method_selected_dataset.json)
+    """
+    return os.path.splitext(filename)[0] + ".json"
+
+
+def get_dataset_fingerprint(filename: str) -> Dict:
+    """
+    Veri kümesi dosyasının parmak izini (dosya adı, boyut, değiştirilme zamanı) oluştur.
+    
+    Args:
+        filename: dataset_files klasöründeki dosya adı
+    
+    Returns:
+        Dict: 'filename', 'size', 'mtime_ns' anahtarlarını içeren dict
+    """
+    filepath = os.path.join(get_dataset_dir(), filename)
+    stat = os.stat(filepath)
+    
+    return {
+        'filename': filename,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+
 def save_selected_dataset(
+    df: pd.DataFrame,
+    selected_features: List[str],
+    target_column: str,
+    filename: str,
+    source_filename: str = "processed_dataset.csv",
+    export_csv: bool = False
+) -> str:
+    """
+    Seçilen özellikleri bir seçim manifestosu olarak kaydet.
+    
+    Manifesto; seçilen özellik isimlerini (sırasıyla), hedef sütunu ve kaynak
+    veri kümesinin parmak izini içeren küçük bir JSON dosyasıdır. Veri,
+    değerlendirme aşamasında kaynak veri kümesi üzerinden çözümlenir.
+    
+    Args:
+        df: Orijinal veri kümesi
+        selected_features: Seçilen özellik isimleri listesi
+        target_column: Hedef değişken sütunu adı
+        filename: Veri kümesi dosya adı (manifesto adı buradan türetilir)
+        source_filename: Özelliklerin seçildiği kaynak veri kümesi
+        export_csv: True ise tam CSV kopyası da yazılır
+    
+    Returns:
+        str: Kaydedilen manifesto dosyasının yolu
+    """
+    missing = [f for f in list(selected_features) + [target_column] if f not in df.columns]
+    if missing:
+        raise ValueError(f"Sütunlar veri kümesinde bulunamadı: {missing}")
+    
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'source': get_dataset_fingerprint(source_filename),
+        'target_column': target_column,
+        'features': list(selected_features)
+    }
+    
+    dataset_dir = get_dataset_dir()
+    filepath = os.path.join(dataset_dir, get_manifest_filename(filename))
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    
+    print(f"\nSeçim manifestosu kaydedildi: {filepath}")
+    print(f"Kaynak: {source_filename}")
+    print(f"Sütunlar: {manifest['features'] + [target_column]}")
+    
+    if export_csv:
+        export_selected_dataset(df, selected_features, target_column, filename)
+    
+    return filepath
+
+
+def export_selected_dataset(
     df: pd.DataFrame,
     selected_features: List[str],
     target_column: str,
     filename: str
 ) -> str:
     """
-    Seçilen özelliklerle birlikte hedef sütunu içeren veri kümesini kaydet.
+    Seçilen özelliklerle birlikte hedef sütunu içeren veri kümesini CSV olarak kaydet.
     
     Args:
         df: Orijinal veri kümesi
@@ -125,6 +230,84 @@ def normalize_scores(scores: np.ndarray) -> np.ndarray:
     return (scores - min_score) / (max_score - min_score)
 
 
+def finalize_pearson_stats(pearson_stats: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Birikmiş istatistiklerden korelasyon katsayılarını ve p-değerlerini hesapla.
+    
+    p-değerleri scipy.stats.pearsonr ile aynı şekilde (iki yönlü, beta
+    dağılımı) hesaplanır. Sabit sütunlar için sonuç NaN'dir.
+    
+    Args:
+        pearson_stats: sufficient_stats.compute_sufficient_stats (with_gram=False
+            yeterli) / merge_sufficient_stats çıktısı
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Korelasyonlar, p-değerleri)
+    """
+    n = pearson_stats['n']
+    
+    correlations = get_correlations_from_stats(pearson_stats)
+    
+    ab = n / 2 - 1
+    p_values = 2 * stats.beta.sf(np.abs(correlations), ab, ab, loc=-1, scale=2)
+    
+    return correlations, p_values
+
+
+def compute_pearson_correlations(
+    X: pd.DataFrame,
+    y: pd.Series,
+    chunksize: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tüm özelliklerin hedef değişken ile Pearson korelasyonunu ve p-değerini birlikte hesapla.
+    
+    Özellik başına scipy.stats.pearsonr döngüsü yerine tek bir matris-vektör
+    çarpımı kullanılır. chunksize verilirse satırlar bloklar halinde işlenir
+    ve blok istatistikleri birleştirilir; bu durumda bellekte sadece bir
+    bloğun float64 kopyası tutulur.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken
+        chunksize: Blok başına satır sayısı (None ise tek geçiş)
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Korelasyonlar, p-değerleri), X sütun sırasıyla;
+            get_feature_ranking(feature_names, correlations) ile doğrudan kullanılabilir
+    """
+    pearson_stats = compute_sufficient_stats_chunked(X, y, chunksize=chunksize, with_gram=False)
+    
+    return finalize_pearson_stats(pearson_stats)
+
+
+def compute_pearson_correlations_from_csv(
+    filename: str = "processed_dataset.csv",
+    target_column: str = "is_popular",
+    chunksize: int = 100_000
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Bellekten büyük veri kümeleri için Pearson korelasyonlarını CSV'yi bloklar halinde okuyarak hesapla.
+    
+    Args:
+        filename: dataset_files içindeki CSV dosya adı
+        target_column: Hedef değişken sütunu adı
+        chunksize: Blok başına satır sayısı
+    
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: (Özellik isimleri, Korelasyonlar, p-değerleri)
+    """
+    filepath = os.path.join(get_dataset_dir(), filename)
+    
+    feature_names, pearson_stats = compute_sufficient_stats_from_csv(
+        filepath, target_column=target_column, chunksize=chunksize, with_gram=False
+    )
+    
+    correlations, p_values = finalize_pearson_stats(pearson_stats)
+    
+    return feature_names, correlations, p_values
+
+
 def get_feature_ranking(
     feature_names: List[str],
     scores: np.ndarray,
@@ -0,0 +1,566 @@
+"""
+Elastic Net Helper Module
+=========================
+Bu modül, L1 / elastic-net cezalı Lojistik Regresyonun düzenlileştirme
+yolunu (regularization path) gömülü özellik seçimi olarak hesaplar.
+
+Amaç fonksiyonu sklearn LogisticRegression(l1_ratio=..., C=...) ile
+aynıdır:
+
+    C * Σ log-kayıp + l1_ratio * ||w||₁ + (1 - l1_ratio) / 2 * ||w||²
+
+Eşdeğer olarak λ = 1 / (C * n) ile ortalama kayıp + λ * ceza çözülür.
+λ, hiçbir özelliğin seçilmediği λ_max'tan başlayarak geometrik olarak
+küçültülür; her λ bir önceki çözümden başlar (warm-start). Her λ için
+Newton (IRLS) adımının kuadratik modeli, ağırlıklı Gram matrisi üzerinde
+aktif küme yöntemiyle çözülür: sıfırdan farklı katsayılar doğrudan doğrusal
+sistemle bulunur, koordinat inişi (coordinate descent) taraması KKT
+kontrolü olarak kullanılır. Güçlü kural (strong rule) ile büyük olasılıkla
+sıfır kalacak özellikler elenir ve çözüm sonrası KKT koşulları kontrol
+edilerek ihlal eden özellikler geri eklenir.
+
+Yol boyunca özelliklerin modele giriş sırası tek bir hesaplamayla elde
+edilir; "ilk giren 15 özellik" doğrudan yoldan okunur.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import expit
+from typing import Dict, List, Optional
+from sklearn.model_selection import StratifiedKFold
+
+
+# Newton adımı başına koordinat inişi taraması üst sınırı (tam + aktif küme)
+MAX_CD_SWEEPS = 100
+
+
+def get_lambda_max(X: np.ndarray, y: np.ndarray, l1_ratio: float = 1.0) -> float:
+    """
+    Tüm katsayıların sıfır olduğu en küçük λ değerini hesapla.
+    
+    Sadece kesim terimli modelde gradyan X'ᵀ(ȳ - y) / n olduğundan
+    λ_max = max |X'ᵀ(y - ȳ)| / (n * l1_ratio) olur.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi (n x p)
+        y: 0/1 hedef değişken
+        l1_ratio: L1 cezasının oranı (0 < l1_ratio <= 1)
+    
+    Returns:
+        float: λ_max
+    """
+    n_samples = len(y)
+    gradient = X.T @ (y - y.mean()) / n_samples
+    
+    return float(np.abs(gradient).max() / l1_ratio)
+
+
+def get_penalized_loss(
+    X: np.ndarray,
+    y: np.ndarray,
+    coef: np.ndarray,
+    intercept: float,
+    lam: float,
+    l1_ratio: float
+) -> float:
+    """
+    Ortalama log-kayıp + elastic-net cezası değerini hesapla.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi
+        y: 0/1 hedef değişken
+        coef: Katsayılar
+        intercept: Kesim terimi
+        lam: Ceza katsayısı λ
+        l1_ratio: L1 cezasının oranı
+    
+    Returns:
+        float: Amaç fonksiyonu değeri
+    """
+    logits = X @ coef + intercept
+    loss = np.mean(np.logaddexp(0.0, logits) - y * logits)
+    penalty = l1_ratio * np.abs(coef).sum() + 0.5 * (1.0 - l1_ratio) * coef @ coef
+    
+    return float(loss + lam * penalty)
+
+
+def _coordinate_sweep(
+    hessian: np.ndarray,
+    diagonal: np.ndarray,
+    residual: np.ndarray,
+    beta: np.ndarray,
+    l1: float,
+    l2: float
+) -> float:
+    """
+    Kuadratik model üzerinde tek bir koordinat inişi taraması yap.
+    
+    İndis 0 cezasız kesim terimidir. beta ve kalan gradyan (residual)
+    yerinde güncellenir.
+    
+    Returns:
+        float: Ölçeklenmiş en büyük katsayı değişimi
+    """
+    max_change = 0.0
+    
+    # Kesim terimi (cezasız Newton adımı)
+    delta = -residual[0] / diagonal[0]
+    if delta != 0.0:
+        beta[0] += delta
+        residual += hessian[:, 0] * delta
+        max_change = abs(delta) * np.sqrt(diagonal[0])
+    
+    for j in range(1, len(beta)):
+        old = beta[j]
+        z = diagonal[j] * old - residual[j]
+        new = np.sign(z) * max(abs(z) - l1, 0.0) / (diagonal[j] + l2)
+        
+        if new != old:
+            delta = new - old
+            beta[j] = new
+            residual += hessian[:, j] * delta
+            max_change = max(max_change, abs(delta) * np.sqrt(diagonal[j]))
+    
+    return max_change
+
+
+def _solve_active_set(
+    hessian: np.ndarray,
+    residual: np.ndarray,
+    beta: np.ndarray,
+    l1: float,
+    l2: float
+) -> Optional[np.ndarray]:
+    """
+    Aktif kümede kuadratik modeli işaretler sabitken doğrudan çöz.
+    
+    İşaretler s değişmezse L1 cezası doğrusaldır ve optimum
+    (H + l2 M) δ = -(r + l1 s + l2 M β) sistemiyle bulunur (M: kesim
+    terimi hariç ceza maskesi). Yeni çözümde bir katsayı sıfırı geçiyorsa
+    δ yönünde ilk sıfır geçişine kadar ilerlenir (amaç azalır), o katsayı
+    sıfırlanıp kümeden çıkarılır ve sistem kalan kümede tekrar çözülür.
+    
+    Args:
+        hessian: Aktif küme Hessian'ı (indis 0 kesim terimi)
+        residual: Aktif kümede kalan gradyan r = g + H d
+        beta: Aktif katsayılar (kesim terimi dışında sıfırdan farklı)
+        l1, l2: L1 ve L2 ceza katsayıları
+    
+    Returns:
+        Optional[np.ndarray]: Yeni aktif katsayılar (çıkarılanlar 0),
+        sistem tekil ise None
+    """
+    beta = beta.copy()
+    residual = residual.copy()
+    penalized = np.ones(len(beta))
+    penalized[0] = 0.0
+    kept = np.arange(len(beta))
+    
+    while True:
+        signs = np.sign(beta[kept]) * penalized[kept]
+        system = hessian[np.ix_(kept, kept)] + np.diag(l2 * penalized[kept])
+        try:
+            delta = np.linalg.solve(system, -(residual[kept] + l1 * signs + l2 * penalized[kept] * beta[kept]))
+        except np.linalg.LinAlgError:
+            return None
+        
+        candidate = beta[kept] + delta
+        crossing = np.flatnonzero(np.sign(candidate) * signs < 0)
+        if len(crossing) == 0:
+            beta[kept] = candidate
+            return beta
+        
+        # İlk sıfır geçişine kadar ilerle ve o katsayıyı kümeden çıkar
+        fractions = beta[kept][crossing] / (beta[kept][crossing] - candidate[crossing])
+        first = np.argmin(fractions)
+        step = fractions[first] * delta
+        
+        beta[kept] += step
+        residual += hessian[:, kept] @ step
+        beta[kept[crossing[first]]] = 0.0
+        kept = np.delete(kept, crossing[first])
+
+
+def _solve_quadratic_cd(
+    hessian: np.ndarray,
+    gradient: np.ndarray,
+    beta: np.ndarray,
+    l1: float,
+    l2: float,
+    max_sweeps: int,
+    tol: float
+) -> np.ndarray:
+    """
+    Newton adımının kuadratik modelini aktif küme yöntemi ve koordinat inişiyle çöz.
+    
+    0.5 * dᵀ H d + gᵀ d + l1 * ||β + d||₁ + 0.5 * l2 * ||β + d||² en küçüklenir
+    (indis 0 kesim terimidir ve cezalandırılmaz). Tüm koordinatlar üzerinde
+    bir tarama yapılır; ardından sadece sıfırdan farklı koordinatlar (aktif
+    küme, H'nin alt matrisiyle) çözülür: önce işaretler sabitken doğrudan
+    doğrusal sistemle, bir işaret değişirse yakınsayana kadar koordinat
+    inişiyle. Aktif küme çözüldükten sonraki tam tarama KKT kontrolüdür:
+    hiçbir koordinat değişmezse çözüm tamamdır, aksi halde yeni aktif
+    kümeyle devam edilir. max_sweeps tam ve aktif küme taramalarının
+    toplamını sınırlar.
+    
+    Returns:
+        np.ndarray: Yeni katsayılar β + d
+    """
+    beta_new = beta.copy()
+    diagonal = np.diag(hessian)
+    n_sweeps = 0
+    
+    while n_sweeps < max_sweeps:
+        # Tam tarama (KKT kontrolü); kalan gradyan r = g + H d baştan hesaplanır
+        residual = gradient + hessian @ (beta_new - beta)
+        n_sweeps += 1
+        if _coordinate_sweep(hessian, diagonal, residual, beta_new, l1, l2) < tol:
+            break
+        
+        # Aktif küme: kesim terimi + sıfırdan farklı katsayılar
+        active = np.union1d([0], np.flatnonzero(beta_new != 0))
+        
+        active_hessian = hessian[np.ix_(active, active)]
+        active_residual = residual[active]
+        active_beta = beta_new[active]
+        
+        solution = _solve_active_set(active_hessian, active_residual, active_beta, l1, l2)
+        if solution is not None:
+            beta_new[active] = solution
+            continue
+        
+        active_diagonal = diagonal[active]
+        while n_sweeps < max_sweeps:
+            n_sweeps += 1
+            if _coordinate_sweep(active_hessian, active_diagonal, active_residual, active_beta, l1, l2) < tol:
+                break
+        
+        beta_new[active] = active_beta
+    
+    return beta_new
+
+
+def _fit_penalized_logistic(
+    X: np.ndarray,
+    y: np.ndarray,
+    coef: np.ndarray,
+    intercept: float,
+    lam: float,
+    l1_ratio: float,
+    columns: np.ndarray,
+    max_iter: int,
+    tol: float
+) -> Dict:
+    """
+    Verilen sütunlarla (diğerleri 0) tek bir λ için cezalı lojistik modeli eğit.
+    
+    Proximal Newton: her iterasyonda ağırlıklı Gram matrisi sadece aktif
+    aday sütunlar için hesaplanır, kuadratik model koordinat inişiyle çözülür
+    ve amaç fonksiyonu azalmazsa adım yarıya indirilir.
+    
+    Returns:
+        Dict: 'coef', 'intercept', 'logits' (X @ coef + intercept), 'n_iter'
+    """
+    n_samples = len(y)
+    l1 = lam * l1_ratio
+    l2 = lam * (1.0 - l1_ratio)
+    
+    X_S = X[:, columns]
+    beta = np.concatenate([[intercept], coef[columns]])
+    
+    def objective(b):
+        # Amaç değeri ve logitler (bir sonraki iterasyonda tekrar kullanılır)
+        logits = X_S @ b[1:] + b[0]
+        loss = np.mean(np.logaddexp(0.0, logits) - y * logits)
+        return loss + l1 * np.abs(b[1:]).sum() + 0.5 * l2 * b[1:] @ b[1:], logits
+    
+    current, logits = objective(beta)
+    n_iter = 0
+    
+    for n_iter in range(1, max_iter + 1):
+        probabilities = expit(logits)
+        weights = np.maximum(probabilities * (1.0 - probabilities), 1e-5)
+        residual = probabilities - y
+        
+        # Kesim terimi dahil [1, X_S] için gradyan ve ağırlıklı Gram matrisi;
+        # satırlar √w ile ölçeklenir, böylece Gram simetrik AᵀA çarpımıdır
+        sqrt_weights = np.sqrt(weights)
+        weighted = X_S * sqrt_weights[:, None]
+        hessian = np.empty((len(beta), len(beta)))
+        hessian[0, 0] = weights.sum()
+        hessian[0, 1:] = hessian[1:, 0] = sqrt_weights @ weighted
+        hessian[1:, 1:] = weighted.T @ weighted
+        hessian /= n_samples
+        
+        gradient = np.concatenate([[residual.sum()], X_S.T @ residual]) / n_samples
+        
+        target = _solve_quadratic_cd(hessian, gradient, beta, l1, l2, max_sweeps=MAX_CD_SWEEPS, tol=tol)
+        direction = target - beta
+        
+        # Amaç fonksiyonu azalana kadar adımı yarıya indir
+        step = 1.0
+        candidate = target
+        value, candidate_logits = objective(candidate)
+        while value > current + 1e-12 and step > 1e-4:
+            step *= 0.5
+            candidate = beta + step * direction
+            value, candidate_logits = objective(candidate)
+        
+        change = np.max(np.abs(candidate - beta) * np.sqrt(np.diag(hessian)))
+        beta = candidate
+        current = value
+        logits = candidate_logits
+        
+        if change < tol:
+            break
+    
+    coef = np.zeros_like(coef)
+    coef[columns] = beta[1:]
+    
+    return {'coef': coef, 'intercept': float(beta[0]), 'logits': logits, 'n_iter': n_iter}
+
+
+def compute_elastic_net_path(
+    X: np.ndarray,
+    y: np.ndarray,
+    l1_ratio: float = 1.0,
+    n_lambdas: int = 100,
+    lambda_min_ratio: float = 1e-5,
+    lambdas: Optional[np.ndarray] = None,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    screening: bool = True,
+    verbose: bool = True
+) -> Dict:
+    """
+    L1 / elastic-net Lojistik Regresyon düzenlileştirme yolunu tek taramada hesapla.
+    
+    λ_max'tan λ_max * lambda_min_ratio'ya kadar geometrik ızgaradaki her λ,
+    bir önceki çözümden başlatılır. screening=True ise ardışık güçlü kural
+    uygulanır: |∇_j| < l1_ratio * (2λ_k - λ_(k-1)) olan ve henüz modele
+    girmemiş özellikler çözüme katılmaz; çözümden sonra bu özelliklerde KKT
+    koşulu (|∇_j| <= l1_ratio * λ_k) kontrol edilir, ihlal edenler eklenip
+    çözüm tekrarlanır. Sonuç eleme yapılmadan bulunan çözümle aynıdır.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi (n x p)
+        y: Hedef değişken (ikili)
+        l1_ratio: L1 cezasının oranı (1.0 = lasso, 0 < l1_ratio <= 1)
+        n_lambdas: Izgaradaki λ sayısı
+        lambda_min_ratio: En küçük λ / λ_max oranı
+        lambdas: Özel λ ızgarası (büyükten küçüğe; verilirse n_lambdas ve
+            lambda_min_ratio kullanılmaz)
+        max_iter: λ başına maksimum Newton iterasyonu
+        tol: Durma toleransı (ölçeklenmiş katsayı değişimi)
+        screening: Güçlü kural ile özellik eleme yapılsın mı
+        verbose: İlerleme bilgisi yazdır
+    
+    Returns:
+        Dict: Yol sonuçları
+            - 'lambdas': λ değerleri (büyükten küçüğe)
+            - 'C_values': Her λ'ya karşılık gelen sklearn C değeri, 1 / (n * λ)
+            - 'coefs': Katsayılar (n_lambdas x p)
+            - 'intercepts': Kesim terimleri
+            - 'n_active': Her λ'daki sıfır olmayan katsayı sayısı
+            - 'entry_order': Özelliklerin modele giriş sırasıyla indisleri
+              (aynı λ'da girenler mutlak katsayıya göre sıralanır; yol
+              sonuna kadar girmeyenler en sonda, gradyan büyüklüğüne göre)
+            - 'ranking': Özellik sıraları (1 = ilk giren); get_feature_ranking
+              için skor olarak -ranking kullanılabilir
+            - 'entry_lambdas': Her özelliğin ilk sıfırdan farklı olduğu λ (girmediyse 0)
+            - 'strong_set_sizes': Her λ'da çözüme katılan özellik sayısı
+            - 'kkt_violations': Toplam KKT ihlali (güçlü kuralın hatalı eleme) sayısı
+    """
+    if not 0.0 < l1_ratio <= 1.0:
+        raise ValueError(f"l1_ratio 0 ile 1 arasında olmalı (0 hariç): {l1_ratio}")
+    
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    y = (y == np.unique(y)[-1]).astype(np.float64)
+    n_samples, n_features = X.shape
+    
+    if lambdas is None:
+        lambda_max = get_lambda_max(X, y, l1_ratio)
+        lambdas = lambda_max * np.geomspace(1.0, lambda_min_ratio, n_lambdas)
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+    
+    coefs = np.zeros((len(lambdas), n_features))
+    intercepts = np.zeros(len(lambdas))
+    strong_set_sizes = np.zeros(len(lambdas), dtype=int)
+    
+    coef = np.zeros(n_features)
+    mean_y = np.clip(y.mean(), 1e-12, 1 - 1e-12)
+    intercept = float(np.log(mean_y / (1.0 - mean_y)))
+    
+    ever_active = np.zeros(n_features, dtype=bool)
+    previous_lambda = lambdas[0]
+    kkt_violations = 0
+    
+    gradient = X.T @ (expit(X @ coef + intercept) - y) / n_samples
+    
+    for k, lam in enumerate(lambdas):
+        if screening:
+            strong = ever_active | (np.abs(gradient) >= l1_ratio * (2 * lam - previous_lambda))
+        else:
+            strong = np.ones(n_features, dtype=bool)
+        
+        while True:
+            columns = np.flatnonzero(strong)
+            result = _fit_penalized_logistic(
+                X, y, coef, intercept, lam, l1_ratio, columns, max_iter=max_iter, tol=tol
+            )
+            coef, intercept = result['coef'], result['intercept']
+            
+            gradient = X.T @ (expit(result['logits']) - y) / n_samples
+            
+            # Elenen özelliklerde KKT kontrolü: |∇_j| <= l1_ratio * λ
+            violations = ~strong & (np.abs(gradient) > l1_ratio * lam * (1 + 1e-6))
+            if not violations.any():
+                break
+            
+            kkt_violations += int(violations.sum())
+            strong |= violations
+        
+        coefs[k] = coef
+        intercepts[k] = intercept
+        strong_set_sizes[k] = strong.sum()
+        ever_active |= coef != 0
+        previous_lambda = lam
+        
+        if verbose and (k % 10 == 0 or k == len(lambdas) - 1):
+            print(f"  λ={lam:.6f} (C={1.0 / (n_samples * lam):.4g}): "
+                  f"{np.count_nonzero(coef)} aktif özellik, {strong.sum()} aday")
+    
+    # Giriş sırası: ilk sıfırdan farklı olduğu λ indisi, eşitlikte |katsayı|
+    nonzero = coefs != 0
+    entered = nonzero.any(axis=0)
+    entry_index = np.where(entered, nonzero.argmax(axis=0), len(lambdas))
+    entry_magnitude = np.where(
+        entered, np.abs(coefs[np.minimum(entry_index, len(lambdas) - 1), np.arange(n_features)]), 0.0
+    )
+    # Girmeyen özellikler son çözümdeki gradyan büyüklüğüne göre sıralanır
+    entry_magnitude = np.where(entered, entry_magnitude, np.abs(gradient))
+    entry_order = np.lexsort((-entry_magnitude, entry_index))
+    
+    ranking = np.empty(n_features, dtype=int)
+    ranking[entry_order] = np.arange(1, n_features + 1)
+    
+    return {
+        'lambdas': lambdas,
+        'C_values': 1.0 / (n_samples * lambdas),
+        'coefs': coefs,
+        'intercepts': intercepts,
+        'n_active': nonzero.sum(axis=1),
+        'entry_order': [int(j) for j in entry_order],
+        'ranking': ranking,
+        'entry_lambdas': np.where(entered, lambdas[np.minimum(entry_index, len(lambdas) - 1)], 0.0),
+        'strong_set_sizes': strong_set_sizes,
+        'kkt_violations': kkt_violations
+    }
+
+
+def cross_validate_elastic_net_path(
+    X: np.ndarray,
+    y: np.ndarray,
+    l1_ratio: float = 1.0,
+    cv: int = 5,
+    n_lambdas: int = 100,
+    lambda_min_ratio: float = 1e-5,
+    random_state: int = 42,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    verbose: bool = True
+) -> Dict:
+    """
+    Düzenlileştirme yolunu StratifiedKFold ile çapraz doğrula.
+    
+    Tüm veri ile hesaplanan λ ızgarası her fold'da aynen kullanılır; her fold
+    için yol bir kez hesaplanır ve doğrulama doğruluğu tüm λ değerleri için
+    tek matris çarpımıyla bulunur. Böylece özellik sayısı taraması (RFE
+    yolundaki her n için ayrı eğitim yerine) fold başına tek yol hesaplamasıdır.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi (n x p)
+        y: Hedef değişken (ikili)
+        l1_ratio: L1 cezasının oranı
+        cv: Fold sayısı
+        n_lambdas: Izgaradaki λ sayısı
+        lambda_min_ratio: En küçük λ / λ_max oranı
+        random_state: StratifiedKFold için seed değeri
+        max_iter: λ başına maksimum Newton iterasyonu
+        tol: Durma toleransı
+        verbose: İlerleme bilgisi yazdır
+    
+    Returns:
+        Dict: Çapraz doğrulama sonuçları
+            - 'path': Tüm veri ile hesaplanan yol (compute_elastic_net_path çıktısı)
+            - 'val_scores': Fold x λ doğrulama doğrulukları
+            - 'results_df': λ başına tablo (C, aktif özellik sayısı, ortalama ve std doğruluk)
+            - 'best_index': En yüksek ortalama doğruluğa sahip λ indisi
+            - 'best_C': Bu λ'ya karşılık gelen C
+            - 'best_features': Bu λ'da aktif özellik indisleri (giriş sırasıyla)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    positive = (y == np.unique(y)[-1]).astype(np.float64)
+    
+    if verbose:
+        print("Tüm veri ile yol hesaplanıyor...")
+    path = compute_elastic_net_path(
+        X, y, l1_ratio=l1_ratio, n_lambdas=n_lambdas, lambda_min_ratio=lambda_min_ratio,
+        max_iter=max_iter, tol=tol, verbose=verbose
+    )
+    
+    skf = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+    val_scores = np.zeros((cv, len(path['lambdas'])))
+    
+    for i, (train_idx, val_idx) in enumerate(skf.split(X, y)):
+        if verbose:
+            print(f"Fold {i + 1}/{cv}...")
+        
+        fold_path = compute_elastic_net_path(
+            X[train_idx], y[train_idx], l1_ratio=l1_ratio, lambdas=path['lambdas'],
+            max_iter=max_iter, tol=tol, verbose=False
+        )
+        
+        # Tüm λ değerlerinin doğrulama tahminleri tek matris çarpımıyla
+        logits = X[val_idx] @ fold_path['coefs'].T + fold_path['intercepts']
+        val_scores[i] = np.mean((logits > 0) == (positive[val_idx, None] == 1), axis=0)
+    
+    mean_scores = val_scores.mean(axis=0)
+    best_index = int(np.argmax(mean_scores))
+    
+    results_df = pd.DataFrame({
+        'λ': path['lambdas'],
+        'C': path['C_values'],
+        'Aktif Özellik': path['n_active'],
+        'Ortalama Doğruluk': mean_scores,
+        'Std': val_scores.std(axis=0)
+    })
+    
+    best_active = path['coefs'][best_index] != 0
+    best_features = [j for j in path['entry_order'] if best_active[j]]
+    
+    return {
+        'path': path,
+        'val_scores': val_scores,
+        'results_df': results_df,
+        'best_index': best_index,
+        'best_C': float(path['C_values'][best_index]),
+        'best_features': best_features
+    }
+
+
+def get_first_entered_features(path: Dict, feature_names: List[str], top_n: int = 15) -> List[str]:
+    """
+    Yola ilk giren top_n özelliğin isimlerini döndür.
+    
+    Args:
+        path: compute_elastic_net_path çıktısı
+        feature_names: Özellik isimleri (X sütun sırasıyla)
+        top_n: Özellik sayısı
+    
+    Returns:
+        List[str]: Giriş sırasıyla özellik isimleri
+    """
+    return [feature_names[j] for j in path['entry_order'][:top_n]]
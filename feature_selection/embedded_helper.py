@@ -0,0 +1,369 @@
+"""
+Embedded Helper Module
+======================
+Bu modül, gömülü yöntem (ağaç tabanlı modellerin özellik önemleri) için
+hızlı önem hesaplama yöntemlerini ve eğitilmiş model önbelleğini içerir.
+
+Desteklenen yöntemler:
+- forest: Tam Random Forest (100 ağaç, sınırsız derinlik) - referans
+- subsampled_forest: Her ağaç satırların bir alt örneğiyle eğitilir (max_samples)
+- shallow_forest: Derinliği sınırlandırılmış Random Forest (max_depth)
+- hist_gradient_boosting: Histogram tabanlı gradient boosting bölünme kazançları
+
+Eğitilmiş modeller veri parmak izi ve hiperparametrelerle önbelleğe alınır;
+rapor veya grafikler yeniden oluşturulduğunda model tekrar eğitilmez.
+"""
+
+import os
+import json
+import time
+import hashlib
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Dict, List, Optional, Tuple
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+
+
+IMPORTANCE_BACKENDS = {
+    'forest': {
+        'n_estimators': 100,
+        'max_depth': None,
+        'min_samples_split': 2,
+        'min_samples_leaf': 1
+    },
+    'subsampled_forest': {
+        'n_estimators': 100,
+        'max_depth': None,
+        'min_samples_leaf': 1,
+        'max_samples': 0.2
+    },
+    'shallow_forest': {
+        'n_estimators': 100,
+        'max_depth': 12,
+        'min_samples_leaf': 5
+    },
+    'hist_gradient_boosting': {
+        'max_iter': 200,
+        'max_depth': 6,
+        'learning_rate': 0.1,
+        'early_stopping': False
+    }
+}
+
+# HistGradientBoostingClassifier'ın özel ağaç yapısından okunan düğüm alanları
+HIST_GRADIENT_BOOSTING_NODE_FIELDS = ('is_leaf', 'feature_idx', 'gain')
+
+BACKEND_NAMES = {
+    'forest': 'Random Forest (tam)',
+    'subsampled_forest': 'Random Forest (max_samples)',
+    'shallow_forest': 'Random Forest (sınırlı derinlik)',
+    'hist_gradient_boosting': 'Histogram Gradient Boosting'
+}
+
+# Eğitilmiş model önbelleği: {önbellek anahtarı: model}
+_MODEL_CACHE = {}
+
+
+def get_data_fingerprint(X: pd.DataFrame, y: pd.Series) -> str:
+    """
+    Özellik matrisi ve hedef değişkenden veri parmak izi oluştur.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken
+    
+    Returns:
+        str: Hex formatında özet
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    columns = X.columns if isinstance(X, pd.DataFrame) else range(np.shape(X)[1])
+    digest.update(json.dumps([str(c) for c in columns]).encode())
+    
+    if isinstance(X, pd.DataFrame):
+        arrays = [X[c].to_numpy() for c in X.columns]
+    else:
+        arrays = [np.asarray(X)]
+    
+    for array in arrays + [np.asarray(y)]:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    
+    return digest.hexdigest()
+
+
+def get_model_cache_key(fingerprint: str, backend: str, params: Dict) -> str:
+    """
+    Veri parmak izi, yöntem ve hiperparametrelerden model önbellek anahtarını oluştur.
+    
+    Args:
+        fingerprint: get_data_fingerprint çıktısı
+        backend: Önem yöntemi adı
+        params: Model hiperparametreleri
+    
+    Returns:
+        str: Önbellek anahtarı
+    """
+    payload = json.dumps(
+        {'fingerprint': fingerprint, 'backend': backend, 'params': params},
+        sort_keys=True
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def create_importance_model(backend: str, params: Dict, random_state: int = 42):
+    """
+    Önem yöntemine karşılık gelen modeli oluştur.
+    
+    Args:
+        backend: Önem yöntemi adı
+        params: Model hiperparametreleri
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        Eğitilmemiş model
+    """
+    if backend == 'hist_gradient_boosting':
+        return HistGradientBoostingClassifier(random_state=random_state, **params)
+    
+    return RandomForestClassifier(random_state=random_state, n_jobs=-1, **params)
+
+
+def get_hist_gradient_boosting_importances(model: HistGradientBoostingClassifier) -> np.ndarray:
+    """
+    Histogram gradient boosting modelinden bölünme kazancı tabanlı özellik önemlerini hesapla.
+    
+    HistGradientBoostingClassifier feature_importances_ sağlamaz; her ağacın
+    iç düğümlerindeki bölünme kazançları özellik başına toplanır ve toplam
+    1 olacak şekilde normalize edilir.
+    
+    Ağaçlar scikit-learn'ün özel (_predictors) yapısından okunur. Yapı
+    beklenen düğüm alanlarını (HIST_GRADIENT_BOOSTING_NODE_FIELDS) içermezse
+    sessizce yanlış önem üretmek yerine hata verilir.
+    
+    Args:
+        model: Eğitilmiş HistGradientBoostingClassifier
+    
+    Returns:
+        np.ndarray: Özellik önemleri
+    
+    Raises:
+        RuntimeError: Kurulu scikit-learn sürümünün ağaç yapısı desteklenmiyorsa
+    """
+    predictors = getattr(model, '_predictors', None)
+    if predictors is None:
+        raise RuntimeError(
+            "HistGradientBoostingClassifier ağaçlarına erişilemiyor (_predictors yok); "
+            "eğitilmemiş model veya desteklenmeyen scikit-learn sürümü. "
+            "Başka bir yöntem kullanın (örn. 'shallow_forest')."
+        )
+    
+    importances = np.zeros(model.n_features_in_)
+    
+    for iteration in predictors:
+        for predictor in iteration:
+            nodes = getattr(predictor, 'nodes', None)
+            fields = getattr(getattr(nodes, 'dtype', None), 'names', None) or ()
+            missing = [f for f in HIST_GRADIENT_BOOSTING_NODE_FIELDS if f not in fields]
+            if missing:
+                raise RuntimeError(
+                    f"HistGradientBoostingClassifier düğüm yapısında beklenen alanlar yok: {missing}. "
+                    "Kurulu scikit-learn sürümü desteklenmiyor; başka bir yöntem kullanın (örn. 'shallow_forest')."
+                )
+            
+            split_nodes = nodes[~nodes['is_leaf'].astype(bool)]
+            np.add.at(importances, split_nodes['feature_idx'], split_nodes['gain'])
+    
+    total = importances.sum()
+    if total > 0:
+        importances /= total
+    
+    return importances
+
+
+def get_model_importances(model, backend: str) -> np.ndarray:
+    """
+    Eğitilmiş modelden özellik önemlerini al.
+    
+    Args:
+        model: Eğitilmiş model
+        backend: Önem yöntemi adı
+    
+    Returns:
+        np.ndarray: Özellik önemleri
+    """
+    if backend == 'hist_gradient_boosting':
+        return get_hist_gradient_boosting_importances(model)
+    
+    return model.feature_importances_
+
+
+def compute_embedded_importances(
+    X: pd.DataFrame,
+    y: pd.Series,
+    backend: str = 'forest',
+    params: Optional[Dict] = None,
+    random_state: int = 42,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None
+) -> Dict:
+    """
+    Seçilen yöntemle özellik önemlerini hesapla (önbellekli).
+    
+    Aynı veri, yöntem ve hiperparametrelerle daha önce eğitilmiş bir model
+    varsa bellekteki (veya cache_dir verildiyse diskteki) model kullanılır.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken
+        backend: Önem yöntemi (IMPORTANCE_BACKENDS anahtarlarından biri)
+        params: Varsayılan hiperparametrelerin üzerine yazılacak değerler
+        random_state: Rastgelelik için seed değeri
+        use_cache: Model önbelleği kullanılsın mı
+        cache_dir: Eğitilmiş modellerin joblib ile yazılacağı klasör (None ise sadece bellek)
+    
+    Returns:
+        Dict: Sonuçlar
+            - 'backend': Yöntem adı
+            - 'params': Kullanılan hiperparametreler
+            - 'model': Eğitilmiş model
+            - 'importances': Özellik önemleri
+            - 'fit_time': Eğitim süresi (saniye, önbellekten geldiyse 0)
+            - 'from_cache': Model önbellekten mi geldi
+    """
+    if backend not in IMPORTANCE_BACKENDS:
+        raise ValueError(f"Bilinmeyen yöntem: '{backend}'. Seçenekler: {list(IMPORTANCE_BACKENDS)}")
+    
+    model_params = dict(IMPORTANCE_BACKENDS[backend])
+    if params:
+        model_params.update(params)
+    
+    cache_key = None
+    cache_path = None
+    model = None
+    
+    if use_cache:
+        key_params = dict(model_params, random_state=random_state)
+        cache_key = get_model_cache_key(get_data_fingerprint(X, y), backend, key_params)
+        model = _MODEL_CACHE.get(cache_key)
+        
+        if cache_dir is not None:
+            cache_path = os.path.join(cache_dir, f"{backend}_{cache_key}.joblib")
+            if model is None and os.path.exists(cache_path):
+                model = joblib.load(cache_path)
+                _MODEL_CACHE[cache_key] = model
+    
+    from_cache = model is not None
+    fit_time = 0.0
+    
+    if model is None:
+        model = create_importance_model(backend, model_params, random_state=random_state)
+        
+        start_time = time.time()
+        model.fit(X, y)
+        fit_time = time.time() - start_time
+        
+        if cache_key is not None:
+            _MODEL_CACHE[cache_key] = model
+    
+    if cache_path is not None and not os.path.exists(cache_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        joblib.dump(model, cache_path)
+    
+    return {
+        'backend': backend,
+        'params': model_params,
+        'model': model,
+        'importances': get_model_importances(model, backend),
+        'fit_time': fit_time,
+        'from_cache': from_cache
+    }
+
+
+def clear_model_cache() -> None:
+    """
+    Bellekteki eğitilmiş model önbelleğini temizle.
+    """
+    _MODEL_CACHE.clear()
+
+
+def compare_importance_rankings(
+    reference: np.ndarray,
+    candidate: np.ndarray,
+    top_n: int = 15
+) -> Dict:
+    """
+    İki önem vektörünün sıralama uyumunu ölç.
+    
+    Args:
+        reference: Referans önemler (örn. tam Random Forest)
+        candidate: Karşılaştırılacak önemler
+        top_n: İlk N özellik örtüşmesi için N
+    
+    Returns:
+        Dict: 'spearman', 'kendall', 'top_n_overlap' (0-1 arası oran)
+    """
+    reference = np.asarray(reference)
+    candidate = np.asarray(candidate)
+    
+    top_reference = set(np.argsort(-reference, kind='stable')[:top_n])
+    top_candidate = set(np.argsort(-candidate, kind='stable')[:top_n])
+    
+    return {
+        'spearman': stats.spearmanr(reference, candidate)[0],
+        'kendall': stats.kendalltau(reference, candidate)[0],
+        'top_n_overlap': len(top_reference & top_candidate) / top_n
+    }
+
+
+def evaluate_importance_backends(
+    X: pd.DataFrame,
+    y: pd.Series,
+    backends: Optional[List[str]] = None,
+    reference_backend: str = 'forest',
+    top_n: int = 15,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None
+) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
+    """
+    Hızlı önem yöntemlerini referans yönteme göre süre ve sıralama uyumuyla karşılaştır.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken
+        backends: Karşılaştırılacak yöntemler (None ise tümü)
+        reference_backend: Referans yöntem
+        top_n: İlk N özellik örtüşmesi için N
+        use_cache: Model önbelleği kullanılsın mı
+        cache_dir: Model önbelleği klasörü
+    
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Dict]]: (Karşılaştırma tablosu, {yöntem: compute_embedded_importances sonucu})
+    """
+    if backends is None:
+        backends = list(IMPORTANCE_BACKENDS)
+    
+    results = {}
+    for backend in [reference_backend] + [b for b in backends if b != reference_backend]:
+        results[backend] = compute_embedded_importances(
+            X, y, backend=backend, use_cache=use_cache, cache_dir=cache_dir
+        )
+    
+    reference = results[reference_backend]['importances']
+    
+    rows = []
+    for backend, result in results.items():
+        agreement = compare_importance_rankings(reference, result['importances'], top_n=top_n)
+        rows.append({
+            'Yöntem': BACKEND_NAMES.get(backend, backend),
+            'Eğitim Süresi (s)': round(result['fit_time'], 2),
+            'Önbellekten': result['from_cache'],
+            'Spearman': round(agreement['spearman'], 4),
+            'Kendall': round(agreement['kendall'], 4),
+            f'Top-{top_n} Örtüşme': round(agreement['top_n_overlap'], 4)
+        })
+    
+    return pd.DataFrame(rows), results
@@ -0,0 +1,334 @@
+"""
+Stability Helper Module
+=======================
+Bu modül, bootstrap / alt örnekleme ile kararlılık seçimi (stability
+selection) işlemlerini içerir.
+
+Satırlar B kez yeniden örneklenir; her örnek üzerinde filtreleme (Pearson),
+sarmalayıcı (RFE) ve gömülü (Random Forest) sıralayıcılar çalıştırılır ve her
+özelliğin ilk N'e girme sıklığı hesaplanır. Process havuzunda özellik matrisi
+shared_arrays ile tek bir paylaşımlı bellek (shared memory) bloğuna bir kez
+kopyalanır; işçilere sadece yerleşim bilgisi ve yeniden örnekleme numarası
+gönderilir.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from dataset_helper import compute_pearson_correlations, get_feature_ranking
+from embedded_helper import IMPORTANCE_BACKENDS
+from shared_arrays import share_arrays, attach_arrays
+from wrapper_helper import warm_start_rfe
+
+
+STABILITY_METHODS = ('pearson', 'rfe', 'random_forest')
+EXECUTORS = ('serial', 'thread', 'process')
+SHARED_ARRAY_KEYS = ('X', 'y')
+
+METHOD_NAMES = {
+    'pearson': 'Pearson',
+    'rfe': 'RFE',
+    'random_forest': 'Random Forest'
+}
+
+# Process işçilerinde paylaşımlı bellekten oluşturulan veri
+_WORKER_SHARED_MEMORY = None
+_WORKER_DATA = None
+
+
+def share_stability_data(data: Dict) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    Özellik matrisi ve hedef değişkeni tek bir paylaşımlı bellek bloğuna kopyala.
+    
+    Args:
+        data: 'X', 'y' dizileri ve yeniden örnekleme ayarlarını içeren dict
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, İşçilere gönderilecek yerleşim bilgisi)
+    """
+    shm, layout = share_arrays({key: data[key] for key in SHARED_ARRAY_KEYS})
+    layout.update({key: value for key, value in data.items() if key not in SHARED_ARRAY_KEYS})
+    
+    return shm, layout
+
+
+def attach_stability_data(layout: Dict) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """
+    Paylaşımlı bellekteki dizilerden kopyasız bir veri dict'i oluştur.
+    
+    Args:
+        layout: share_stability_data ile oluşturulan yerleşim bilgisi
+    
+    Returns:
+        Tuple: (Paylaşımlı bellek bloğu, Veri dict'i)
+    """
+    shm, arrays = attach_arrays(layout)
+    
+    data = {key: value for key, value in layout.items() if key not in ('name', 'arrays')}
+    data.update(arrays)
+    
+    return shm, data
+
+
+def _init_stability_worker(layout: Dict) -> None:
+    """
+    Process işçisini başlat: paylaşımlı belleğe bağlan.
+    """
+    global _WORKER_SHARED_MEMORY, _WORKER_DATA
+    _WORKER_SHARED_MEMORY, _WORKER_DATA = attach_stability_data(layout)
+
+
+def _run_stability_task(args: tuple) -> np.ndarray:
+    """
+    Process işçisinde görevi paylaşımlı veri ile çalıştır.
+    """
+    return run_stability_task(_WORKER_DATA, *args)
+
+
+def get_resample_indices(
+    n_samples: int,
+    resample_index: int,
+    sample_fraction: float = 0.5,
+    replace: bool = False,
+    random_state: int = 42
+) -> np.ndarray:
+    """
+    Yeniden örnekleme numarasına karşılık gelen satır indislerini üret.
+    
+    İndisler (random_state, resample_index) çiftinden türetilir; bu nedenle
+    görevin hangi işçide çalıştığından bağımsız olarak aynıdır.
+    
+    Args:
+        n_samples: Toplam satır sayısı
+        resample_index: Yeniden örnekleme numarası (0..B-1)
+        sample_fraction: Örneklenecek satır oranı
+        replace: True ise bootstrap (iadeli), False ise alt örnekleme (iadesiz)
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        np.ndarray: Satır indisleri
+    """
+    rng = np.random.default_rng([random_state, resample_index])
+    size = max(2, int(round(sample_fraction * n_samples)))
+    
+    if replace:
+        return rng.integers(0, n_samples, size=size)
+    
+    return np.sort(rng.choice(n_samples, size=size, replace=False))
+
+
+def get_scores_ranks(scores: np.ndarray) -> np.ndarray:
+    """
+    Skorları sıra numaralarına çevir (1 = en yüksek skor).
+    
+    Args:
+        scores: Özellik skorları (büyük = daha önemli)
+    
+    Returns:
+        np.ndarray: Her özelliğin sırası
+    """
+    ranks = np.empty(len(scores), dtype=np.int32)
+    ranks[np.argsort(-scores, kind='stable')] = np.arange(1, len(scores) + 1)
+    
+    return ranks
+
+
+def rank_pearson(X: np.ndarray, y: np.ndarray, top_n: int, params: Dict) -> np.ndarray:
+    """
+    Pearson korelasyonunun mutlak değerine göre özellikleri sırala.
+    """
+    correlations, _ = compute_pearson_correlations(X, y)
+    
+    return get_scores_ranks(np.nan_to_num(np.abs(correlations)))
+
+
+def rank_rfe(X: np.ndarray, y: np.ndarray, top_n: int, params: Dict) -> np.ndarray:
+    """
+    Warm-start RFE (Lojistik Regresyon) ile özellikleri sırala.
+    
+    Seçilen top_n özellik 1. sırayı paylaşır; diğerleri elenme sırasına göre
+    sıralanır (son elenen önce).
+    """
+    X_scaled = StandardScaler().fit_transform(X)
+    rfe_params = dict({'C': 1.0, 'max_iter': 1000}, **params)
+    result = warm_start_rfe(X_scaled, y, n_features_to_select=top_n, verbose=False, **rfe_params)
+    
+    return get_scores_ranks(-result['ranking'].astype(np.float64))
+
+
+def rank_random_forest(X: np.ndarray, y: np.ndarray, top_n: int, params: Dict) -> np.ndarray:
+    """
+    Random Forest özellik önemlerine göre özellikleri sırala.
+    
+    İşçiler zaten paralel çalıştığı için her orman tek çekirdekte (n_jobs=1) eğitilir.
+    """
+    rf_params = dict(IMPORTANCE_BACKENDS['forest'], random_state=42, n_jobs=1)
+    rf_params.update(params)
+    model = RandomForestClassifier(**rf_params)
+    model.fit(X, y)
+    
+    return get_scores_ranks(model.feature_importances_)
+
+
+RANKERS = {
+    'pearson': rank_pearson,
+    'rfe': rank_rfe,
+    'random_forest': rank_random_forest
+}
+
+
+def run_stability_task(data: Dict, method: str, resample_index: int) -> np.ndarray:
+    """
+    Tek bir (yöntem, yeniden örnekleme) görevini çalıştır.
+    
+    Args:
+        data: 'X', 'y' ve yeniden örnekleme ayarlarını içeren dict
+        method: Sıralayıcı yöntem adı
+        resample_index: Yeniden örnekleme numarası
+    
+    Returns:
+        np.ndarray: Bu örnekteki özellik sıraları (1 = en önemli)
+    """
+    indices = get_resample_indices(
+        len(data['y']),
+        resample_index,
+        sample_fraction=data['sample_fraction'],
+        replace=data['replace'],
+        random_state=data['random_state']
+    )
+    
+    ranker = RANKERS[method]
+    
+    return ranker(
+        data['X'][indices],
+        data['y'][indices],
+        data['top_n'],
+        data['method_params'].get(method, {})
+    )
+
+
+def run_stability_selection(
+    X: pd.DataFrame,
+    y: pd.Series,
+    methods: Tuple[str, ...] = STABILITY_METHODS,
+    n_resamples: int = 50,
+    top_n: int = 15,
+    sample_fraction: float = 0.5,
+    replace: bool = False,
+    method_params: Optional[Dict[str, Dict]] = None,
+    executor: str = 'process',
+    n_jobs: Optional[int] = None,
+    random_state: int = 42
+) -> Dict:
+    """
+    Kararlılık seçimi uygula: her yeniden örnekte sıralayıcıları çalıştır ve seçilme sıklıklarını topla.
+    
+    Varsayılan olarak satırların yarısı iadesiz alt örneklenir (klasik
+    stability selection); replace=True ve sample_fraction=1.0 ile bootstrap
+    yapılır. Görevler (yöntem, örnek) çiftleridir ve sonuçlar yürütücüden
+    bağımsız olarak aynıdır.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken
+        methods: Kullanılacak sıralayıcılar ('pearson', 'rfe', 'random_forest')
+        n_resamples: Yeniden örnekleme sayısı (B)
+        top_n: Her örnekte seçilen özellik sayısı
+        sample_fraction: Her örnekteki satır oranı
+        replace: True ise bootstrap (iadeli örnekleme)
+        method_params: Yöntem başına ek parametreler
+            (örn. {'random_forest': {'n_estimators': 50}, 'rfe': {'C': 0.1}})
+        executor: 'serial', 'thread' veya 'process'
+        n_jobs: İşçi sayısı (None ise CPU sayısı)
+        random_state: Rastgelelik için seed değeri
+    
+    Returns:
+        Dict: Kararlılık sonuçları
+            - 'frequencies': Yöntem başına ve birleşik seçilme sıklıkları (DataFrame)
+            - 'ranking_df': Birleşik sıklığa göre get_feature_ranking formatında sıralama
+            - 'ranks': {yöntem: (B, p) sıra matrisi}
+            - 'n_resamples': B
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Bilinmeyen yürütücü: '{executor}'. Seçenekler: {EXECUTORS}")
+    
+    for method in methods:
+        if method not in RANKERS:
+            raise ValueError(f"Bilinmeyen yöntem: '{method}'. Seçenekler: {STABILITY_METHODS}")
+    
+    feature_names = X.columns.tolist()
+    
+    data = {
+        'X': np.ascontiguousarray(X.to_numpy(dtype=np.float64)),
+        'y': np.ascontiguousarray(np.asarray(y)),
+        'top_n': top_n,
+        'sample_fraction': sample_fraction,
+        'replace': replace,
+        'random_state': random_state,
+        'method_params': method_params or {}
+    }
+    
+    tasks = [(method, b) for b in range(n_resamples) for method in methods]
+    
+    print(f"Kararlılık seçimi: {n_resamples} örnek x {len(methods)} yöntem "
+          f"({len(tasks)} görev, yürütücü: {executor})")
+    
+    if executor == 'serial' or len(tasks) <= 1:
+        task_ranks = [run_stability_task(data, *task) for task in tasks]
+    else:
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(tasks))
+        
+        if executor == 'thread':
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                task_ranks = list(pool.map(lambda task: run_stability_task(data, *task), tasks))
+        else:
+            shm, layout = share_stability_data(data)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    initializer=_init_stability_worker,
+                    initargs=(layout,)
+                ) as pool:
+                    task_ranks = list(pool.map(_run_stability_task, tasks))
+            finally:
+                shm.close()
+                shm.unlink()
+    
+    ranks = {method: np.empty((n_resamples, len(feature_names)), dtype=np.int32) for method in methods}
+    for (method, b), task_rank in zip(tasks, task_ranks):
+        ranks[method][b] = task_rank
+    
+    frequencies = pd.DataFrame({'Özellik': feature_names})
+    selection_counts = np.zeros(len(feature_names), dtype=np.int64)
+    for method in methods:
+        method_counts = (ranks[method] <= top_n).sum(axis=0)
+        frequencies[METHOD_NAMES[method]] = method_counts / n_resamples
+        selection_counts += method_counts
+    
+    # Birleşik sıklık tamsayı sayımlardan hesaplanır; yöntem sıklıklarının
+    # ortalaması eşit sıklıklarda kayan nokta farkı verip eşitlik bozmayı atlatırdı
+    frequencies['Birleşik Sıklık'] = selection_counts / (n_resamples * len(methods))
+    frequencies['Ortalama Sıra'] = np.mean([ranks[method].mean(axis=0) for method in methods], axis=0)
+    
+    ranking_df = get_feature_ranking(feature_names, frequencies['Birleşik Sıklık'].to_numpy(), top_n=top_n)
+    
+    # Eşit sıklıktaki (aynı seçilme sayısı) özellikler ortalama sıraya göre sıralanır
+    feature_stats = frequencies.set_index('Özellik').assign(count=selection_counts).loc[ranking_df['Özellik']]
+    order = np.lexsort((feature_stats['Ortalama Sıra'].to_numpy(), -feature_stats['count'].to_numpy()))
+    ranking_df = ranking_df.iloc[order].reset_index(drop=True)
+    ranking_df['Sıra'] = range(1, len(ranking_df) + 1)
+    
+    frequencies = frequencies.set_index('Özellik').loc[ranking_df['Özellik']].reset_index()
+    
+    return {
+        'frequencies': frequencies,
+        'ranking_df': ranking_df,
+        'ranks': ranks,
+        'n_resamples': n_resamples
+    }
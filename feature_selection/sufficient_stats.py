@@ -0,0 +1,327 @@
+"""
+Sufficient Stats Module
+=======================
+Bu modül, özellik seçimi ve ölçeklendirme adımlarının ortak kullandığı
+yeterli istatistikleri (sufficient statistics) içerir.
+
+İstatistikler veri üzerinde tek geçişte (bloklar halinde) hesaplanır:
+örnek sayısı, sütun ortalamaları, merkezlenmiş kareler toplamı, X'in
+merkezlenmiş Gram matrisi (XᵀX) ve Xᵀy. Bloklar Chan vd. formülüyle
+birleştirilir; aynı formülün tersiyle bir parça (örn. bir fold) toplamdan
+çıkarılabilir. Böylece StandardScaler, Pearson korelasyonları ve Gram
+matrisi satırlar üzerinden yeniden geçmeden O(p) / O(p²) işlemle elde edilir.
+
+İstatistik sözlüğünün anahtarları:
+    - 'n': Örnek sayısı
+    - 'mean_x', 'mean_y': Ortalamalar
+    - 'm2_x', 'm2_y': Merkezlenmiş kareler toplamı Σ(x - x̄)²
+    - 'c_xy': Merkezlenmiş Xᵀy, Σ(x - x̄)(y - ȳ)
+    - 'c_xx': Merkezlenmiş Gram matrisi Σ(x - x̄)(x - x̄)ᵀ (with_gram=False ise None)
+
+`evaluate_performance/helpers/sufficient_stats.py` bu modülün CSV okuma ve
+korelasyon fonksiyonları hariç kopyasıdır; ortak fonksiyonların eşitliği
+`tests/test_module_copies.py` ile denetlenir.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+from sklearn.preprocessing import StandardScaler
+
+
+def compute_sufficient_stats(
+    X: np.ndarray,
+    y: Optional[np.ndarray] = None,
+    with_gram: bool = True
+) -> Dict:
+    """
+    Bir satır bloğu için yeterli istatistikleri hesapla.
+    
+    Args:
+        X: Özellik matrisi bloğu (n x p)
+        y: Hedef değişken bloğu (n,); None ise hedef istatistikleri 0 olur
+        with_gram: Merkezlenmiş Gram matrisi (p x p) hesaplansın mı
+    
+    Returns:
+        Dict: Yeterli istatistikler
+    """
+    X = np.asarray(X, dtype=np.float64)
+    n_samples, n_features = X.shape
+    
+    if y is None:
+        y = np.zeros(n_samples)
+    y = np.asarray(y, dtype=np.float64)
+    
+    mean_x = X.mean(axis=0)
+    mean_y = y.mean()
+    X_centered = X - mean_x
+    y_centered = y - mean_y
+    
+    return {
+        'n': n_samples,
+        'mean_x': mean_x,
+        'mean_y': mean_y,
+        'm2_x': np.einsum('ij,ij->j', X_centered, X_centered),
+        'm2_y': y_centered @ y_centered,
+        'c_xy': X_centered.T @ y_centered,
+        'c_xx': X_centered.T @ X_centered if with_gram else None
+    }
+
+
+def merge_sufficient_stats(a: Dict, b: Dict) -> Dict:
+    """
+    İki satır bloğunun yeterli istatistiklerini birleştir (Chan vd. birleştirme formülü).
+    
+    Args:
+        a: compute_sufficient_stats çıktısı
+        b: compute_sufficient_stats çıktısı
+    
+    Returns:
+        Dict: Birleşik istatistikler (Gram matrisi iki tarafta da varsa birleştirilir)
+    """
+    n = a['n'] + b['n']
+    delta_x = b['mean_x'] - a['mean_x']
+    delta_y = b['mean_y'] - a['mean_y']
+    weight = a['n'] * b['n'] / n
+    
+    c_xx = None
+    if a.get('c_xx') is not None and b.get('c_xx') is not None:
+        c_xx = a['c_xx'] + b['c_xx'] + np.outer(delta_x, delta_x * weight)
+    
+    return {
+        'n': n,
+        'mean_x': a['mean_x'] + delta_x * b['n'] / n,
+        'mean_y': a['mean_y'] + delta_y * b['n'] / n,
+        'm2_x': a['m2_x'] + b['m2_x'] + delta_x ** 2 * weight,
+        'm2_y': a['m2_y'] + b['m2_y'] + delta_y ** 2 * weight,
+        'c_xy': a['c_xy'] + b['c_xy'] + delta_x * delta_y * weight,
+        'c_xx': c_xx
+    }
+
+
+def subtract_sufficient_stats(total: Dict, part: Dict) -> Dict:
+    """
+    Bir parçanın (örn. doğrulama fold'u) istatistiklerini toplamdan çıkar.
+    
+    Birleştirme formülünün kalan parça için çözülmüş halidir; fold eğitim
+    kümesinin istatistikleri satırlar üzerinden geçmeden O(p²) (Gram
+    matrisi yoksa O(p)) işlemle elde edilir.
+    
+    Args:
+        total: Tüm verinin istatistikleri
+        part: Toplamın içindeki bir parçanın istatistikleri
+    
+    Returns:
+        Dict: Kalan satırların istatistikleri
+    """
+    n = total['n'] - part['n']
+    if n <= 0:
+        raise ValueError(f"Çıkarılan parça ({part['n']} örnek) toplamdan ({total['n']} örnek) küçük olmalı.")
+    
+    mean_x = total['mean_x'] + (total['mean_x'] - part['mean_x']) * part['n'] / n
+    mean_y = total['mean_y'] + (total['mean_y'] - part['mean_y']) * part['n'] / n
+    delta_x = part['mean_x'] - mean_x
+    delta_y = part['mean_y'] - mean_y
+    weight = n * part['n'] / total['n']
+    
+    c_xx = None
+    if total.get('c_xx') is not None and part.get('c_xx') is not None:
+        c_xx = total['c_xx'] - part['c_xx'] - np.outer(delta_x, delta_x * weight)
+    
+    return {
+        'n': n,
+        'mean_x': mean_x,
+        'mean_y': mean_y,
+        # Yuvarlama hatası küçük negatif değerler üretmesin
+        'm2_x': np.maximum(total['m2_x'] - part['m2_x'] - delta_x ** 2 * weight, 0.0),
+        'm2_y': max(total['m2_y'] - part['m2_y'] - delta_y ** 2 * weight, 0.0),
+        'c_xy': total['c_xy'] - part['c_xy'] - delta_x * delta_y * weight,
+        'c_xx': c_xx
+    }
+
+
+def compute_sufficient_stats_chunked(
+    X: pd.DataFrame,
+    y: Optional[pd.Series] = None,
+    chunksize: Optional[int] = None,
+    with_gram: bool = True
+) -> Dict:
+    """
+    Yeterli istatistikleri satır blokları halinde tek geçişte hesapla.
+    
+    Bellekte sadece bir bloğun float64 kopyası tutulur.
+    
+    Args:
+        X: Özellikler
+        y: Hedef değişken (None olabilir)
+        chunksize: Blok başına satır sayısı (None ise tek blok)
+        with_gram: Gram matrisi hesaplansın mı
+    
+    Returns:
+        Dict: Yeterli istatistikler
+    """
+    n_rows = len(X)
+    y = None if y is None else np.asarray(y)
+    
+    if chunksize is None or chunksize >= n_rows:
+        chunksize = n_rows
+    
+    sufficient_stats = None
+    
+    for start in range(0, n_rows, chunksize):
+        stop = min(start + chunksize, n_rows)
+        
+        if isinstance(X, pd.DataFrame):
+            X_chunk = X.iloc[start:stop].to_numpy(dtype=np.float64)
+        else:
+            X_chunk = X[start:stop]
+        
+        chunk_stats = compute_sufficient_stats(
+            X_chunk, None if y is None else y[start:stop], with_gram=with_gram
+        )
+        
+        if sufficient_stats is None:
+            sufficient_stats = chunk_stats
+        else:
+            sufficient_stats = merge_sufficient_stats(sufficient_stats, chunk_stats)
+    
+    return sufficient_stats
+
+
+def compute_sufficient_stats_from_csv(
+    filepath: str,
+    target_column: str = "is_popular",
+    chunksize: int = 100_000,
+    with_gram: bool = True
+) -> Tuple[list, Dict]:
+    """
+    Bellekten büyük CSV dosyaları için yeterli istatistikleri bloklar halinde okuyarak hesapla.
+    
+    Args:
+        filepath: CSV dosya yolu
+        target_column: Hedef değişken sütunu adı
+        chunksize: Blok başına satır sayısı
+        with_gram: Gram matrisi hesaplansın mı
+    
+    Returns:
+        Tuple[list, Dict]: (Özellik isimleri, Yeterli istatistikler)
+    """
+    feature_names = None
+    sufficient_stats = None
+    
+    for chunk in pd.read_csv(filepath, chunksize=chunksize):
+        if target_column not in chunk.columns:
+            raise ValueError(f"Hedef sütun '{target_column}' veri kümesinde bulunamadı.")
+        
+        if feature_names is None:
+            feature_names = [c for c in chunk.columns if c != target_column]
+        
+        chunk_stats = compute_sufficient_stats(
+            chunk[feature_names].to_numpy(dtype=np.float64),
+            chunk[target_column].to_numpy(),
+            with_gram=with_gram
+        )
+        
+        if sufficient_stats is None:
+            sufficient_stats = chunk_stats
+        else:
+            sufficient_stats = merge_sufficient_stats(sufficient_stats, chunk_stats)
+    
+    return feature_names, sufficient_stats
+
+
+def get_scale_from_stats(sufficient_stats: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    İstatistiklerden StandardScaler ile aynı ortalama ve ölçek değerlerini hesapla.
+    
+    Varyans popülasyon varyansıdır (ddof=0). StandardScaler ile aynı kural
+    kullanılır: varyansı hesaplama hatası sınırının altında kalan (sabit)
+    sütunların ölçeği 1 yapılır.
+    
+    Args:
+        sufficient_stats: Yeterli istatistikler
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Ortalamalar, Ölçekler)
+    """
+    n_samples = sufficient_stats['n']
+    mean = sufficient_stats['mean_x']
+    variance = sufficient_stats['m2_x'] / n_samples
+    
+    eps = np.finfo(np.float64).eps
+    constant = variance <= n_samples * eps * variance + (n_samples * mean * eps) ** 2
+    
+    scale = np.sqrt(variance)
+    scale[constant] = 1.0
+    
+    return mean, scale
+
+
+def create_scaler_from_stats(
+    sufficient_stats: Dict,
+    feature_names: Optional[list] = None
+) -> StandardScaler:
+    """
+    İstatistiklerden eğitilmiş (fit edilmiş) bir StandardScaler oluştur.
+    
+    Veri üzerinden geçilmez; sonuç scaler.fit(X) ile aynıdır ve transform /
+    inverse_transform doğrudan kullanılabilir.
+    
+    Args:
+        sufficient_stats: Yeterli istatistikler
+        feature_names: Sütun isimleri (DataFrame ile transform için)
+    
+    Returns:
+        StandardScaler: Eğitilmiş scaler
+    """
+    mean, scale = get_scale_from_stats(sufficient_stats)
+    
+    scaler = StandardScaler()
+    scaler.mean_ = mean.copy()
+    scaler.var_ = sufficient_stats['m2_x'] / sufficient_stats['n']
+    scaler.scale_ = scale
+    scaler.n_samples_seen_ = sufficient_stats['n']
+    scaler.n_features_in_ = len(mean)
+    if feature_names is not None:
+        scaler.feature_names_in_ = np.asarray(feature_names, dtype=object)
+    
+    return scaler
+
+
+def get_standardized_gram(sufficient_stats: Dict) -> np.ndarray:
+    """
+    Ölçeklenmiş (StandardScaler) verinin Gram matrisini istatistiklerden hesapla.
+    
+    Ölçeklenmiş sütunların ortalaması 0 olduğundan Zᵀ Z = D⁻¹ C_xx D⁻¹'dir
+    (D: ölçekler).
+    
+    Args:
+        sufficient_stats: Gram matrisi içeren yeterli istatistikler
+    
+    Returns:
+        np.ndarray: Zᵀ Z (p x p)
+    """
+    if sufficient_stats.get('c_xx') is None:
+        raise ValueError("İstatistikler Gram matrisi içermiyor (with_gram=True ile hesaplayın).")
+    
+    _, scale = get_scale_from_stats(sufficient_stats)
+    
+    return sufficient_stats['c_xx'] / np.outer(scale, scale)
+
+
+def get_correlations_from_stats(sufficient_stats: Dict) -> np.ndarray:
+    """
+    Özellik - hedef Pearson korelasyonlarını istatistiklerden hesapla.
+    
+    Sabit sütunlar için sonuç NaN'dir.
+    
+    Args:
+        sufficient_stats: Yeterli istatistikler
+    
+    Returns:
+        np.ndarray: Korelasyonlar (p,)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlations = sufficient_stats['c_xy'] / np.sqrt(sufficient_stats['m2_x'] * sufficient_stats['m2_y'])
+    
+    return np.clip(correlations, -1.0, 1.0)
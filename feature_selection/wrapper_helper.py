@@ -0,0 +1,564 @@
+"""
+Wrapper Helper Module
+=====================
+Bu modül, sarmalayıcı yöntem (RFE + Lojistik Regresyon) için warm-start
+destekli özellik eleme fonksiyonlarını içerir.
+
+sklearn RFE her eleme adımında modeli sıfırdan eğitir. Burada her adım, bir
+önceki adımın katsayılarıyla (elenen özelliklerin ağırlıkları çıkarılarak)
+başlatılır; kalan özelliklerin çözümü bir adımdan diğerine az değiştiği için
+optimizasyon birkaç iterasyonda yakınsar. Çok sayıda sütun içeren veri
+kümelerinde ilk adımlarda birden fazla özellik elenebilir.
+
+Ayrıca ileri / geri sıralı seçim (sequential feature selection) içerir:
+aday özellikler, bir kez hesaplanan Gram matrisi üzerinden lojistik kaybın
+kuadratik yaklaşımıyla puanlanır; sadece kabul edilen adımda model yeniden
+eğitilir.
+"""
+
+import copy
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.special import expit
+from typing import Dict, List, Optional, Tuple, Union
+from sklearn.linear_model import LogisticRegression
+
+from sufficient_stats import get_standardized_gram
+
+
+SEQUENTIAL_DIRECTIONS = ('forward', 'backward')
+
+
+def get_elimination_count(
+    n_remaining: int,
+    n_features_to_select: int,
+    step: Union[int, float],
+    early_step: Union[int, float],
+    early_until: int
+) -> int:
+    """
+    Bir eleme adımında çıkarılacak özellik sayısını hesapla.
+    
+    Args:
+        n_remaining: Kalan özellik sayısı
+        n_features_to_select: Hedef özellik sayısı
+        step: Son aşamadaki adım (int: özellik sayısı, float: kalanların oranı)
+        early_step: Erken aşamadaki adım (int: özellik sayısı, float: kalanların oranı)
+        early_until: Kalan özellik sayısı bu değerin üzerindeyken early_step kullanılır
+    
+    Returns:
+        int: Bu adımda elenecek özellik sayısı
+    """
+    current_step = early_step if n_remaining > early_until else step
+    
+    if isinstance(current_step, float) and 0.0 < current_step < 1.0:
+        count = int(current_step * n_remaining)
+    else:
+        count = int(current_step)
+    
+    return max(1, min(count, n_remaining - n_features_to_select))
+
+
+def warm_start_rfe(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_features_to_select: int = 15,
+    step: Union[int, float] = 1,
+    early_step: Union[int, float] = 1,
+    early_until: Optional[int] = None,
+    C: float = 1.0,
+    max_iter: int = 1000,
+    solver: str = 'lbfgs',
+    tol: float = 1e-4,
+    random_state: int = 42,
+    verbose: bool = True
+) -> Dict:
+    """
+    Warm-start ile RFE (Recursive Feature Elimination) uygula.
+    
+    Eleme kuralı sklearn RFE ile aynıdır: her adımda en küçük mutlak
+    katsayıya sahip özellik(ler) elenir ve ranking_ aynı şekilde oluşturulur
+    (1 = seçildi, aynı adımda elenenler aynı sırayı paylaşır). Farklı olarak
+    her adımdaki model bir önceki adımın katsayılarından başlar.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi
+        y: Hedef değişken
+        n_features_to_select: Seçilecek özellik sayısı
+        step: Son aşamada her adımda elenecek özellik sayısı (float ise kalanların oranı)
+        early_step: Erken aşamada her adımda elenecek özellik sayısı (float ise kalanların oranı)
+        early_until: Kalan özellik sayısı bu değere inene kadar early_step
+            kullanılır (None ise 2 * n_features_to_select)
+        C: Regularization parametresi
+        max_iter: Maksimum iterasyon sayısı
+        solver: Optimizasyon algoritması (warm-start destekleyen: lbfgs, newton-cg, sag, saga)
+        tol: Optimizasyon durma toleransı (sklearn varsayılanı). Küçük bir
+            katsayı elendiğinde gradyan tolerans altında kalabilir ve model
+            o adımda güncellenmez; daha sıkı tolerans (örn. 1e-6) verilebilir.
+        random_state: Rastgelelik için seed değeri
+        verbose: Adım bilgilerini yazdır
+    
+    Returns:
+        Dict: RFE sonuçları
+            - 'support': Seçilen özellik maskesi
+            - 'ranking': Özellik sıraları (sklearn RFE ranking_ ile aynı anlamda)
+            - 'estimator': Seçilen özelliklerle eğitilmiş model
+            - 'elimination_order': Elenme sırasıyla özellik indisleri
+            - 'n_iter': Her adımdaki optimizasyon iterasyon sayısı
+    """
+    X = np.asarray(X)
+    y = np.asarray(y)
+    n_features = X.shape[1]
+    
+    if early_until is None:
+        early_until = 2 * n_features_to_select
+    
+    support = np.ones(n_features, dtype=bool)
+    ranking = np.ones(n_features, dtype=int)
+    elimination_order = []
+    n_iter = []
+    
+    model = LogisticRegression(
+        C=C,
+        max_iter=max_iter,
+        solver=solver,
+        tol=tol,
+        random_state=random_state,
+        warm_start=True
+    )
+    
+    while True:
+        features = np.flatnonzero(support)
+        model.fit(X[:, features], y)
+        n_iter.append(int(model.n_iter_[0]))
+        
+        if len(features) <= n_features_to_select:
+            break
+        
+        # En küçük mutlak katsayılı özellikler elenir (sklearn RFE ile aynı sıralama)
+        importances = np.abs(model.coef_[0])
+        ranks = np.argsort(importances)
+        threshold = get_elimination_count(
+            len(features), n_features_to_select, step, early_step, early_until
+        )
+        
+        eliminated = ranks[:threshold]
+        support[features[eliminated]] = False
+        ranking[~support] += 1
+        elimination_order.extend(features[eliminated].tolist())
+        
+        # Warm-start: elenen özelliklerin katsayıları çıkarılır
+        keep = np.ones(len(features), dtype=bool)
+        keep[eliminated] = False
+        model.coef_ = model.coef_[:, keep]
+        
+        if verbose:
+            print(f"  Kalan özellik: {support.sum():4d} | "
+                  f"Elenen: {threshold:3d} | İterasyon: {n_iter[-1]:4d}")
+    
+    return {
+        'support': support,
+        'ranking': ranking,
+        'estimator': model,
+        'elimination_order': elimination_order,
+        'n_iter': n_iter
+    }
+
+
+def get_logistic_loss(
+    model: LogisticRegression,
+    X: np.ndarray,
+    y: np.ndarray
+) -> float:
+    """
+    Modelin eğitim verisindeki ortalama log-loss değerini hesapla.
+    
+    Args:
+        model: Eğitilmiş ikili LogisticRegression
+        X: Modelin eğitildiği özellikler
+        y: Hedef değişken (0/1)
+    
+    Returns:
+        float: Ortalama log-loss
+    """
+    logits = X @ model.coef_[0] + model.intercept_[0]
+    
+    # log(1 + exp(-s * logit)), s = +1 / -1
+    signs = np.where(y == model.classes_[1], 1.0, -1.0)
+    
+    return float(np.mean(np.logaddexp(0.0, -signs * logits)))
+
+
+def _minimize_along_directions(
+    offsets: np.ndarray,
+    directions: np.ndarray,
+    y: np.ndarray,
+    penalty_terms: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    alpha: float,
+    step_sizes: np.ndarray,
+    newton_steps: int
+) -> np.ndarray:
+    """
+    Her aday için lojistik kaybı tek boyutlu bir doğru boyunca Newton ile küçült.
+    
+    j. aday için logit z_j(t) = offsets_j + t * directions_j ve ceza terimi
+    alpha / 2 * ||u_j + t v_j||²'dir (uu, uv, vv ile verilir). Kayıp t'ye
+    göre konveks olduğundan birkaç Newton adımı yeterlidir. Başlangıç ve son
+    noktadaki kayıplar gerçek katsayı vektörlerine karşılık gelir; küçük
+    olan döner.
+    
+    Args:
+        offsets: Başlangıç logitleri (n, m) veya (n, 1)
+        directions: Logit yönleri (n, m)
+        y: Hedef değişken (0/1)
+        penalty_terms: (uu, uv, vv) dizileri (m,)
+        alpha: Ceza katsayısı (1 / C)
+        step_sizes: Başlangıç t değerleri (m,)
+        newton_steps: Newton adımı sayısı
+    
+    Returns:
+        np.ndarray: Adaylar için bulunan en küçük toplam kayıp (m,)
+    """
+    uu, uv, vv = penalty_terms
+    signs = (2.0 * y - 1.0)[:, None]
+    
+    def get_losses(t):
+        logits = offsets + t * directions
+        return np.logaddexp(0.0, -signs * logits).sum(axis=0) + 0.5 * alpha * (uu + 2 * t * uv + t ** 2 * vv)
+    
+    t = step_sizes.copy()
+    initial_losses = get_losses(t)
+    
+    if newton_steps == 0:
+        return initial_losses
+    
+    for _ in range(newton_steps):
+        probabilities = expit(offsets + t * directions)
+        first = (directions * (probabilities - y[:, None])).sum(axis=0) + alpha * (uv + t * vv)
+        second = (directions ** 2 * probabilities * (1.0 - probabilities)).sum(axis=0) + alpha * vv
+        t = t - first / second
+    
+    # Başlangıç noktası da gerçek bir katsayı vektörüdür; küçük olan alınır
+    return np.minimum(initial_losses, get_losses(t))
+
+
+def sequential_feature_selection(
+    X: np.ndarray,
+    y: np.ndarray,
+    direction: str = 'forward',
+    n_features_to_select: int = 15,
+    C: float = 1.0,
+    max_iter: int = 1000,
+    solver: str = 'lbfgs',
+    tol: float = 1e-4,
+    newton_steps: int = 3,
+    random_state: int = 42,
+    verbose: bool = True,
+    sufficient_stats: Optional[Dict] = None
+) -> Dict:
+    """
+    İleri veya geri sıralı özellik seçimi uygula ve tam 1..p yolunu hesapla.
+    
+    Saf uygulama her adımda her aday için modeli yeniden eğitir (O(p²) tam
+    eğitim). Burada adaylar bir kez hesaplanan ölçeklenmiş Gram matrisi
+    üzerinden puanlanır; eğrilik olarak lojistik Hessian'ın üst sınırı
+    H = 0.25 * [1, X]ᵀ[1, X] + I / C (Böhning sınırı) kullanılır:
+    
+    - İleri: j adayı için yön, j katsayısını t kadar artırıp seçilmiş
+      katsayıları -t * H_SS⁻¹ H_Sj kadar düzelten kuadratik optimum yönüdür;
+      H_SS'in Cholesky çarpanı her kabul edilen özellikle rank-one (sınır)
+      güncellemesiyle büyütülür.
+    - Geri: j çıkarıldığında diğer katsayılar -w_j * H⁻¹[:, j] / H⁻¹[j, j]
+      kadar düzeltilir; çıkarılan özellik H⁻¹'den rank-one güncellemesiyle
+      silinir.
+    
+    Kuadratik yaklaşım ağır kuyruklu sütunlarda kazancı ciddi şekilde
+    eksik tahmin edebildiği için, her adayın gerçek lojistik kaybı bu yön
+    boyunca newton_steps adım tek boyutlu Newton ile küçültülür (tüm adaylar
+    için vektörel). Bulunan kayıp gerçek bir katsayı vektörüne aittir; yani
+    ileri yönde kazancın alt sınırı, geri yönde kayıp artışının üst sınırıdır.
+    newton_steps=0 saf kuadratik yaklaşımdır. Model sadece kabul edilen
+    değişiklikten sonra (warm-start ile) yeniden eğitilir.
+    
+    Args:
+        X: Ölçeklenmiş özellik matrisi
+        y: Hedef değişken (ikili)
+        direction: 'forward' (ileri) veya 'backward' (geri)
+        n_features_to_select: Seçilecek özellik sayısı ('support' ve 'estimator' için)
+        C: Regularization parametresi
+        max_iter: Maksimum iterasyon sayısı
+        solver: Optimizasyon algoritması (warm-start destekleyen: lbfgs, newton-cg, sag, saga)
+        tol: Optimizasyon durma toleransı
+        newton_steps: Aday başına tek boyutlu Newton adımı sayısı
+        random_state: Rastgelelik için seed değeri
+        verbose: Adım bilgilerini yazdır
+        sufficient_stats: X'in ölçeklenmemiş halinin Gram matrisli yeterli
+            istatistikleri (sufficient_stats modülü). Verilirse Gram matrisi
+            satırlar üzerinden yeniden hesaplanmaz; X bu istatistiklerden
+            oluşturulan scaler ile ölçeklenmiş olmalıdır
+    
+    Returns:
+        Dict: Sıralı seçim sonuçları
+            - 'support': n_features_to_select özellikli alt küme maskesi
+            - 'ranking': Özellik sıraları; n özellikli alt küme ranking <= n
+              olan özelliklerdir (compute_rfe_path(ranking=...) ile kullanılabilir)
+            - 'estimator': Seçilen özelliklerle eğitilmiş model
+            - 'order': İleri yönde eklenme, geri yönde çıkarılma sırasıyla özellik
+              indisleri (geri yönde son eleman en son kalan özelliktir)
+            - 'path': 1..p her özellik sayısı için dict listesi ('n_features',
+              'features', 'loss': eğitim log-loss, 'approx_change': bir önceki
+              adımdan bu alt kümeye geçişte tahmin edilen ortalama kayıp değişimi)
+    """
+    if direction not in SEQUENTIAL_DIRECTIONS:
+        raise ValueError(f"Bilinmeyen yön: '{direction}'. Seçenekler: {SEQUENTIAL_DIRECTIONS}")
+    
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    n_samples, n_features = X.shape
+    n_features_to_select = min(n_features_to_select, n_features)
+    
+    # Kesişim (indis 0) dahil genişletilmiş Hessian sınırı: 0.25 * [1, X]ᵀ[1, X] + I / C
+    hessian = np.empty((n_features + 1, n_features + 1))
+    hessian[0, 0] = n_samples
+    if sufficient_stats is not None:
+        # Ölçeklenmiş sütunların toplamı 0, Gram matrisi D⁻¹ C_xx D⁻¹
+        hessian[0, 1:] = hessian[1:, 0] = 0.0
+        hessian[1:, 1:] = get_standardized_gram(sufficient_stats)
+    else:
+        hessian[0, 1:] = hessian[1:, 0] = X.sum(axis=0)
+        hessian[1:, 1:] = X.T @ X
+    hessian *= 0.25
+    hessian[np.arange(1, n_features + 1), np.arange(1, n_features + 1)] += 1.0 / C
+    
+    model = LogisticRegression(
+        C=C,
+        max_iter=max_iter,
+        solver=solver,
+        tol=tol,
+        random_state=random_state,
+        warm_start=True
+    )
+    
+    # Pozitif sınıf göstergesi (0/1)
+    positive = (y == np.unique(y)[-1]).astype(np.float64)
+    
+    if direction == 'forward':
+        result = _forward_selection(X, y, positive, hessian, model, C, n_features_to_select, newton_steps, verbose)
+    else:
+        result = _backward_selection(X, y, positive, hessian, model, C, n_features_to_select, newton_steps, verbose)
+    
+    result['support'] = result['ranking'] <= n_features_to_select
+    
+    return result
+
+
+def _forward_selection(
+    X: np.ndarray,
+    y: np.ndarray,
+    positive: np.ndarray,
+    hessian: np.ndarray,
+    model: LogisticRegression,
+    C: float,
+    n_features_to_select: int,
+    newton_steps: int,
+    verbose: bool
+) -> Dict:
+    """
+    İleri sıralı seçim: Cholesky sınır güncellemeleriyle aday puanlama.
+    """
+    n_samples, n_features = X.shape
+    alpha = 1.0 / C
+    
+    selected = []
+    path = []
+    estimator = None
+    
+    # Başlangıç: sadece kesişim. L: H_SS'in Cholesky çarpanı, V = L⁻¹ H[S, :]
+    cholesky = np.array([[np.sqrt(hessian[0, 0])]])
+    v_rows = hessian[:1] / cholesky[0, 0]
+    schur = np.diag(hessian) - v_rows[0] ** 2
+    
+    mean = positive.mean()
+    logits = np.full(n_samples, np.log(mean / (1.0 - mean)))
+    weights = np.zeros(0)
+    current_loss = np.logaddexp(0.0, -(2.0 * positive - 1.0) * logits).sum()
+    
+    available = np.ones(n_features, dtype=bool)
+    
+    for step in range(n_features):
+        candidates = np.flatnonzero(available)
+        columns = candidates + 1
+        
+        # Kuadratik optimum yönü: seçilmiş katsayı düzeltmesi D = -H_SS⁻¹ H[S, j]
+        corrections = -solve_triangular(cholesky.T, v_rows[:, columns], lower=False)
+        design = np.column_stack([np.ones(n_samples), X[:, selected]])
+        directions = X[:, candidates] + design @ corrections
+        
+        gradient = X[:, candidates].T @ (positive - expit(logits))
+        feature_corrections = corrections[1:]
+        penalty_terms = (
+            np.full(len(candidates), weights @ weights),
+            weights @ feature_corrections,
+            1.0 + (feature_corrections ** 2).sum(axis=0)
+        )
+        candidate_losses = _minimize_along_directions(
+            logits[:, None], directions, positive, penalty_terms, alpha,
+            gradient / schur[columns], newton_steps
+        )
+        gains = (current_loss + 0.5 * alpha * weights @ weights) - candidate_losses
+        best_position = int(np.argmax(gains))
+        best = int(candidates[best_position])
+        
+        # Cholesky sınır güncellemesi: yeni satır [l, sqrt(s_j)], V'ye yeni satır
+        column = best + 1
+        l_row = v_rows[:, column]
+        l_new = np.sqrt(schur[column])
+        v_new = (hessian[column] - l_row @ v_rows) / l_new
+        
+        size = cholesky.shape[0]
+        grown = np.zeros((size + 1, size + 1))
+        grown[:size, :size] = cholesky
+        grown[size, :size] = l_row
+        grown[size, size] = l_new
+        cholesky = grown
+        v_rows = np.vstack([v_rows, v_new])
+        schur = schur - v_new ** 2
+        
+        selected.append(best)
+        available[best] = False
+        
+        # Sadece kabul edilen özellik için tam eğitim (önceki katsayılardan başlar)
+        if step > 0:
+            model.coef_ = np.hstack([model.coef_, np.zeros((1, 1))])
+        X_selected = X[:, selected]
+        model.fit(X_selected, y)
+        
+        weights = model.coef_[0]
+        logits = X_selected @ weights + model.intercept_[0]
+        current_loss = np.logaddexp(0.0, -(2.0 * positive - 1.0) * logits).sum()
+        loss = current_loss / n_samples
+        
+        path.append({
+            'n_features': len(selected),
+            'features': list(selected),
+            'loss': float(loss),
+            'approx_change': -float(gains[best_position]) / n_samples
+        })
+        
+        if len(selected) == n_features_to_select:
+            estimator = copy.deepcopy(model)
+        
+        if verbose:
+            print(f"  Özellik sayısı: {len(selected):4d} | Eklenen: {best:4d} | Log-loss: {loss:.6f}")
+    
+    ranking = np.empty(n_features, dtype=int)
+    ranking[selected] = np.arange(1, n_features + 1)
+    
+    return {
+        'ranking': ranking,
+        'estimator': estimator,
+        'order': selected,
+        'path': path
+    }
+
+
+def _backward_selection(
+    X: np.ndarray,
+    y: np.ndarray,
+    positive: np.ndarray,
+    hessian: np.ndarray,
+    model: LogisticRegression,
+    C: float,
+    n_features_to_select: int,
+    newton_steps: int,
+    verbose: bool
+) -> Dict:
+    """
+    Geri sıralı seçim: H⁻¹ rank-one güncellemeleriyle aday puanlama.
+    """
+    n_samples, n_features = X.shape
+    alpha = 1.0 / C
+    
+    remaining = list(range(n_features))
+    removed = []
+    path = []
+    estimator = None
+    
+    # Kesişim dahil H⁻¹ (indis 0 = kesişim)
+    hessian_inverse = cho_solve(cho_factor(hessian), np.eye(n_features + 1))
+    
+    model.fit(X, y)
+    approx_change = 0.0
+    
+    while True:
+        X_remaining = X[:, remaining]
+        weights = model.coef_[0]
+        logits = X_remaining @ weights + model.intercept_[0]
+        current_loss = np.logaddexp(0.0, -(2.0 * positive - 1.0) * logits).sum()
+        loss = current_loss / n_samples
+        
+        path.append({
+            'n_features': len(remaining),
+            'features': list(remaining),
+            'loss': float(loss),
+            'approx_change': approx_change
+        })
+        
+        if verbose and removed:
+            print(f"  Özellik sayısı: {len(remaining):4d} | Çıkarılan: {removed[-1]:4d} | Log-loss: {loss:.6f}")
+        
+        if len(remaining) == n_features_to_select:
+            estimator = copy.deepcopy(model)
+        
+        if len(remaining) == 1:
+            break
+        
+        # j çıkarıldığında kuadratik optimum düzeltme: -w_j * H⁻¹[:, j] / H⁻¹[j, j]
+        # (j. bileşen -w_j; diğer bileşenler b_j yönünde, t = 1 kuadratik optimum)
+        diagonal = np.diag(hessian_inverse)[1:]
+        adjustments = -hessian_inverse[:, 1:] * (weights / diagonal)
+        adjustments[1 + np.arange(len(remaining)), np.arange(len(remaining))] = 0.0
+        
+        design = np.column_stack([np.ones(n_samples), X_remaining])
+        offsets = logits[:, None] - X_remaining * weights
+        directions = design @ adjustments
+        
+        feature_weights = np.where(np.eye(len(remaining), dtype=bool), 0.0, weights[:, None])
+        feature_adjustments = adjustments[1:]
+        penalty_terms = (
+            (feature_weights ** 2).sum(axis=0),
+            (feature_weights * feature_adjustments).sum(axis=0),
+            (feature_adjustments ** 2).sum(axis=0)
+        )
+        candidate_losses = _minimize_along_directions(
+            offsets, directions, positive, penalty_terms, alpha,
+            np.ones(len(remaining)), newton_steps
+        )
+        costs = candidate_losses - (current_loss + 0.5 * alpha * weights @ weights)
+        worst = int(np.argmin(costs))
+        approx_change = float(costs[worst]) / n_samples
+        
+        # H⁻¹ rank-one güncellemesi: r. satır / sütun silinir
+        r = worst + 1
+        keep = np.arange(len(remaining) + 1) != r
+        column = hessian_inverse[keep, r]
+        hessian_inverse = hessian_inverse[np.ix_(keep, keep)] - np.outer(column, column) / hessian_inverse[r, r]
+        
+        removed.append(remaining.pop(worst))
+        
+        # Sadece kabul edilen çıkarma için tam eğitim (kalan katsayılardan başlar)
+        model.coef_ = model.coef_[:, keep[1:]]
+        model.fit(X[:, remaining], y)
+    
+    order = removed + remaining
+    ranking = np.empty(n_features, dtype=int)
+    ranking[order] = np.arange(n_features, 0, -1)
+    
+    path.reverse()
+    
+    return {
+        'ranking': ranking,
+        'estimator': estimator,
+        'order': order,
+        'path': path
+    }
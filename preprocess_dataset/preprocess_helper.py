@@ -0,0 +1,370 @@
+"""
+Preprocess Helper Module
+========================
+Bu modül, ham veri kümesini parça parça (chunk) okuyarak ön işleyen ve
+sütun veri tiplerini küçülten fonksiyonları içerir.
+
+Ön işleme adımları data_preprocessing.ipynb ile aynıdır:
+1. Sütun isimlerindeki boşluklar temizlenir
+2. `url` ve `timedelta` sütunları çıkarılır
+3. `shares >= 1400` ise `is_popular = 1`, değilse 0
+4. `shares` sütunu çıkarılır
+
+Ham dosya sabit boyutlu parçalar halinde işlendiği için bellek kullanımı
+dosya boyutundan bağımsızdır. İşlem sonunda, işlenmiş CSV'nin yanına
+`<dosya>.csv.dtypes.json` adında bir veri tipi şeması yazılır. Veri kümesi
+yükleyicileri bu şemayı kullanarak ikili sütunları uint8, sürekli sütunları
+float32 olarak okur.
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+COLUMNS_TO_REMOVE = ['url', 'timedelta']
+SHARES_COLUMN = 'shares'
+TARGET_COLUMN = 'is_popular'
+THRESHOLD = 1400
+
+BINARY_PREFIXES = ('data_channel_is_', 'weekday_is_')
+BINARY_COLUMNS = ('is_weekend', TARGET_COLUMN)
+
+DTYPES_SUFFIX = ".dtypes.json"
+
+# float32 ile tam olarak temsil edilebilen en büyük tamsayı (2^24)
+FLOAT32_MAX_EXACT_INT = 2 ** 24
+
+
+def get_dataset_dir() -> str:
+    """
+    Dataset klasörünün yolunu döndür.
+    
+    Returns:
+        str: dataset_files klasörünün mutlak yolu
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "..", "dataset_files")
+
+
+def get_dtypes_path(csv_path: str) -> str:
+    """
+    CSV dosyasına karşılık gelen veri tipi şeması dosyasının yolunu döndür.
+    
+    Args:
+        csv_path: CSV dosyasının yolu
+    
+    Returns:
+        str: Şema dosyasının yolu
+    """
+    return csv_path + DTYPES_SUFFIX
+
+
+def is_binary_column(column: str) -> bool:
+    """
+    Sütunun ikili (0/1) bir gösterge sütunu olup olmadığını isminden belirle.
+    
+    Args:
+        column: Sütun adı
+    
+    Returns:
+        bool: data_channel_is_*, weekday_is_*, is_weekend veya hedef sütun ise True
+    """
+    return column.startswith(BINARY_PREFIXES) or column in BINARY_COLUMNS
+
+
+def preprocess_chunk(chunk: pd.DataFrame, threshold: int = THRESHOLD) -> pd.DataFrame:
+    """
+    Ham veri kümesinin bir parçasını ön işle.
+    
+    Args:
+        chunk: Ham veri parçası
+        threshold: Popülerlik eşik değeri (shares >= threshold → 1)
+    
+    Returns:
+        pd.DataFrame: İşlenmiş veri parçası (özellikler + is_popular)
+    """
+    # Sütun isimlerini temizle (baştaki ve sondaki boşlukları kaldır);
+    # çağıranın DataFrame'i değiştirilmez
+    chunk = chunk.rename(columns=str.strip)
+    
+    # Ayırt edici bilgi içermeyen sütunları çıkar
+    existing_columns_to_remove = [col for col in COLUMNS_TO_REMOVE if col in chunk.columns]
+    chunk = chunk.drop(columns=existing_columns_to_remove)
+    
+    # Binary sınıf oluştur ve shares sütununu kaldır
+    chunk[TARGET_COLUMN] = (chunk[SHARES_COLUMN] >= threshold).astype(int)
+    chunk = chunk.drop(columns=[SHARES_COLUMN])
+    
+    return chunk
+
+
+def _is_decimal_roundtrip(values: np.ndarray, downcast: np.ndarray) -> bool:
+    """
+    float64 değerlerin ondalık gösteriminin float32 karşılıklarından aynen
+    geri elde edilip edilemediğini kontrol et (örn. 0.1 → float32 → "0.1").
+    """
+    if not np.all(np.isfinite(downcast)):
+        return False
+    
+    values, index = np.unique(values, return_index=True)
+    parsed = downcast[index].astype(str).astype(np.float64)
+    
+    return bool(np.all(parsed == values))
+
+
+def infer_compact_dtypes(df: pd.DataFrame, float_rtol: float = 1e-6) -> Dict[str, str]:
+    """
+    Her sütun için kayıpsız (veya yeterince kayıpsız) en küçük veri tipini belirle.
+    
+    - İsmi ikili gösterge olan ve sadece 0/1 içeren sütunlar → uint8
+    - Tamsayı değerli sütunlar, |x| < 2^24 ise → float32 (tam temsil)
+    - Diğer sayısal sütunlar, her değer için göreli hata float_rtol altındaysa
+      veya CSV'deki ondalık değer float32'den aynen geri elde edilebiliyorsa
+      (örn. 0.1, 3.25, 0.5333333) → float32
+    - Geri kalanlar → orijinal tip
+    
+    float32 yuvarlama hatası en fazla 2^-24 ≈ 6e-8 (göreli) olduğundan
+    float_rtol >= 6e-8 (varsayılan 1e-6 dahil) sonlu değerlerde her zaman
+    sağlanır; bu durumda kontrol sadece float32 aralığı dışındaki (taşan
+    veya alt taşan) değerleri yakalar. float_rtol=0 ile sadece CSV'deki
+    ondalık hassasiyeti (en fazla ~7 anlamlı basamak) float32'de korunan
+    sütunlar float32 olur.
+    
+    Args:
+        df: Veri kümesi (veya bir parçası)
+        float_rtol: float32 için kabul edilen maksimum göreli hata
+    
+    Returns:
+        Dict[str, str]: {sütun adı: veri tipi}
+    """
+    dtypes = {}
+    
+    for column in df.columns:
+        values = df[column].to_numpy()
+        
+        if not np.issubdtype(values.dtype, np.number):
+            dtypes[column] = str(values.dtype)
+            continue
+        
+        if is_binary_column(column) and np.isin(values, (0, 1)).all():
+            dtypes[column] = 'uint8'
+            continue
+        
+        values = values.astype(np.float64)
+        finite = values[np.isfinite(values)]
+        
+        if np.all(finite == np.round(finite)):
+            fits = finite.size == 0 or np.abs(finite).max() < FLOAT32_MAX_EXACT_INT
+        else:
+            with np.errstate(over='ignore'):
+                downcast = finite.astype(np.float32)
+            lossy = np.abs(downcast.astype(np.float64) - finite) > float_rtol * np.abs(finite)
+            # Toleransı aşan değerler, ondalık gösterimleri float32'nin en kısa
+            # gösteriminden aynen okunabiliyorsa kayıpsız kabul edilir
+            fits = not lossy.any() or _is_decimal_roundtrip(finite[lossy], downcast[lossy])
+        
+        dtypes[column] = 'float32' if fits else 'float64'
+    
+    return dtypes
+
+
+def merge_dtypes(first: Dict[str, str], second: Dict[str, str]) -> Dict[str, str]:
+    """
+    İki parçadan elde edilen veri tipi şemalarını birleştir.
+    
+    Bir sütun her iki parçada da aynı tipe sahipse o tip korunur; aksi
+    halde iki tipi de kayıpsız temsil eden ortak tip seçilir.
+    
+    Args:
+        first: Birinci şema
+        second: İkinci şema
+    
+    Returns:
+        Dict[str, str]: Birleştirilmiş şema
+    """
+    merged = dict(first)
+    
+    for column, dtype in second.items():
+        if column not in merged or merged[column] == dtype:
+            merged[column] = dtype
+            continue
+        
+        # Örn. uint8 + float32 → float32, float32 + float64 → float64
+        merged[column] = str(np.result_type(np.dtype(merged[column]), np.dtype(dtype)))
+    
+    return merged
+
+
+def compact_dtypes(df: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Veri kümesinin sütunlarını küçültülmüş veri tiplerine dönüştür.
+    
+    Args:
+        df: Veri kümesi
+        dtypes: Uygulanacak şema (None ise infer_compact_dtypes ile belirlenir)
+    
+    Returns:
+        pd.DataFrame: Dönüştürülmüş veri kümesi
+    """
+    if dtypes is None:
+        dtypes = infer_compact_dtypes(df)
+    
+    return df.astype({c: t for c, t in dtypes.items() if c in df.columns})
+
+
+def preprocess_dataset_file(
+    input_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    threshold: int = THRESHOLD,
+    chunksize: int = 50_000,
+    float_rtol: float = 1e-6
+) -> Dict:
+    """
+    Ham veri kümesini parça parça ön işle ve işlenmiş CSV'yi yaz.
+    
+    Bellekte aynı anda en fazla bir parça tutulur. İşlenmiş CSV ile birlikte
+    tüm parçalar üzerinden birleştirilmiş veri tipi şeması da kaydedilir.
+    
+    Args:
+        input_path: Ham veri kümesi yolu (default: dataset_files/dataset.csv)
+        output_path: Çıktı yolu (default: dataset_files/processed_dataset.csv)
+        threshold: Popülerlik eşik değeri
+        chunksize: Bir parçadaki satır sayısı
+        float_rtol: float32 için kabul edilen maksimum göreli hata
+    
+    Returns:
+        Dict: İşlem özeti
+            - 'output_path': İşlenmiş CSV yolu
+            - 'dtypes_path': Veri tipi şeması yolu
+            - 'n_rows': Toplam satır sayısı
+            - 'n_columns': Sütun sayısı (hedef dahil)
+            - 'class_counts': {0: ..., 1: ...}
+            - 'dtypes': Veri tipi şeması
+    """
+    dataset_dir = get_dataset_dir()
+    if input_path is None:
+        input_path = os.path.join(dataset_dir, "dataset.csv")
+    if output_path is None:
+        output_path = os.path.join(dataset_dir, "processed_dataset.csv")
+    
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Veri kümesi bulunamadı: {input_path}")
+    
+    dtypes = {}
+    columns: List[str] = []
+    n_rows = 0
+    class_counts = {0: 0, 1: 0}
+    
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+            processed = preprocess_chunk(chunk, threshold=threshold)
+            
+            # Çıktı metni, tek seferde işlenmiş CSV ile birebir aynıdır
+            processed.to_csv(f, header=(i == 0), index=False)
+            
+            dtypes = merge_dtypes(dtypes, infer_compact_dtypes(processed, float_rtol))
+            columns = list(processed.columns)
+            n_rows += len(processed)
+            class_counts[1] += int(processed[TARGET_COLUMN].sum())
+    
+    class_counts[0] = n_rows - class_counts[1]
+    
+    # Şemayı sütun sırasıyla kaydet
+    dtypes = {c: dtypes[c] for c in columns}
+    dtypes_path = get_dtypes_path(output_path)
+    with open(dtypes_path, 'w', encoding='utf-8') as f:
+        json.dump(dtypes, f, indent=2)
+    
+    print(f"İşlenmiş veri kümesi kaydedildi: {output_path}")
+    print(f"Boyut: ({n_rows}, {len(columns)})")
+    print(f"Veri tipi şeması kaydedildi: {dtypes_path}")
+    
+    return {
+        'output_path': output_path,
+        'dtypes_path': dtypes_path,
+        'n_rows': n_rows,
+        'n_columns': len(columns),
+        'class_counts': class_counts,
+        'dtypes': dtypes
+    }
+
+
+def load_compact_dataset(csv_path: str, chunksize: int = 50_000) -> pd.DataFrame:
+    """
+    İşlenmiş veri kümesini veri tipi şemasıyla parça parça oku.
+    
+    Her parça okunurken doğrudan küçültülmüş tiplere dönüştürülür; böylece
+    bellekte hiçbir zaman tam boyutlu float64 kopya oluşmaz.
+    
+    Args:
+        csv_path: İşlenmiş CSV yolu
+        chunksize: Bir parçadaki satır sayısı
+    
+    Returns:
+        pd.DataFrame: Küçültülmüş veri tipleriyle veri kümesi
+    """
+    dtypes_path = get_dtypes_path(csv_path)
+    dtypes = None
+    
+    if os.path.exists(dtypes_path):
+        with open(dtypes_path, 'r', encoding='utf-8') as f:
+            dtypes = json.load(f)
+    
+    # Ondalıklı sütunlar doğrudan float32 olarak ayrıştırılır; ikili sütunlar
+    # CSV'de "1.0" biçiminde olabileceği için parça okunduktan sonra dönüştürülür
+    float_dtypes = None
+    if dtypes is not None:
+        float_dtypes = {c: t for c, t in dtypes.items() if t.startswith('float')}
+    
+    chunks = [
+        compact_dtypes(chunk, dtypes)
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=float_dtypes)
+    ]
+    
+    return pd.concat(chunks, ignore_index=True)
+
+
+def get_memory_usage(df: pd.DataFrame) -> float:
+    """
+    Veri kümesinin bellekteki boyutunu MB olarak döndür.
+    
+    Args:
+        df: Veri kümesi
+    
+    Returns:
+        float: Bellek kullanımı (MB)
+    """
+    return df.memory_usage(index=False, deep=True).sum() / (1024 ** 2)
+
+
+def main() -> None:
+    """
+    Komut satırından ön işlemeyi çalıştır.
+    """
+    parser = argparse.ArgumentParser(description="Online News Popularity veri ön işleme")
+    parser.add_argument('--input', default=None, help="Ham veri kümesi (default: dataset_files/dataset.csv)")
+    parser.add_argument('--output', default=None, help="Çıktı (default: dataset_files/processed_dataset.csv)")
+    parser.add_argument('--threshold', type=int, default=THRESHOLD, help="Popülerlik eşik değeri")
+    parser.add_argument('--chunksize', type=int, default=50_000, help="Parça başına satır sayısı")
+    parser.add_argument('--float-rtol', type=float, default=1e-6,
+                        help="float32 için göreli hata toleransı (0: CSV'deki ondalık değerler aynen korunmalı)")
+    args = parser.parse_args()
+    
+    summary = preprocess_dataset_file(
+        input_path=args.input,
+        output_path=args.output,
+        threshold=args.threshold,
+        chunksize=args.chunksize,
+        float_rtol=args.float_rtol
+    )
+    
+    print(f"Sınıf 0: {summary['class_counts'][0]} örnek")
+    print(f"Sınıf 1: {summary['class_counts'][1]} örnek")
+
+
+if __name__ == "__main__":
+    main()
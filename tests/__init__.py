@@ -0,0 +1,5 @@
+"""
+Tests Package
+=============
+Yardımcı modüllerin sklearn / scipy referanslarıyla karşılaştırma testleri.
+"""
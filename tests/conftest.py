@@ -0,0 +1,17 @@
+"""
+Test yapılandırması: modül klasörlerini import yoluna ekler.
+
+evaluate_performance modülleri `helpers` paketi, feature_selection ve
+preprocess_dataset modülleri ise notebook'lardaki gibi doğrudan import edilir.
+"""
+
+import os
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for folder in ('evaluate_performance', 'feature_selection', 'preprocess_dataset'):
+    path = os.path.join(ROOT_DIR, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
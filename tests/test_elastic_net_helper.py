@@ -0,0 +1,53 @@
+"""
+elastic_net_helper düzenlileştirme yolunun sklearn LogisticRegression ile karşılaştırması.
+"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+from elastic_net_helper import compute_elastic_net_path
+
+
+@pytest.fixture
+def data():
+    X, y = make_classification(n_samples=600, n_features=10, n_informative=4, random_state=0)
+    return (X - X.mean(axis=0)) / X.std(axis=0), y
+
+
+@pytest.fixture
+def correlated_data():
+    # Birbirine çok yakın sütunlar: koordinat inişinin en yavaş yakınsadığı durum
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(2000, 6))
+    X = np.hstack([base, base @ rng.normal(size=(6, 10)) * 0.3 + 0.05 * rng.normal(size=(2000, 10))])
+    y = (X[:, :3].sum(axis=1) > rng.logistic(size=2000)).astype(int)
+    return (X - X.mean(axis=0)) / X.std(axis=0), y
+
+
+@pytest.mark.parametrize('l1_ratio', [1.0, 0.5])
+def test_path_matches_sklearn(data, l1_ratio):
+    X, y = data
+    path = compute_elastic_net_path(
+        X, y, l1_ratio=l1_ratio, n_lambdas=20, lambda_min_ratio=1e-3, tol=1e-10, verbose=False
+    )
+    
+    for k in (3, 10, 19):
+        model = LogisticRegression(
+            C=path['C_values'][k], l1_ratio=l1_ratio, solver='saga', tol=1e-12, max_iter=100000
+        )
+        model.fit(X, y)
+        
+        np.testing.assert_allclose(path['coefs'][k], model.coef_[0], atol=1e-6)
+        assert path['intercepts'][k] == pytest.approx(model.intercept_[0], abs=1e-6)
+        np.testing.assert_array_equal(path['coefs'][k] != 0, model.coef_[0] != 0)
+
+
+def test_screening_matches_full_solve(correlated_data):
+    X, y = correlated_data
+    screened = compute_elastic_net_path(X, y, n_lambdas=30, tol=1e-10, verbose=False)
+    full = compute_elastic_net_path(X, y, n_lambdas=30, tol=1e-10, screening=False, verbose=False)
+    
+    np.testing.assert_allclose(screened['coefs'], full['coefs'], atol=1e-6)
+    assert screened['entry_order'] == full['entry_order']
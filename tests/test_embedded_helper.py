@@ -0,0 +1,38 @@
+"""
+embedded_helper histogram gradient boosting önemlerinin scikit-learn'ün özel ağaç yapısına bağımlılığı.
+"""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from embedded_helper import HIST_GRADIENT_BOOSTING_NODE_FIELDS, get_hist_gradient_boosting_importances
+
+
+@pytest.fixture(scope='module')
+def fitted_model():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 8))
+    y = (X[:, 2] + 0.3 * rng.normal(size=2000) > 0).astype(int)
+    model = HistGradientBoostingClassifier(max_iter=20, max_depth=3, random_state=0)
+    return model.fit(X, y)
+
+
+def test_private_tree_structure_has_node_fields(fitted_model):
+    # scikit-learn sürüm yükseltmesi bu yapıyı değiştirirse burada yakalanır
+    predictor = fitted_model._predictors[0][0]
+    assert set(HIST_GRADIENT_BOOSTING_NODE_FIELDS) <= set(predictor.nodes.dtype.names)
+
+
+def test_importances_concentrate_on_informative_feature(fitted_model):
+    importances = get_hist_gradient_boosting_importances(fitted_model)
+    
+    assert importances.shape == (8,)
+    assert importances.sum() == pytest.approx(1.0)
+    assert np.argmax(importances) == 2
+    assert importances[2] > 0.9
+
+
+def test_unsupported_model_raises_clear_error():
+    with pytest.raises(RuntimeError, match='_predictors'):
+        get_hist_gradient_boosting_importances(HistGradientBoostingClassifier())
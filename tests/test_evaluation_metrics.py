@@ -0,0 +1,192 @@
+"""
+evaluation_metrics metrik çekirdeğinin ve eşik taramasının sklearn ile karşılaştırması.
+"""
+
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    confusion_matrix,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score
+)
+
+from helpers.evaluation_metrics import (
+    AVERAGES,
+    calculate_bootstrap_metrics,
+    calculate_metrics,
+    calculate_metrics_from_counts,
+    calculate_threshold_metrics,
+    compute_confusion_counts,
+    create_confusion_matrix,
+    create_metrics_accumulator,
+    update_metrics_accumulator
+)
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=500)
+    # Fold x yöntem tahminleri; bir satır hep negatif (sıfır payda durumu)
+    y_pred = rng.integers(0, 2, size=(3, 4, 500))
+    y_pred[0, 0] = 0
+    return y_true, y_pred
+
+
+def test_confusion_counts_match_sklearn(labels):
+    y_true, y_pred = labels
+    counts = compute_confusion_counts(y_true, y_pred)
+    
+    assert counts.shape == (3, 4, 2, 2)
+    for index in np.ndindex(3, 4):
+        np.testing.assert_array_equal(counts[index], confusion_matrix(y_true, y_pred[index], labels=[0, 1]))
+
+
+def test_string_labels_match_sklearn():
+    y_true = np.array(['hayır', 'evet', 'evet', 'hayır', 'evet'])
+    y_pred = np.array(['evet', 'evet', 'hayır', 'hayır', 'evet'])
+    
+    np.testing.assert_array_equal(compute_confusion_counts(y_true, y_pred), confusion_matrix(y_true, y_pred))
+
+
+def test_unknown_labels_raise():
+    accumulator = create_metrics_accumulator((0, 1))
+    
+    with pytest.raises(ValueError, match="Gerçek değerler"):
+        update_metrics_accumulator(accumulator, [0, 2, 1], [0, 1, 1])
+    with pytest.raises(ValueError, match="Tahminler"):
+        update_metrics_accumulator(accumulator, [0, 1, 1], [0, 2, 1])
+    np.testing.assert_array_equal(accumulator['counts'], 0)
+
+
+@pytest.mark.parametrize('average', AVERAGES)
+def test_batched_metrics_match_sklearn(labels, average):
+    y_true, y_pred = labels
+    scores = calculate_metrics_from_counts(compute_confusion_counts(y_true, y_pred), average=average)
+    
+    for index in np.ndindex(3, 4):
+        expected = {
+            'accuracy': accuracy_score(y_true, y_pred[index]),
+            'f1_score': f1_score(y_true, y_pred[index], average=average, zero_division=0),
+            'precision': precision_score(y_true, y_pred[index], average=average, zero_division=0),
+            'recall': recall_score(y_true, y_pred[index], average=average, zero_division=0)
+        }
+        for key, value in expected.items():
+            assert scores[key][index] == pytest.approx(value, abs=1e-12), key
+
+
+@pytest.mark.parametrize('label', [0, 1])
+@pytest.mark.parametrize('average', AVERAGES)
+def test_single_class_matches_sklearn(label, average):
+    # Tek sınıf: hepsi 0 ise TN, hepsi 1 ise TP hücresine düşmeli
+    y_true = np.full(10, label)
+    y_pred = np.array([label] * 7 + [1 - label] * 3)
+    
+    for y in (y_true, y_pred):
+        np.testing.assert_array_equal(create_confusion_matrix(y_true, y), confusion_matrix(y_true, y, labels=[0, 1]))
+        metrics = calculate_metrics(y_true, y, average=average)
+        expected = {
+            'accuracy': accuracy_score(y_true, y),
+            'f1_score': f1_score(y_true, y, average=average, zero_division=0),
+            'precision': precision_score(y_true, y, average=average, zero_division=0),
+            'recall': recall_score(y_true, y, average=average, zero_division=0)
+        }
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value, abs=1e-12), key
+
+
+def test_calculate_metrics_returns_floats(labels):
+    y_true, y_pred = labels
+    metrics = calculate_metrics(y_true, y_pred[1, 2])
+    
+    assert isinstance(metrics['f1_score'], float)
+    assert metrics['f1_score'] == pytest.approx(f1_score(y_true, y_pred[1, 2], average='weighted'))
+
+
+@pytest.fixture
+def tied_scores():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, size=400)
+    # Bir ondalığa yuvarlanan skorlar: çok sayıda eşitlik grubu
+    y_score = np.round(np.clip(0.3 * y_true + rng.random(400) * 0.7, 0, 1), 1)
+    return y_true, y_score
+
+
+def test_threshold_areas_match_sklearn_with_ties(tied_scores):
+    y_true, y_score = tied_scores
+    metrics = calculate_threshold_metrics(y_true, y_score)
+    
+    assert len(np.unique(y_score)) < 15
+    assert metrics['roc_auc'] == pytest.approx(roc_auc_score(y_true, y_score), abs=1e-12)
+    assert metrics['pr_auc'] == pytest.approx(average_precision_score(y_true, y_score), abs=1e-12)
+
+
+def test_best_thresholds_match_exhaustive_search(tied_scores):
+    y_true, y_score = tied_scores
+    metrics = calculate_threshold_metrics(y_true, y_score)
+    
+    # Eşitlikte en yüksek eşik seçilir: eşikler büyükten küçüğe taranır
+    thresholds = np.unique(y_score)[::-1]
+    f1 = [f1_score(y_true, y_score >= t) for t in thresholds]
+    accuracy = [accuracy_score(y_true, y_score >= t) for t in thresholds]
+    
+    assert metrics['best_f1'] == pytest.approx(max(f1))
+    assert metrics['best_f1_threshold'] == thresholds[int(np.argmax(f1))]
+    assert metrics['best_accuracy'] == pytest.approx(max(accuracy))
+    assert metrics['best_accuracy_threshold'] == thresholds[int(np.argmax(accuracy))]
+
+
+def test_batched_threshold_metrics_match_sklearn(tied_scores):
+    y_true, y_score = tied_scores
+    batch = np.stack([y_score, 1.0 - y_score, np.round(y_score * 3) / 3])
+    metrics = calculate_threshold_metrics(y_true, batch)
+    
+    for i, scores in enumerate(batch):
+        assert metrics['roc_auc'][i] == pytest.approx(roc_auc_score(y_true, scores), abs=1e-12)
+        assert metrics['pr_auc'][i] == pytest.approx(average_precision_score(y_true, scores), abs=1e-12)
+
+
+@pytest.fixture
+def many_methods():
+    rng = np.random.default_rng(2)
+    y_true = rng.integers(0, 2, size=1000)
+    # 16 yöntem: desen sayısı n'e yaklaşır
+    y_pred = np.where(rng.random((16, 1000)) < 0.7, y_true, 1 - y_true)
+    return y_true, y_pred
+
+
+def test_bootstrap_falls_back_to_index_resampling(monkeypatch, many_methods):
+    import helpers.evaluation_metrics as evaluation_metrics
+    y_true, y_pred = many_methods
+    
+    # Küçük parça sınırı: B örnekleri birden fazla parçada işlenir
+    monkeypatch.setattr(evaluation_metrics, 'BOOTSTRAP_CHUNK_ELEMENTS', 50_000)
+    bootstrap = calculate_bootstrap_metrics(y_true, y_pred, n_resamples=2000)
+    
+    assert bootstrap['samples']['accuracy'].shape == (2000, 16)
+    for i in range(16):
+        assert bootstrap['accuracy']['estimate'][i] == pytest.approx(accuracy_score(y_true, y_pred[i]))
+        assert bootstrap['accuracy']['lower'][i] < bootstrap['accuracy']['estimate'][i] < bootstrap['accuracy']['upper'][i]
+    
+    # İadeli seçimde accuracy standart hatası ≈ sqrt(p (1 - p) / n)
+    accuracy = np.mean(y_pred == y_true, axis=1)
+    expected_std = np.sqrt(accuracy * (1 - accuracy) / len(y_true))
+    np.testing.assert_allclose(bootstrap['accuracy']['std'], expected_std, rtol=0.1)
+
+
+def test_bootstrap_paths_agree(monkeypatch, labels):
+    import helpers.evaluation_metrics as evaluation_metrics
+    y_true, y_pred = labels
+    y_pred = y_pred[0]
+    
+    patterns = calculate_bootstrap_metrics(y_true, y_pred, n_resamples=4000)
+    monkeypatch.setattr(evaluation_metrics, 'BOOTSTRAP_PATTERN_RATIO', 10 ** 9)
+    indices = calculate_bootstrap_metrics(y_true, y_pred, n_resamples=4000)
+    
+    for metric in ('accuracy', 'f1_score'):
+        np.testing.assert_allclose(patterns[metric]['estimate'], indices[metric]['estimate'])
+        np.testing.assert_allclose(patterns[metric]['std'], indices[metric]['std'], rtol=0.1)
@@ -0,0 +1,48 @@
+"""
+Çıkarım dosyası olasılıklarının sklearn predict_proba ile karşılaştırması.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from helpers.inference_artifact import (
+    export_inference_artifact,
+    load_inference_artifact,
+    predict_proba_with_artifact
+)
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    X, y = make_classification(n_samples=500, n_features=6, random_state=0)
+    scaler = StandardScaler().fit(X)
+    model = LogisticRegression().fit(scaler.transform(X), y)
+    
+    path = export_inference_artifact(model, scaler, str(tmp_path / 'model.lrmodel'),
+                                     feature_names=[f'f{i}' for i in range(6)])
+    return load_inference_artifact(path), model, scaler, X
+
+
+def test_probabilities_match_sklearn(artifact):
+    artifact, model, scaler, X = artifact
+    expected = model.predict_proba(scaler.transform(X))[:, 1]
+    
+    np.testing.assert_allclose(predict_proba_with_artifact(artifact, X), expected, atol=1e-5)
+
+
+def test_extreme_logits_do_not_overflow(artifact):
+    artifact, _, _, X = artifact
+    # Katsayılar yönünde büyük değerler: float32 logitler ±1e6 mertebesinde
+    direction = np.sign(np.asarray(artifact['weights']))
+    X_extreme = np.stack([direction, -direction]).astype(np.float32) * 1e5
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        probabilities = predict_proba_with_artifact(artifact, X_extreme)
+    
+    np.testing.assert_array_equal(probabilities, [1.0, 0.0])
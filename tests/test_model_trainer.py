@@ -0,0 +1,91 @@
+"""
+model_trainer toplu Newton çözücüsünün sklearn LogisticRegression ile karşılaştırması.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import LogisticRegression
+
+from helpers.model_trainer import create_cv_context, fit_cv_grid_newton, fit_logistic_newton
+
+
+C_VALUES = [0.01, 1.0, 100.0]
+
+
+@pytest.fixture
+def data():
+    X, y = make_classification(n_samples=2000, n_features=12, n_informative=6, random_state=0)
+    return (X - X.mean(axis=0)) / X.std(axis=0), y
+
+
+def fit_sklearn(X, y, C):
+    model = LogisticRegression(C=C, tol=1e-10, max_iter=10000, solver='newton-cg')
+    model.fit(X, y)
+    return model.coef_[0], model.intercept_[0]
+
+
+def test_newton_matches_sklearn(data):
+    X, y = data
+    coef, intercept, n_iter = fit_logistic_newton(X, y, C_VALUES)
+    
+    assert coef.shape == (len(C_VALUES), X.shape[1])
+    assert np.all(n_iter > 0)
+    
+    for i, C in enumerate(C_VALUES):
+        expected_coef, expected_intercept = fit_sklearn(X, y, C)
+        np.testing.assert_allclose(coef[i], expected_coef, atol=1e-5)
+        np.testing.assert_allclose(intercept[i], expected_intercept, atol=1e-5)
+
+
+def test_newton_weights_and_penalty_scale_match_sklearn(data):
+    X, y = data
+    rng = np.random.default_rng(0)
+    masks = (rng.random((2, len(y))) > 0.3).astype(float)
+    penalty_scale = rng.uniform(0.5, 2.0, (2, X.shape[1]))
+    
+    # hessian_rows < n: alt örneklemli Hessian aynı çözüme yakınsamalı
+    coef, intercept, _ = fit_logistic_newton(
+        X, y, C_VALUES, sample_weight=masks, penalty_scale=penalty_scale, hessian_rows=500
+    )
+    assert coef.shape == (2, len(C_VALUES), X.shape[1])
+    
+    for g in range(2):
+        selected = masks[g] > 0
+        # 0.5 * Σ s * v^2 cezası, özellikler sqrt(s) ile bölünerek standart L2'ye dönüşür
+        root = np.sqrt(penalty_scale[g])
+        for i, C in enumerate(C_VALUES):
+            expected_coef, expected_intercept = fit_sklearn(X[selected] / root, y[selected], C)
+            np.testing.assert_allclose(coef[g, i], expected_coef / root, atol=1e-5)
+            np.testing.assert_allclose(intercept[g, i], expected_intercept, atol=1e-5)
+
+
+def test_newton_warns_when_not_converged(data):
+    X, y = data
+    
+    with pytest.warns(ConvergenceWarning):
+        fit_logistic_newton(X, y, C_VALUES, max_iter=2)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', ConvergenceWarning)
+        fit_logistic_newton(X, y, C_VALUES)
+
+
+@pytest.mark.parametrize('scaling', ['global', 'fold'])
+def test_cv_grid_newton_matches_per_fold_fits(data, scaling):
+    X, y = data
+    X = X * np.linspace(1.0, 50.0, X.shape[1]) + 3.0
+    cv_context = create_cv_context(X, y, cv=5, scaling=scaling)
+    
+    _, val_scores = fit_cv_grid_newton(cv_context, C_VALUES)
+    
+    for f, fold in enumerate(cv_context['folds']):
+        coef, intercept, _ = fit_logistic_newton(fold['X_train'], fold['y_train'], C_VALUES)
+        val_pred = fold['X_val'] @ coef.T + intercept > 0
+        expected = np.mean(val_pred == fold['y_val'][:, None], axis=0)
+        
+        # Tek fold'daki çözümler ~1e-8 içinde aynıdır; en fazla bir örnek farklı olabilir
+        np.testing.assert_allclose(val_scores[:, f], expected, atol=1.0 / len(fold['y_val']))
@@ -0,0 +1,48 @@
+"""
+Klasörler arasında kopyalanan yardımcı modüllerin eşitliği.
+
+feature_selection ve evaluate_performance notebook'ları kendi klasörlerinden
+çalıştığı için bazı modüllerin iki kopyası vardır. Modül docstring'i
+dışındaki kod (AST) aynı kalmalıdır.
+"""
+
+import ast
+import os
+
+import pytest
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IDENTICAL_COPIES = [
+    ('feature_selection/shared_arrays.py', 'evaluate_performance/helpers/shared_arrays.py'),
+    ('feature_selection/cache_helper.py', 'evaluate_performance/helpers/dataset_cache.py')
+]
+
+# (tam modül, alt küme kopyası): kopyadaki her tanım tam modülde aynen bulunmalı
+SUBSET_COPIES = [
+    ('feature_selection/sufficient_stats.py', 'evaluate_performance/helpers/sufficient_stats.py')
+]
+
+
+def get_definitions(path):
+    with open(os.path.join(ROOT_DIR, path), encoding='utf-8') as f:
+        body = ast.parse(f.read()).body
+    
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    
+    return [ast.dump(node) for node in body]
+
+
+@pytest.mark.parametrize('path_a, path_b', IDENTICAL_COPIES)
+def test_copies_are_identical(path_a, path_b):
+    assert get_definitions(path_a) == get_definitions(path_b)
+
+
+@pytest.mark.parametrize('full_path, subset_path', SUBSET_COPIES)
+def test_subset_copy_matches_full_module(full_path, subset_path):
+    full = get_definitions(full_path)
+    missing = [definition for definition in get_definitions(subset_path) if definition not in full]
+    
+    assert not missing, f"{subset_path} tanımları {full_path} ile ayrışmış"
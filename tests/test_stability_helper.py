@@ -0,0 +1,53 @@
+"""
+stability_helper birleşik sıklık sıralamasında eşitlik bozma kuralı.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+
+from stability_helper import run_stability_selection
+
+
+@pytest.fixture(scope='module')
+def stability_results():
+    # Bu seed'de birleşik sıklığı eşit özellikler vardır; yöntem sıklıklarının
+    # kayan nokta ortalaması bu eşitliği bozup ortalama sıra anahtarını atlatıyordu
+    X, y = make_classification(n_samples=200, n_features=12, n_informative=3, random_state=4)
+    X = pd.DataFrame(X, columns=[f'f{i}' for i in range(12)])
+    return run_stability_selection(
+        X, y,
+        methods=('pearson', 'rfe', 'random_forest'),
+        n_resamples=6,
+        top_n=4,
+        method_params={'random_forest': {'n_estimators': 10}},
+        executor='serial',
+        random_state=4
+    )
+
+
+def get_selection_counts(stability_results):
+    counts = sum((ranks <= 4).sum(axis=0) for ranks in stability_results['ranks'].values())
+    feature_index = [int(name[1:]) for name in stability_results['frequencies']['Özellik']]
+    return counts[feature_index]
+
+
+def test_combined_frequency_is_exact_count_ratio(stability_results):
+    combined = stability_results['frequencies']['Birleşik Sıklık'].to_numpy()
+    
+    np.testing.assert_array_equal(combined, get_selection_counts(stability_results) / 18)
+
+
+def test_ties_are_broken_by_mean_rank(stability_results):
+    frequencies = stability_results['frequencies']
+    counts = get_selection_counts(stability_results)
+    mean_ranks = frequencies['Ortalama Sıra'].to_numpy()
+    
+    assert np.any(counts[1:] == counts[:-1])
+    for i in range(len(frequencies) - 1):
+        assert counts[i] >= counts[i + 1]
+        if counts[i] == counts[i + 1]:
+            assert mean_ranks[i] <= mean_ranks[i + 1], (frequencies['Özellik'][i], frequencies['Özellik'][i + 1])
+    
+    np.testing.assert_array_equal(stability_results['ranking_df']['Özellik'], frequencies['Özellik'])
@@ -0,0 +1,71 @@
+"""
+Yeterli istatistiklerin (her iki paketteki kopya) StandardScaler ve doğrudan hesapla karşılaştırması.
+"""
+
+import importlib
+
+import numpy as np
+import pytest
+from sklearn.model_selection import StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+
+
+@pytest.fixture(params=['helpers.sufficient_stats', 'sufficient_stats'])
+def stats_module(request):
+    return importlib.import_module(request.param)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=[0.0, 5.0, -3.0, 1e3], scale=[1.0, 0.1, 10.0, 50.0], size=(1000, 4))
+    X[:, 0] = 2.5  # sabit sütun
+    y = (X[:, 2] + rng.normal(size=1000) > 0).astype(int)
+    return X, y
+
+
+def test_fold_train_stats_match_standard_scaler(stats_module, data):
+    X, y = data
+    total = stats_module.compute_sufficient_stats(X, y)
+    
+    skf = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    for train_idx, val_idx in skf.split(X, y):
+        train = stats_module.subtract_sufficient_stats(total, stats_module.compute_sufficient_stats(X[val_idx], y[val_idx]))
+        direct = stats_module.compute_sufficient_stats(X[train_idx], y[train_idx])
+        scaler = StandardScaler().fit(X[train_idx])
+        
+        assert train['n'] == len(train_idx)
+        for key in ('mean_x', 'm2_x', 'c_xy', 'c_xx'):
+            np.testing.assert_allclose(train[key], direct[key], rtol=1e-9, atol=1e-6)
+        
+        mean, scale = stats_module.get_scale_from_stats(train)
+        np.testing.assert_allclose(mean, scaler.mean_, rtol=1e-12)
+        np.testing.assert_allclose(scale, scaler.scale_, rtol=1e-9)
+        
+        fitted = stats_module.create_scaler_from_stats(train)
+        np.testing.assert_allclose(fitted.transform(X[val_idx]), scaler.transform(X[val_idx]), atol=1e-9)
+
+
+def test_chunked_stats_match_single_pass(stats_module, data):
+    X, y = data
+    chunked = stats_module.compute_sufficient_stats_chunked(X, y, chunksize=137)
+    single = stats_module.compute_sufficient_stats(X, y)
+    
+    for key in ('mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy', 'c_xx'):
+        np.testing.assert_allclose(chunked[key], single[key], rtol=1e-9, atol=1e-6)
+
+
+def test_standardized_gram_matches_scaled_data(stats_module, data):
+    X, y = data
+    Z = StandardScaler().fit_transform(X)
+    gram = stats_module.get_standardized_gram(stats_module.compute_sufficient_stats(X, y))
+    
+    np.testing.assert_allclose(gram, Z.T @ Z, rtol=1e-9, atol=1e-6)
+
+
+def test_subtracting_everything_raises(stats_module, data):
+    X, y = data
+    total = stats_module.compute_sufficient_stats(X, y)
+    
+    with pytest.raises(ValueError):
+        stats_module.subtract_sufficient_stats(total, total)